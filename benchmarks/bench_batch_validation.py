@@ -0,0 +1,48 @@
+"""
+Batch validation benchmark for the base identifier and creation models.
+
+Compares validating rows one by one with ``Model(**row)`` against
+``validate_many`` at 10k, 100k and 1M rows.
+
+Run with ``python -m benchmarks.bench_batch_validation``.
+"""
+
+import time
+import uuid
+
+from typica.base import CreationMeta, UUIDIdentifier_, validate_many
+
+
+def make_rows(size: int) -> list[dict]:
+    ids = [str(uuid.uuid4()) for _ in range(min(size, 10_000))]
+    return [
+        {
+            "_id": ids[idx % len(ids)],
+            "created_at": 1661416000000 + idx,
+            "created_by": "bench",
+        }
+        for idx in range(size)
+    ]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(sizes: tuple[int, ...] = (10_000, 100_000, 1_000_000)) -> None:
+    for model in (UUIDIdentifier_, CreationMeta):
+        for size in sizes:
+            rows = make_rows(size)
+            single = timed(lambda: [model(**row) for row in rows])
+            batch = timed(lambda: validate_many(model, rows, chunk_size=50_000))
+            print(
+                f"{model.__name__:<16} rows={size:>9,} "
+                f"single={single:.3f}s batch={batch:.3f}s "
+                f"({size / batch:,.0f} rows/s, {single / batch:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
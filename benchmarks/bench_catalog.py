@@ -0,0 +1,95 @@
+"""
+Metadata catalog of 50k ``FullMetadata``: linear scans over a list against
+the ``MetadataCatalog`` indexes and lineage graph, plus a JSON snapshot
+round trip for the warm start.
+
+Run with ``python -m benchmarks.bench_catalog``.
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from typica.catalog import MetadataCatalog
+from typica.connection import DBConnectionMeta
+from typica.metadata import FullMetadata, Schemas
+from typica.utils.enums import MedallionTypes
+
+RECORDS = 50_000
+QUERIES = 200
+COUNTRIES = ["ID", "SG", "MY", "TH", "VN", "PH"]
+CATEGORIES = [f"category-{idx}" for idx in range(100)]
+MEDALLIONS = ["bronze", "silver", "gold"]
+
+
+def records() -> list[FullMetadata]:
+    rng = random.Random(0)
+    access = DBConnectionMeta(host="db", port=5432, database="lake")
+    schemas = Schemas([{"field_name": "id", "field_type": "int"}])
+    result = []
+    for idx in range(RECORDS):
+        level = min(idx * 3 // RECORDS, 2)
+        parents = [f"m-{rng.randrange(idx)}" for _ in range(2)] if level and idx else []
+        result.append(
+            FullMetadata(
+                id=f"m-{idx}",
+                title=f"metadata {idx}",
+                source="example.com",
+                country=rng.choice(COUNTRIES),
+                year=2024,
+                range_data="2020-2024",
+                category=rng.choice(CATEGORIES),
+                schemas=schemas,
+                database_access=access,
+                table_name=f"table_{idx}",
+                medalion_type=MEDALLIONS[level],
+                parents_id=parents,
+            )
+        )
+    return result
+
+
+def scan_find(rows: list[FullMetadata], category: str) -> list[FullMetadata]:
+    return [
+        row for row in rows
+        if row.medalion_type is MedallionTypes.GOLD and row.category == category and row.country == "ID"
+    ]
+
+
+def scan_downstream(rows: list[FullMetadata], id: str) -> set[str]:
+    found, frontier = set(), {id}
+    while frontier:
+        frontier = {row.id for row in rows if frontier.intersection(row.parents_id or ())} - found
+        found |= frontier
+    return found
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    rows = records()
+    catalog = timed("build MetadataCatalog", lambda: MetadataCatalog(rows))
+
+    timed(f"scan find x{QUERIES}", lambda: [scan_find(rows, c) for c in CATEGORIES * 2])
+    timed(
+        f"catalog.find x{QUERIES}",
+        lambda: [catalog.find(medalion_type="gold", category=c, country="ID") for c in CATEGORIES * 2],
+    )
+
+    roots = [f"m-{idx}" for idx in range(0, RECORDS // 3, RECORDS // 30)][:5]
+    expected = timed("scan downstream x5", lambda: [scan_downstream(rows, root) for root in roots])
+    found = timed("catalog.downstream x5", lambda: [set(catalog.downstream(root)) for root in roots])
+    assert expected == found
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.json")
+        timed("save snapshot", lambda: catalog.save(path))
+        print(f"{'snapshot size':<28} {os.path.getsize(path) / 2**20:>10.1f} MiB")
+        loaded = timed("load snapshot", lambda: MetadataCatalog.load(path))
+        assert len(loaded) == len(catalog)
@@ -0,0 +1,74 @@
+"""
+Rows/sec of ClickHouse inserts: row lists built by hand against the
+column-oriented ``CHConnector.insert_models``.
+
+Needs a local ClickHouse, e.g. ``docker run -p 8123:8123 clickhouse/clickhouse-server``.
+The connection is read from ``TYPICA_BENCH_CH_URI``
+(default ``clickhouse://default:@localhost:8123/default``).
+
+Run with ``python -m benchmarks.bench_clickhouse_insert``.
+"""
+
+import os
+import time
+
+from datetime import datetime, timezone
+
+from typica.base import UUIDIdentifier_
+from typica.connection import DBConnectionMeta
+from typica.modules.cclickhouse import CHConnector, InsertSettings
+
+URI = os.getenv("TYPICA_BENCH_CH_URI", "clickhouse://default:@localhost:8123/default")
+
+ROWS = 1_000_000
+
+
+class Event(UUIDIdentifier_):
+    name: str
+    value: float
+    created_at: datetime
+
+
+def events() -> list[Event]:
+    now = datetime.now(timezone.utc)
+    return [Event(name=f"event-{idx % 100}", value=idx, created_at=now) for idx in range(ROWS)]
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:>8.3f}s ({ROWS / elapsed:>12,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    data = events()
+    with CHConnector(DBConnectionMeta(uri=URI)) as ch:
+        client = ch._client
+        client.command("DROP TABLE IF EXISTS bench_events")
+        client.command(
+            "CREATE TABLE bench_events (_id UUID, name String, value Float64, "
+            "created_at DateTime64(6, 'UTC')) ENGINE = MergeTree ORDER BY _id"
+        )
+
+        def rows() -> None:
+            dumped = [event.model_dump(by_alias=True) for event in data]
+            client.insert(
+                "bench_events",
+                [list(row.values()) for row in dumped],
+                column_names=["_id", "name", "value", "created_at"],
+            )
+
+        timed("model_dump rows", rows)
+        for block_size in (10_000, 100_000):
+            timed(
+                f"insert_models block={block_size}",
+                lambda: ch.insert_models("bench_events", data, block_size=block_size),
+            )
+        timed(
+            "insert_models async_insert",
+            lambda: ch.insert_models(
+                "bench_events", data, settings=InsertSettings(async_insert=True)
+            ),
+        )
+        client.command("DROP TABLE bench_events")
@@ -0,0 +1,59 @@
+"""
+Time and peak Python memory of reading a large ClickHouse result: a
+fully materialized ``query`` against the block streams of ``CHConnector``.
+
+Needs a local ClickHouse, e.g. ``docker run -p 8123:8123 clickhouse/clickhouse-server``.
+The connection is read from ``TYPICA_BENCH_CH_URI``
+(default ``clickhouse://default:@localhost:8123/default``).
+
+Run with ``python -m benchmarks.bench_clickhouse_stream``.
+"""
+
+import os
+import time
+import tracemalloc
+
+from typica.connection import DBConnectionMeta
+from typica.modules.cclickhouse import CHConnector
+
+URI = os.getenv("TYPICA_BENCH_CH_URI", "clickhouse://default:@localhost:8123/default")
+
+ROWS = 5_000_000
+QUERY = f"SELECT number AS id, toFloat64(number) / 7 AS value FROM numbers({ROWS})"
+
+
+def measured(label: str, fn) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {elapsed:>8.3f}s peak {peak / 2**20:>9.1f} MiB sum={total:,.0f}")
+
+
+if __name__ == "__main__":
+    with CHConnector(DBConnectionMeta(uri=URI)) as ch:
+        measured(
+            "query",
+            lambda: sum(row[1] for row in ch._client.query(QUERY).result_rows),
+        )
+        measured(
+            "stream_blocks",
+            lambda: sum(
+                row[1] for block in ch.stream_blocks(QUERY, block_size=65_536) for row in block
+            ),
+        )
+        measured(
+            "stream_blocks column",
+            lambda: sum(
+                sum(block[1])
+                for block in ch.stream_blocks(QUERY, block_size=65_536, columnar=True)
+            ),
+        )
+        measured(
+            "stream_numpy",
+            lambda: sum(
+                float(block[:, 1].sum()) for block in ch.stream_numpy(QUERY, block_size=65_536)
+            ),
+        )
@@ -0,0 +1,59 @@
+"""
+Identifier generation and index-locality benchmark.
+
+Measures the generation rate of uuid4, UUIDv7 and ULID, then inserts the
+keys into a B-tree primary key. SQLite (``WITHOUT ROWID`` clustered index)
+stands in for the Postgres B-tree / Mongo ``_id`` index, so the benchmark
+runs without a database server.
+
+Run with ``python -m benchmarks.bench_identifiers``.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+
+from typica.base import id_generator
+
+
+def generation_rate(name: str, fn, size: int) -> list:
+    start = time.perf_counter()
+    keys = [fn() for _ in range(size)]
+    elapsed = time.perf_counter() - start
+    print(f"generate {name:<6} {size / elapsed:>12,.0f} ids/s")
+    return keys
+
+
+def insert_rate(name: str, keys: list[bytes], batch: int = 10_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        conn.execute("PRAGMA cache_size = -8000")
+        conn.execute(
+            "CREATE TABLE items (id BLOB PRIMARY KEY, payload TEXT) WITHOUT ROWID"
+        )
+        payload = "x" * 100
+        start = time.perf_counter()
+        for offset in range(0, len(keys), batch):
+            conn.executemany(
+                "INSERT INTO items VALUES (?, ?)",
+                ((key, payload) for key in keys[offset : offset + batch]),
+            )
+            conn.commit()
+        elapsed = time.perf_counter() - start
+        conn.close()
+    print(f"insert   {name:<6} {len(keys) / elapsed:>12,.0f} rows/s")
+
+
+def main(size: int = 1_000_000) -> None:
+    v4 = generation_rate("uuid4", uuid.uuid4, size)
+    v7 = generation_rate("uuid7", id_generator.uuid7, size)
+    generation_rate("ulid", id_generator.ulid, size)
+
+    insert_rate("uuid4", [key.bytes for key in v4])
+    insert_rate("uuid7", [key.bytes for key in v7])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Cold import time of typica, measured with ``python -X importtime`` in fresh
+processes, against a regression budget per statement.
+
+``import typica`` must stay free of pydantic; the budgets of the other
+statements cover what their first use pulls in. Exits with status 1 when a
+median goes over its budget.
+
+Run with ``python -m benchmarks.bench_import``.
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+
+# ? microseconds, for the median of RUNS cold imports
+BUDGETS = {
+    "import typica": 15_000,
+    "from typica import Operator": 25_000,
+    "from typica import ServiceResponse": 400_000,
+    "from typica import ProjectConfig": 500_000,
+}
+
+
+def import_time(statement: str) -> int:
+    """
+    Return the cumulative microseconds of the imports run by a statement.
+
+    Top-level entries of the ``-X importtime`` report after ``site`` are the
+    imports of the statement itself; nested entries are already part of
+    their cumulative time.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total, started = 0, False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name == " site":
+            started = True
+        elif started and not name.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def main() -> int:
+    failed = False
+    print(f"{'statement':<36} {'median':>10} {'budget':>10}")
+    for statement, budget in BUDGETS.items():
+        median = statistics.median(import_time(statement) for _ in range(RUNS))
+        status = "ok" if median <= budget else "OVER BUDGET"
+        failed |= median > budget
+        print(f"{statement:<36} {median / 1000:>7.1f} ms {budget / 1000:>7.1f} ms  {status}")
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
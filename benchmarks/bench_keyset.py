@@ -0,0 +1,69 @@
+"""
+Page latency across page depth: OFFSET pagination against keyset cursors.
+
+SQLite with an index on (score, id) stands in for the Postgres B-tree, so
+the benchmark runs without a database server; both modes use the SQL from
+``typica.query`` in the SQLAlchemy ``:name`` parameter style.
+
+Run with ``python -m benchmarks.bench_keyset``.
+"""
+
+import random
+import sqlite3
+import time
+
+from typica.query import Cursor, compile_keyset_sql, compile_sql, encode_cursor, keyset_page
+from typica.schema import CursorPaginationSchema, OrderSchema, PaginationSchema
+
+ROWS = 2_000_000
+SIZE = 50
+SECRET = "bench"
+ORDER = OrderSchema(order_by="score", order_type="desc")
+SELECT = "SELECT id, score FROM items"
+
+
+def setup() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, score INTEGER)")
+    rng = random.Random(0)
+    conn.executemany(
+        "INSERT INTO items VALUES (?, ?)", ((i, rng.randrange(1_000_000)) for i in range(ROWS))
+    )
+    conn.execute("CREATE INDEX items_score ON items (score DESC, id DESC)")
+    return conn
+
+
+def timed(fn, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+if __name__ == "__main__":
+    conn = setup()
+    conn.row_factory = sqlite3.Row
+    print(f"{'page':>8} {'offset ms':>10} {'keyset ms':>10}")
+    for page in (1, 100, 1_000, 10_000, 39_000):
+        offset_query = compile_sql(
+            order=ORDER, pagination=PaginationSchema(page=page, size=SIZE), dialect="sqlalchemy"
+        )
+        offset_sql = offset_query.statement(SELECT).replace("DESC", 'DESC, "id" DESC')
+
+        # ? the cursor of the page is the last row of the page before it
+        last = conn.execute(
+            f"{SELECT} ORDER BY score DESC, id DESC LIMIT 1 OFFSET ?",
+            (max((page - 1) * SIZE - 1, 0),),
+        ).fetchone()
+        token = encode_cursor(Cursor("score", last["score"], last["id"], "next"), SECRET)
+        pagination = CursorPaginationSchema(cursor=token if page > 1 else None, size=SIZE)
+        keyset_query = compile_keyset_sql(pagination, SECRET, ORDER, dialect="sqlalchemy")
+        keyset_sql = keyset_query.statement(SELECT)
+
+        def keyset() -> None:
+            rows = conn.execute(keyset_sql, keyset_query.params).fetchall()
+            keyset_page(rows, pagination, SECRET, ORDER)
+
+        offset_ms = timed(lambda: conn.execute(offset_sql).fetchall())
+        keyset_ms = timed(keyset)
+        print(f"{page:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
@@ -0,0 +1,80 @@
+"""
+In-memory filtering of 1M records: a Python loop over dicts against the
+NumPy ``ColumnStore``, for the same filters, order and page.
+
+Run with ``python -m benchmarks.bench_npfilter``.
+"""
+
+import operator
+import random
+import re
+import time
+
+from typica.modules.npfilter import ColumnStore
+from typica.schema import FilterGroupSchema, FilterOpsSchema, OrderSchema, PaginationSchema
+
+ROWS = 1_000_000
+COUNTRIES = ["ID", "SG", "MY", "TH", "VN", "PH"]
+CATEGORIES = [f"category-{idx}" for idx in range(200)]
+
+
+def records() -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "id": idx,
+            "country": rng.choice(COUNTRIES),
+            "category": rng.choice(CATEGORIES),
+            "score": rng.random() * 100 if rng.random() > 0.05 else None,
+            "year": rng.randrange(2000, 2025),
+        }
+        for idx in range(ROWS)
+    ]
+
+
+def f(field, op, value):
+    return FilterOpsSchema(filter_by=field, filter_op=op, filter_value=value)
+
+
+FILTERS = FilterGroupSchema(
+    must=[f("year", "gte", 2010), f("score", "exist", True)],
+    mustnt=[f("country", "in", ["TH", "VN"])],
+    should=[f("category", "re", "-1[0-9]$"), f("score", "gt", 90)],
+)
+ORDER = OrderSchema(order_by="score", order_type="desc")
+PAGE = PaginationSchema(page=3, size=50)
+
+
+def naive(rows: list[dict]) -> list[dict]:
+    pattern = re.compile("-1[0-9]$")
+    matched = [
+        row
+        for row in rows
+        if row["year"] >= 2010
+        and row["score"] is not None
+        and row["country"] not in ("TH", "VN")
+        and (pattern.search(row["category"]) or row["score"] > 90)
+    ]
+    matched.sort(key=operator.itemgetter("score"), reverse=True)
+    return matched[100:150]
+
+
+def timed(label: str, fn, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<24} {elapsed * 1000:>10.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    rows = records()
+    start = time.perf_counter()
+    store = ColumnStore.from_records(rows)
+    print(f"{'load ColumnStore':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+    expected = timed("python loop", lambda: naive(rows))
+    page = timed("ColumnStore.query", lambda: store.query(FILTERS, ORDER, PAGE))
+    timed("ColumnStore.filter", lambda: store.filter(FILTERS))
+    assert [row["id"] for row in expected] == [row["id"] for row in store.records(page)]
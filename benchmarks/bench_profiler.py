@@ -0,0 +1,51 @@
+"""
+Throughput of the streaming profiler, in process and across a process pool.
+
+Profiles a generated table streamed in chunks, so memory stays bounded by
+the chunk size; rows/s extrapolate to larger tables.
+
+Run with ``python -m benchmarks.bench_profiler``.
+"""
+
+import os
+import random
+import resource
+import time
+
+from typica.modules.profiler import iter_chunks, profile
+
+ROWS = 2_000_000
+CHUNK = 100_000
+
+
+def rows():
+    rng = random.Random(0)
+    countries = ["ID", "SG", "MY", "TH", "VN", "PH"]
+    for idx in range(ROWS):
+        yield {
+            "id": idx,
+            "country": rng.choice(countries),
+            "category": f"category-{rng.randrange(5_000)}",
+            "score": None if idx % 17 == 0 else rng.random() * 100,
+            "year": rng.randrange(2000, 2025),
+        }
+
+
+def run(label: str, workers: int) -> None:
+    start = time.perf_counter()
+    schemas = profile(iter_chunks(rows(), CHUNK), workers=workers)
+    elapsed = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{label:<14} {elapsed:>8.2f}s {ROWS / elapsed:>12,.0f} rows/s peak RSS {rss:>7.0f} MiB")
+    return schemas
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    for _ in iter_chunks(rows(), CHUNK):
+        pass
+    print(f"{'generate only':<14} {time.perf_counter() - start:>8.2f}s")
+    run("in process", 0)
+    schemas = run(f"{os.cpu_count()} workers", os.cpu_count() or 1)
+    for meta in schemas:
+        print(f"  {meta.field_name:<10} {meta.field_type:<6} {meta.none_percentage:>6.2f}% {meta.describe_field}")
@@ -0,0 +1,64 @@
+"""
+Bulk Redis operations: one command per key against the chunked helpers.
+
+Needs a local redis-server, read from ``TYPICA_BENCH_REDIS_HOST`` /
+``TYPICA_BENCH_REDIS_PORT`` (default localhost:6379, database 15).
+
+Run with ``python -m benchmarks.bench_redis_bulk``.
+"""
+
+import asyncio
+import os
+import time
+
+from typica.connection import RedisConnectionMeta
+from typica.modules.redis import AsyncRedisConnector, RedisConnector
+
+META = RedisConnectionMeta(
+    host=os.getenv("TYPICA_BENCH_REDIS_HOST", "localhost"),
+    port=int(os.getenv("TYPICA_BENCH_REDIS_PORT", "6379")),
+    database=15,
+)
+
+
+def timed(label: str, size: int, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:>8.3f}s ({size / elapsed:>12,.0f} keys/s)")
+
+
+def run_sync(size: int, chunk_size: int) -> None:
+    data = {f"bench:{idx}": idx for idx in range(size)}
+    keys = list(data)
+    with RedisConnector(META, chunk_size=chunk_size) as redis:
+        client = redis.client
+        client.flushdb()
+
+        timed("set one by one", size, lambda: [client.set(k, v) for k, v in data.items()])
+        timed("get one by one", size, lambda: [client.get(k) for k in keys])
+        timed("mset chunked", size, lambda: redis.mset(data))
+        timed("mset chunked (ex)", size, lambda: redis.mset(data, ex=300))
+        timed("mget chunked", size, lambda: redis.mget(keys))
+        timed("expire chunked", size, lambda: redis.expire_many(keys, 300))
+        timed("delete chunked", size, lambda: redis.delete_many(keys))
+
+
+async def run_async(size: int, chunk_size: int) -> None:
+    data = {f"bench:{idx}": idx for idx in range(size)}
+    async with AsyncRedisConnector(META, chunk_size=chunk_size) as redis:
+        start = time.perf_counter()
+        await redis.mset(data, ex=300)
+        values = await redis.mget(list(data))
+        elapsed = time.perf_counter() - start
+        await redis.delete_many(list(data))
+        print(f"{'async mset+mget chunked':<28} {elapsed:>8.3f}s ({len(values):,} keys)")
+
+
+def main(size: int = 100_000, chunk_size: int = 5_000) -> None:
+    run_sync(size, chunk_size)
+    asyncio.run(run_async(size, chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Startup benchmark for ``ServiceResponse``.
+
+Simulates an application registering the same set of routes on several
+routers (and generating the OpenAPI responses twice), with and without the
+response registry.
+
+Run with ``python -m benchmarks.bench_response``.
+"""
+
+import time
+
+from pydantic import BaseModel
+
+from typica.response import ResponseRegistry, ServiceResponse
+
+
+class Item(BaseModel):
+    id: str
+    name: str
+
+
+def register_routes(registry: ResponseRegistry, routes: int, passes: int) -> float:
+    service = ServiceResponse(Item, auth=True, registry=registry)
+    start = time.perf_counter()
+    for _ in range(passes):
+        for idx in range(routes):
+            name = f"Route{idx % 50}"
+            service.get(name)
+            service.pagination(name, model=list[Item])
+            service.creation(name)
+            service.update(name)
+            service.delete(name)
+    return time.perf_counter() - start
+
+
+def main(routes: int = 300, passes: int = 2) -> None:
+    uncached = ResponseRegistry(enabled=False)
+    cached = ResponseRegistry()
+
+    cold = register_routes(uncached, routes, passes)
+    warm = register_routes(cached, routes, passes)
+    stats = cached.stats()
+
+    print(f"routes={routes} passes={passes}")
+    print(f"uncached: {cold:.3f}s ({uncached.stats().built} models built)")
+    print(f"cached:   {warm:.3f}s ({stats.built} built, {stats.reused} reused)")
+    print(f"speedup:  {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
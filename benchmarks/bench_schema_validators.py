@@ -0,0 +1,66 @@
+"""
+Validating request payloads against a ``Schemas``: building a pydantic model
+with ``create_model`` on every request against the ``SchemaCompiler`` cache,
+which compiles each schema once.
+
+Run with ``python -m benchmarks.bench_schema_validators``.
+"""
+
+import time
+
+from pydantic import create_model
+
+from typica.metadata import SchemaMeta, Schemas
+from typica.validator import SchemaCompiler, _field
+
+REQUESTS = 500
+ROWS = 20
+SCHEMAS = Schemas(
+    [
+        SchemaMeta(field_name="id", field_type="Int64", field_required=True),
+        SchemaMeta(field_name="name", field_type="String", field_alias="Name"),
+        SchemaMeta(field_name="score", field_type="Nullable(Float64)"),
+        SchemaMeta(field_name="created_at", field_type="DateTime"),
+        SchemaMeta(field_name="tags", field_type="Array(String)"),
+        SchemaMeta(field_name="token", field_type="String", field_hide=True),
+    ]
+)
+PAYLOAD = [
+    {
+        "id": idx,
+        "Name": f"row-{idx}",
+        "score": idx / 3,
+        "created_at": "2024-01-01T00:00:00",
+        "tags": ["a", "b"],
+        "token": "secret",
+    }
+    for idx in range(ROWS)
+]
+
+
+def per_request() -> None:
+    for _ in range(REQUESTS):
+        fields = dict(_field(index, meta) for index, meta in enumerate(SCHEMAS))
+        model = create_model("Row", **fields)
+        rows = [model.model_validate(row) for row in PAYLOAD]
+        [row.model_dump(by_alias=True) for row in rows]
+
+
+def compiled() -> None:
+    compiler = SchemaCompiler()
+    for _ in range(REQUESTS):
+        rows = compiler.validate(SCHEMAS, PAYLOAD)
+        compiler.dump(SCHEMAS, rows)
+
+
+def main() -> None:
+    print(f"{REQUESTS} requests of {ROWS} rows")
+    for name, run in (("create_model per request", per_request), ("compiled once", compiled)):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<26}{elapsed * 1000:>10.1f} ms{elapsed / REQUESTS * 1e6:>10.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Cache stampede on one hot key: N concurrent readers of an expired entry,
+with plain cache-aside against ``StampedeGuard``.
+
+Every worker process runs several threads, so both the in-process
+single-flight and the Redis lock are exercised. The number of backend
+calls is counted in Redis.
+
+Needs a local redis-server, read from ``TYPICA_BENCH_REDIS_HOST`` /
+``TYPICA_BENCH_REDIS_PORT`` (default localhost:6379, database 15).
+
+Run with ``python -m benchmarks.bench_stampede``.
+"""
+
+import os
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from typica.connection import RedisConnectionMeta
+from typica.modules.redis import RedisConnector
+from typica.modules.stampede import StampedeGuard
+
+META = RedisConnectionMeta(
+    host=os.getenv("TYPICA_BENCH_REDIS_HOST", "localhost"),
+    port=int(os.getenv("TYPICA_BENCH_REDIS_PORT", "6379")),
+    database=15,
+)
+
+BACKEND_SECONDS = 0.2
+PROCESSES = 4
+THREADS = 16
+
+
+def backend(redis: RedisConnector) -> dict[str, int]:
+    redis.client.incr("bench:backend_calls")
+    time.sleep(BACKEND_SECONDS)
+    return {"total": 42}
+
+
+def naive_worker(_: int) -> None:
+    def read() -> None:
+        with RedisConnector(META) as redis:
+            if redis.client.get("bench:naive") is None:
+                redis.client.set("bench:naive", backend(redis)["total"], ex=60)
+
+    threads = [threading.Thread(target=read) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def guarded_worker(_: int) -> None:
+    with RedisConnector(META) as redis:
+        guard = StampedeGuard(redis, namespace="bench:sf", ttl=60)
+
+        def read() -> None:
+            guard.get_or_compute("hot", lambda: backend(redis), dict[str, int])
+
+        threads = [threading.Thread(target=read) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+
+def run(label: str, worker) -> None:
+    with RedisConnector(META) as redis:
+        redis.client.flushdb()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(PROCESSES) as pool:
+        list(pool.map(worker, range(PROCESSES)))
+    elapsed = time.perf_counter() - start
+    with RedisConnector(META) as redis:
+        calls = int(redis.client.get("bench:backend_calls") or 0)
+    print(f"{label:<16} {PROCESSES * THREADS:>4} readers {calls:>4} backend calls {elapsed:>8.3f}s")
+
+
+if __name__ == "__main__":
+    run("cache-aside", naive_worker)
+    run("stampede guard", guarded_worker)
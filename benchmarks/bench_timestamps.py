@@ -0,0 +1,54 @@
+"""
+Timestamp normalization benchmark for ``CreationMeta``.
+
+Compares validating rows one by one against normalizing the whole
+``created_at`` column with NumPy before a batch validation. The sample
+only uses s/ms epochs and ISO strings, which the per-row validator also
+accepts; microsecond and nanosecond epochs are only handled by the
+vectorized path.
+
+Run with ``python -m benchmarks.bench_timestamps``.
+"""
+
+import time
+
+from typica.base import CreationMeta
+from typica.modules.nptime import normalize_timestamps, validate_creation_batch
+
+
+def make_rows(size: int) -> list[dict]:
+    samples = [
+        1661416000,
+        1661416000123,
+        "2022-08-08T00:00:00.123456",
+    ]
+    return [{"created_at": samples[idx % len(samples)]} for idx in range(size)]
+
+
+def main(sizes: tuple[int, ...] = (100_000, 1_000_000)) -> None:
+    for size in sizes:
+        rows = make_rows(size)
+        column = [row["created_at"] for row in rows]
+
+        start = time.perf_counter()
+        for row in rows:
+            CreationMeta(**row)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        normalize_timestamps(column)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validate_creation_batch([dict(row) for row in rows])
+        batch = time.perf_counter() - start
+
+        print(
+            f"rows={size:>9,} validator={size / single:>12,.0f} rows/s "
+            f"normalize={size / vectorized:>12,.0f} rows/s "
+            f"normalize+validate={size / batch:>12,.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
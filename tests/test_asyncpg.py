@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from typica.connection import DBConnectionMeta  # noqa: E402
+from typica.modules import asyncpg as pg  # noqa: E402
+
+META = DBConnectionMeta(host="db", port=5432, username="user", password="pass", database="app")
+
+
+class FakePool:
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def created(monkeypatch):
+    pools: list[FakePool] = []
+
+    async def create_pool(**kwargs):
+        await asyncio.sleep(0)
+        pools.append(FakePool(**kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(pg.asyncpg, "create_pool", create_pool)
+    return pools
+
+
+def test_get_pool_reuses_pool_of_same_meta(created):
+    async def run():
+        first, second = await asyncio.gather(pg.get_pool(META), pg.get_pool(META))
+        other = await pg.get_pool(META, max_size=20)
+        await pg.close_pools()
+        return first, second, other
+
+    first, second, other = asyncio.run(run())
+
+    assert first is second
+    assert other is not first
+    assert len(created) == 2
+    assert created[0].kwargs["host"] == "db" and created[1].kwargs["max_size"] == 20
+
+
+def test_get_pool_separates_loops(created):
+    async def run():
+        pool = await pg.get_pool(META)
+        await pg.close_pools()
+        return pool
+
+    assert asyncio.run(run()) is not asyncio.run(run())
+    assert len(created) == 2
+
+
+def test_close_pools_closes_only_running_loop(created):
+    async def open_pool():
+        return await pg.get_pool(META)
+
+    other_loop = asyncio.new_event_loop()
+    try:
+        other = other_loop.run_until_complete(open_pool())
+
+        async def run():
+            pool = await pg.get_pool(META)
+            await pg.close_pools()
+            return pool, asyncio.get_running_loop() in pg._pools_lock
+
+        pool, has_lock = asyncio.run(run())
+
+        assert pool.closed and not has_lock
+        assert not other.closed
+        other_loop.run_until_complete(pg.close_pools())
+        assert other.closed
+        assert other_loop not in pg._pools
+    finally:
+        other_loop.close()
@@ -0,0 +1,70 @@
+import uuid
+
+from datetime import datetime, timezone
+
+from typica.base import (
+    CreationMeta,
+    TimeOrderedIdGenerator,
+    ULIDIdentifier_,
+    UUID7Identifier,
+    UUID7Identifier_,
+    UUIDIdentifier_,
+    iter_validate_many,
+    type_adapter,
+    uuid7,
+    validate_many,
+)
+
+
+def test_validate_many_streams_chunks():
+    raw = ({"_id": str(uuid.uuid4())} for _ in range(25))
+
+    chunks = list(iter_validate_many(UUIDIdentifier_, raw, chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert all(isinstance(row.id, uuid.UUID) for chunk in chunks for row in chunk)
+
+
+def test_validate_many_reuses_adapter():
+    validate_many(CreationMeta, [{}])
+
+    assert type_adapter(list[CreationMeta]) is type_adapter(list[CreationMeta])
+
+
+def test_creation_meta_coercion():
+    rows = validate_many(
+        CreationMeta,
+        [
+            {"created_at": "2022-08-08T00:00:00+00:00"},
+            {"created_at": 1661416000},
+            {"created_at": 1661416000123},
+        ],
+    )
+
+    assert rows[0].created_at == datetime(2022, 8, 8, tzinfo=timezone.utc)
+    assert rows[1].created_at == datetime(2022, 8, 25, 8, 26, 40, tzinfo=timezone.utc)
+    assert rows[2].created_at == datetime(
+        2022, 8, 25, 8, 26, 40, 123000, tzinfo=timezone.utc
+    )
+    assert CreationMeta().created_at > rows[2].created_at
+
+
+def test_time_ordered_identifiers_are_monotonic():
+    generator = TimeOrderedIdGenerator(pool_size=8)
+
+    uuids = generator.uuid7_many(100)
+    ulids = generator.ulid_many(100)
+
+    assert uuids == sorted(uuids)
+    assert all(value.version == 7 for value in uuids)
+    assert len(set(uuids)) == 100
+    assert ulids == sorted(ulids)
+    assert all(len(value) == 26 for value in ulids)
+
+
+def test_time_ordered_identifier_models():
+    row = UUID7Identifier_(**{"_id": str(uuid7())})
+
+    assert row.id.version == 7
+    assert UUID7Identifier().id < UUID7Identifier().id
+    assert ULIDIdentifier_().id < ULIDIdentifier_().id
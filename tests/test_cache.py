@@ -0,0 +1,150 @@
+import time
+
+import pytest
+
+pytest.importorskip("redis")
+
+from pydantic import BaseModel  # noqa: E402
+from redis.exceptions import ResponseError  # noqa: E402
+
+from typica.connection import RedisConnectionMeta  # noqa: E402
+from typica.modules.cache import ResponseCache  # noqa: E402
+from typica.modules.redis import RedisConnector  # noqa: E402
+from typica.schema import OrderSchema, PaginationSchema  # noqa: E402
+from typica.utils.lru import LRUCache  # noqa: E402
+
+from .test_redis import FakeRedis  # noqa: E402
+
+
+class FakeTagRedis(FakeRedis):
+    """
+    Redis 6 semantics: EXPIRE takes no NX/GT flags, scripts run the tag Lua.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ttls: dict = {}
+        self.scripts: list[str] = []
+
+    def expire(self, key, seconds, *flags, **options):
+        if flags or options:
+            raise ResponseError("wrong number of arguments for 'expire' command")
+        if key not in self.data:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    def ttl(self, key):
+        if key not in self.data:
+            return -2
+        return self.ttls.get(key, -1)
+
+    def register_script(self, source):
+        self.scripts.append(source)
+
+        def script(keys, args, client):
+            # ? queued on the pipeline like EVALSHA, run by add_tags below
+            return client.add_tags(keys, args)
+
+        return script
+
+    def add_tags(self, keys, args):
+        (key,), (member, ttl) = keys, args
+        self.sadd(key, member)
+        if self.ttl(key) < ttl:
+            self.expire(key, ttl)
+        return 1
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def sunion(self, keys):
+        return set().union(*(self.data.get(key, set()) for key in keys))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.ttls.pop(key, None)
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class Page(BaseModel):
+    items: list[int]
+    page: int
+
+
+def make_cache(**kwargs) -> tuple[ResponseCache, FakeTagRedis]:
+    connector = RedisConnector(RedisConnectionMeta(database=0))
+    server = FakeTagRedis()
+    connector._client = server  # type: ignore[assignment]
+    return ResponseCache(connector, **kwargs), server
+
+
+def test_lru_cache_evicts_and_expires():
+    cache: LRUCache[int] = LRUCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_cached_endpoint_uses_both_tiers():
+    cache, server = make_cache()
+    calls = []
+
+    @cache.cached("items", Page, tags=["items"])
+    def list_items(pagination: PaginationSchema, order: OrderSchema) -> Page:
+        calls.append(pagination.page)
+        return Page(items=[1, 2], page=pagination.page or 1)
+
+    first = list_items(PaginationSchema(page=2), OrderSchema(order_by="id"))
+    again = list_items(PaginationSchema(page=2), OrderSchema(order_by="id"))
+    cache.local.clear()
+    from_redis = list_items(PaginationSchema(page=2), OrderSchema(order_by="id"))
+    list_items(PaginationSchema(page=3), OrderSchema(order_by="id"))
+
+    assert calls == [2, 3]
+    assert again is first
+    assert from_redis == first
+    assert any(isinstance(value, bytes) for value in server.data.values())
+    stats = cache.stats()
+    assert (stats.local_hits, stats.redis_hits, stats.misses) == (1, 1, 2)
+
+
+def test_tag_invalidation_clears_both_tiers():
+    cache, server = make_cache()
+    calls = []
+
+    @cache.cached("items", Page, tags=["items"])
+    def list_items(page: int) -> Page:
+        calls.append(page)
+        return Page(items=[], page=page)
+
+    list_items(1)
+    list_items(2)
+    assert cache.invalidate("items") == 2
+    list_items(1)
+
+    assert calls == [1, 2, 1]
+    assert cache.stats().invalidated == 2
+
+
+def test_tag_ttl_is_only_extended():
+    cache, server = make_cache(ttl=60)
+    page = Page(items=[], page=1)
+
+    cache.set("long", page, Page, tags=["items"], ttl=600)
+    cache.set("short", page, Page, tags=["items"])
+    assert server.ttls[cache._tag_key("items")] == 600
+
+    cache.set("longer", page, Page, tags=["items"], ttl=900)
+    assert server.ttls[cache._tag_key("items")] == 900
+    assert server.data[cache._tag_key("items")] == {"long", "short", "longer"}
+    assert len(server.scripts) == 1
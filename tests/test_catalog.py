@@ -0,0 +1,74 @@
+import pytest
+
+from typica.catalog import MetadataCatalog
+from typica.connection import DBConnectionMeta
+from typica.metadata import FullMetadata, Schemas
+from typica.utils.enums import LocationLevel, MedallionTypes
+
+
+def metadata(id, medalion="bronze", country="ID", category="economy", parents=(), **kwargs):
+    return FullMetadata(
+        id=id,
+        title=id,
+        source="example.com",
+        country=country,
+        year=2024,
+        range_data="2020-2024",
+        category=category,
+        schemas=Schemas([{"field_name": "id", "field_type": "int"}]),
+        database_access=DBConnectionMeta(host="db", port=5432, database="lake"),
+        table_name=id,
+        medalion_type=medalion,
+        parents_id=list(parents),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def catalog():
+    return MetadataCatalog(
+        [
+            metadata("raw-a"),
+            metadata("raw-b", country="SG"),
+            metadata("clean", medalion="silver", parents=["raw-a", "raw-b"]),
+            metadata("city", medalion="silver", parents=["raw-a"], location_level="city"),
+            metadata("report", medalion="gold", parents=["clean", "city", "external"]),
+        ]
+    )
+
+
+def test_find(catalog):
+    assert [m.id for m in catalog.find(medalion_type=MedallionTypes.SILVER)] == ["clean", "city"]
+    assert [m.id for m in catalog.find(medalion_type="bronze", country="SG")] == ["raw-b"]
+    assert [m.id for m in catalog.find(location_level=LocationLevel.CITY)] == ["city"]
+    assert catalog.find(category="health") == []
+    with pytest.raises(ValueError):
+        catalog.find(title="raw-a")
+
+
+def test_lineage(catalog):
+    assert set(catalog.upstream("report")) == {"clean", "city", "external", "raw-a", "raw-b"}
+    assert set(catalog.upstream("report", depth=1)) == {"clean", "city", "external"}
+    assert set(catalog.downstream("raw-a")) == {"clean", "city", "report"}
+    assert catalog.downstream("report") == []
+
+
+def test_incremental_updates(catalog):
+    catalog.remove("clean")
+    assert "clean" not in catalog
+    assert [m.id for m in catalog.find(medalion_type="silver")] == ["city"]
+    assert set(catalog.downstream("raw-b")) == set()
+    assert catalog.downstream("clean") == ["report"]
+
+    catalog.add(metadata("city", medalion="gold", parents=["raw-b"]))
+    assert catalog.find(medalion_type="silver") == []
+    assert set(catalog.downstream("raw-b")) == {"city", "report"}
+    assert "city" not in catalog.downstream("raw-a")
+
+
+def test_snapshot(catalog, tmp_path):
+    path = str(tmp_path / "catalog.json")
+    catalog.save(path)
+    loaded = MetadataCatalog.load(path)
+    assert list(loaded) == list(catalog)
+    assert set(loaded.upstream("report")) == set(catalog.upstream("report"))
@@ -0,0 +1,138 @@
+import pytest
+
+pytest.importorskip("clickhouse_connect")
+
+from typica.base import UUIDIdentifier_  # noqa: E402
+from typica.connection import DBConnectionMeta  # noqa: E402
+from typica.metadata import SchemaMeta, Schemas  # noqa: E402
+from typica.modules.cclickhouse import (  # noqa: E402
+    CHConnector,
+    InsertSettings,
+    insert_columns,
+)
+
+
+class Event(UUIDIdentifier_):
+    name: str
+    value: float
+
+
+class FakeContext:
+    def __init__(self, column_names, column_oriented, settings) -> None:
+        self.column_names = column_names
+        self.column_oriented = column_oriented
+        self.settings = settings
+        self.data = None
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.contexts: list[FakeContext] = []
+        self.blocks: list = []
+
+    def create_insert_context(self, table, column_names, column_oriented, settings):
+        self.contexts.append(FakeContext(column_names, column_oriented, settings))
+        return self.contexts[-1]
+
+    def insert(self, context):
+        self.blocks.append(context.data)
+
+
+META = DBConnectionMeta(host="localhost", port=8123, database="default")
+
+
+def connector(client: FakeClient) -> CHConnector:
+    conn = CHConnector(META)
+    conn._client = client  # type: ignore[assignment]
+    return conn
+
+
+def test_insert_columns_use_aliases():
+    assert insert_columns(Event) == (["id", "name", "value"], ["_id", "name", "value"])
+    schemas = Schemas([SchemaMeta(field_name="a", field_type="str", field_alias="b")])
+    assert insert_columns(schemas) == (["a"], ["b"])
+
+
+def test_insert_models_in_column_blocks():
+    client = FakeClient()
+    events = (Event(name=str(idx), value=idx) for idx in range(5))
+
+    stats = connector(client).insert_models(
+        "events", events, block_size=2, settings=InsertSettings(async_insert=True)
+    )
+
+    assert (stats.rows, stats.blocks) == (5, 3)
+    (context,) = client.contexts
+    assert context.column_names == ["_id", "name", "value"]
+    assert context.column_oriented
+    assert context.settings == {"async_insert": 1, "wait_for_async_insert": 1}
+    assert client.blocks[2][1:] == [["4"], [4.0]]
+
+
+def test_insert_dicts_need_a_source():
+    client = FakeClient()
+    schemas = Schemas([SchemaMeta(field_name="a", field_type="int")])
+    stats = connector(client).insert_models("t", [{"a": 1}, {"a": 2}], schemas)
+    assert stats.rows == 2 and client.blocks == [[[1, 2]]]
+    with pytest.raises(ValueError):
+        connector(client).insert_models("t", [{"a": 1}])
+
+
+class FakeSource:
+    column_names = ("_id", "name", "value")
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeStream:
+    def __init__(self, blocks) -> None:
+        self.source = FakeSource()
+        self.blocks = iter(blocks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.source.close()
+
+    def __iter__(self):
+        return self.blocks
+
+
+class StreamClient:
+    def __init__(self, blocks) -> None:
+        self.stream = FakeStream(blocks)
+        self.settings: dict = {}
+
+    def query_row_block_stream(self, query, parameters, settings):
+        self.settings = settings
+        return self.stream
+
+
+def test_stream_blocks_sets_block_size():
+    client = StreamClient([[(1,)], [(2,)]])
+    conn = CHConnector(META)
+    conn._client = client  # type: ignore[assignment]
+
+    assert list(conn.stream_blocks("SELECT 1", block_size=1)) == [[(1,)], [(2,)]]
+    assert client.settings == {"max_block_size": 1}
+    assert client.stream.source.closed
+
+
+def test_stream_models_maps_blocks_lazily():
+    uid = "f82192c2-4609-45cd-a9ce-68305c1969a4"
+    client = StreamClient([[(uid, "a", 1.0)], [(uid, "b", 2.0)]])
+    conn = CHConnector(META)
+    conn._client = client  # type: ignore[assignment]
+
+    stream = conn.stream_models("SELECT *", Event)
+    first = next(stream)
+    assert isinstance(first, Event) and str(first.id) == uid
+    assert list(client.stream.blocks) == [[(uid, "b", 2.0)]]
+
+    stream.close()
+    assert client.stream.source.closed
@@ -0,0 +1,57 @@
+import pytest
+
+from typica.count import PaginationCounter, count_key
+from typica.query import compile_count_sql, compile_estimated_count_sql
+from typica.response import PaginationResponseMeta
+from typica.schema import FilterOpsSchema
+from typica.utils.enums import CountStrategy
+
+
+def test_strategies():
+    counter = PaginationCounter()
+    calls = []
+
+    def exact():
+        calls.append(1)
+        return 25
+
+    result = counter.count("exact", exact, page=3, size=10)
+    assert (result.total, result.has_more) == (25, False)
+
+    result = counter.count(CountStrategy.estimated, exact, lambda: 1000, page=1, size=10)
+    assert (result.total, result.has_more) == (1000, True)
+
+    key = count_key("items", [FilterOpsSchema(filter_by="a", filter_value=1)])
+    assert key == count_key("items", [FilterOpsSchema(filter_by="a", filter_value=1)])
+    counter.count("cached", exact, key=key)
+    counter.count("cached", exact, key=key)
+    assert len(calls) == 2
+
+    result = counter.count("has_more", exact, fetched=11, size=10)
+    assert (result.total, result.has_more) == (None, True)
+    assert len(calls) == 2
+
+    meta = PaginationResponseMeta(code=200, message="ok", **result.meta())
+    assert (meta.total, meta.count_strategy, meta.has_more) == (None, "has_more", True)
+
+
+def test_strategy_requirements():
+    counter = PaginationCounter()
+    with pytest.raises(ValueError):
+        counter.count("has_more", lambda: 1)
+    with pytest.raises(ValueError):
+        counter.count("estimated", lambda: 1)
+    with pytest.raises(ValueError):
+        counter.count("cached", lambda: 1)
+
+
+def test_count_sql():
+    sql, params = compile_count_sql("public.items", [FilterOpsSchema(filter_by="a", filter_value=1)])
+    assert sql == 'SELECT count(*) FROM "public"."items" WHERE "a" = %(p0)s'
+    assert params == {"p0": 1}
+
+    sql, params = compile_estimated_count_sql("public.items")
+    assert "pg_class" in sql and params == {"t0": "public.items"}
+
+    sql, params = compile_estimated_count_sql("analytics.events", "clickhouse")
+    assert "system.parts" in sql and params == {"t0": "events", "t1": "analytics"}
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+import typica
+
+
+def run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_import_is_lazy():
+    loaded = run(
+        "import sys, typica; "
+        "print(sorted(m for m in ('pydantic', 'pydantic_settings', 'typica.base', 'typica.modules') "
+        "if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_enum_does_not_load_models():
+    loaded = run(
+        "import sys; from typica import Operator; "
+        "print('pydantic' in sys.modules, 'pydantic_settings' in sys.modules)"
+    )
+    assert loaded == "False False"
+
+
+def test_config_loads_settings_on_access():
+    assert run("import sys, typica.utils as u; u.ProjectConfig; print('pydantic_settings' in sys.modules)") == "True"
+
+
+def test_public_api():
+    for name in typica.__all__:
+        assert getattr(typica, name) is not None
+    assert set(typica.__all__) <= set(dir(typica))
+    assert typica.CountStrategy is typica.response.CountStrategy
+    assert typica.BaseModel.__name__ == "BaseModel"
+    with pytest.raises(AttributeError):
+        typica.missing
+
+
+def test_star_import_keeps_former_exports():
+    names = run(
+        "ns = {}; exec('from typica import *', ns); "
+        "print(' '.join(sorted(name for name in ns if not name.startswith('_'))))"
+    ).split()
+    assert {"BaseModel", "Field", "ProjectConfig", "config", "enums", "base", "uuid"} <= set(names)
+    assert set(typica._MODULES) <= set(typica.__all__)
+
@@ -0,0 +1,155 @@
+from typing import Any
+
+import pytest
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from typica.catalog import MetadataCatalog
+from typica.connection import ClusterConnectionMeta, DBConnectionMeta, S3ConnectionMeta
+from typica.loader import LazyMetadata, load_json, load_jsonl
+from typica.metadata import DatabaseAccess, FullMetadata, LakeAccess, Schemas
+
+
+def metadata(id, database_access, **kwargs):
+    return FullMetadata(
+        id=id,
+        title=id,
+        source="example.com",
+        country="ID",
+        year=2024,
+        range_data="2020-2024",
+        category="economy",
+        schemas=Schemas([{"field_name": "id", "field_type": "int"}]),
+        database_access=database_access,
+        table_name=id,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "value, database, lake",
+    [
+        ({"uri": "mongodb://a:1,b:2/db"}, ClusterConnectionMeta, ClusterConnectionMeta),
+        ({"cluster_uri": [{"host": "a"}]}, ClusterConnectionMeta, ClusterConnectionMeta),
+        ({"cluster_uri": [], "host": "x"}, DBConnectionMeta, DBConnectionMeta),
+        ({"bucket": "b"}, DBConnectionMeta, S3ConnectionMeta),
+        ({}, DBConnectionMeta, DBConnectionMeta),
+    ],
+)
+def test_discriminated_connections(value, database, lake):
+    assert type(TypeAdapter(DatabaseAccess).validate_python(value)) is database
+    assert type(TypeAdapter(LakeAccess).validate_python(value)) is lake
+
+
+# ? the members and endpoints the smart unions resolved before the discriminators
+BASELINE = [
+    ("mongodb://u:p@h1:1,h2:2/db", ClusterConnectionMeta, [("h1", 1), ("h2", 2)]),
+    ("mongodb://h1:1,h2:2/db", ClusterConnectionMeta, [("h1", 1), ("h2", 2)]),
+    ("mongodb://u:p@h1:27017,h2:27018,h3:27019/app", ClusterConnectionMeta, [("h1", 27017), ("h2", 27018), ("h3", 27019)]),
+    ("mongodb://u:p@h1:1/db", DBConnectionMeta, [("h1", 1)]),
+    ("postgresql://u:p@h:5432/db", DBConnectionMeta, [("h", 5432)]),
+]
+
+
+@pytest.mark.parametrize("uri, member, endpoints", BASELINE)
+def test_discriminators_match_baseline_unions(uri, member, endpoints):
+    for adapter in (TypeAdapter(DatabaseAccess), TypeAdapter(LakeAccess)):
+        meta = adapter.validate_python({"uri": uri})
+        assert type(meta) is member
+        if member is ClusterConnectionMeta:
+            assert [(e.host, e.port) for e in meta.cluster_uri] == endpoints
+        else:
+            assert [(meta.host, meta.port)] == endpoints
+
+
+@pytest.fixture
+def records():
+    return [
+        metadata(
+            "raw",
+            DBConnectionMeta(uri="postgresql://user:pass@db:5432/lake"),
+            medalion_type="bronze",
+            lake_access=S3ConnectionMeta(bucket="lake", host="s3"),
+        ),
+        metadata(
+            "clean",
+            ClusterConnectionMeta(uri="mongodb://a:1,b:2/app"),
+            medalion_type="silver",
+            parents_id=["raw"],
+        ),
+    ]
+
+
+@pytest.fixture
+def jsonl(tmp_path, records):
+    path = tmp_path / "metadata.jsonl"
+    path.write_text("\n".join(record.model_dump_json() for record in records) + "\n\n")
+    return str(path)
+
+
+def test_load_jsonl(jsonl, records):
+    loaded = load_jsonl(jsonl, chunk_size=1)
+    assert loaded == records
+    assert type(loaded[1].database_access) is ClusterConnectionMeta
+
+
+def test_lazy_decodes_on_access(jsonl, records):
+    lazy = load_jsonl(jsonl, lazy=True)
+    assert all(isinstance(record, LazyMetadata) for record in lazy)
+    assert not lazy[0]._decoded
+    assert lazy[0].parents_id == [] and lazy[1].parents_id == ["raw"]
+
+    assert lazy[0].lake_access == records[0].lake_access
+    assert list(lazy[0]._decoded) == ["lake_access"]
+    assert lazy[1].model_dump_json() == records[1].model_dump_json()
+    assert lazy[0].to_full() == records[0]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+    assert load_jsonl(str(path)) == []
+
+
+def test_lazy_catalog_snapshot(tmp_path, records):
+    path = str(tmp_path / "catalog.json")
+    MetadataCatalog(records).save(path)
+    catalog = MetadataCatalog.load(path, lazy=True)
+    assert catalog.downstream("raw") == ["clean"]
+    catalog.save(path)
+    assert load_json(path) == records
+    assert isinstance(load_json(path)[0], FullMetadata)
+
+
+def test_lazy_serializes_nested(jsonl, records):
+    class Page(BaseModel):
+        items: list[LazyMetadata]
+        extra: Any = None
+
+    lazy = load_jsonl(jsonl, lazy=True)
+    dumped = Page(items=[lazy[0]], extra=lazy[1]).model_dump()
+    assert dumped["items"][0] == records[0].model_dump()
+    assert dumped["extra"] == records[1].model_dump()
+    assert lazy[0] == records[0] and lazy[1] == records[1]
+
+
+def test_lazy_is_not_full_metadata(jsonl):
+    class Page(BaseModel):
+        items: list[FullMetadata]
+
+    lazy = load_jsonl(jsonl, lazy=True)
+    assert not isinstance(lazy[0], FullMetadata)
+    with pytest.raises(ValidationError):
+        Page(items=lazy)
+    assert Page(items=[record.to_full() for record in lazy]).model_dump()["items"][0]["schemas"]
+
+
+def test_lazy_validation(records):
+    raw = records[1].model_dump()
+    lazy = LazyMetadata.model_validate(raw)
+    assert lazy == records[1]
+    assert lazy.model_dump(exclude={"schemas"}) == records[1].model_dump(exclude={"schemas"})
+
+    del raw["database_access"]
+    with pytest.raises(ValidationError):
+        LazyMetadata.model_validate(raw)
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from typica.modules.npfilter import ColumnStore  # noqa: E402
+from typica.schema import (  # noqa: E402
+    FilterGroupSchema,
+    FilterOpsSchema,
+    OrderSchema,
+    PaginationSchema,
+)
+
+RECORDS = [
+    {"id": 1, "country": "ID", "score": 3.5, "tag": "alpha", "at": datetime(2024, 1, 1)},
+    {"id": 2, "country": "SG", "score": 1.0, "tag": "beta"},
+    {"id": 3, "country": "ID", "score": None, "tag": "gamma", "at": datetime(2024, 3, 1)},
+    {"id": 4, "country": "MY", "score": 2.0, "tag": None, "at": datetime(2024, 2, 1)},
+    {"id": 5, "country": "ID", "score": 5.0, "tag": "alphabet", "flag": True},
+]
+
+
+def f(field, op, value):
+    return FilterOpsSchema(filter_by=field, filter_op=op, filter_value=value)
+
+
+def ids(store, filters=None, order=None, pagination=None):
+    return [row["id"] for row in store.records(store.query(filters, order, pagination))]
+
+
+@pytest.fixture
+def store():
+    return ColumnStore.from_records(RECORDS)
+
+
+@pytest.mark.parametrize(
+    "item, expected",
+    [
+        (f("country", "eq", "ID"), [1, 3, 5]),
+        (f("country", "ne", "ID"), [2, 4]),
+        (f("tag", "ne", "beta"), [1, 3, 4, 5]),
+        (f("tag", "re", "^alpha"), [1, 5]),
+        (f("score", "gt", 2.0), [1, 5]),
+        (f("score", "gte", 2.0), [1, 4, 5]),
+        (f("score", "lt", 2.0), [2]),
+        (f("tag", "lte", "beta"), [1, 2, 5]),
+        (f("tag", "gt", "alphabet"), [2, 3]),
+        (f("country", "in", ["SG", "MY", "XX"]), [2, 4]),
+        (f("country", "nin", ["ID"]), [2, 4]),
+        (f("at", "gte", datetime(2024, 2, 1, tzinfo=timezone.utc)), [3, 4]),
+        (f("score", "exist", True), [1, 2, 4, 5]),
+        (f("score", "nexist", True), [3]),
+        (f("flag", "eq", True), [5]),
+        (f("missing", "exist", True), []),
+        (f("score", "eq", None), [3]),
+        # ? a value of another type equals no row
+        (f("tag", "ne", 5), [1, 2, 3, 4, 5]),
+        (f("tag", "eq", 5), []),
+        (f("id", "ne", "1"), [1, 2, 3, 4, 5]),
+        (f("id", "eq", "1"), []),
+        (f("at", "ne", "soon"), [1, 2, 3, 4, 5]),
+    ],
+)
+def test_operators(store, item, expected):
+    assert ids(store, [item]) == expected
+
+
+def test_filter_options(store):
+    groups = FilterGroupSchema(
+        must=[f("id", "gte", 1)],
+        mustnt=[f("country", "eq", "MY")],
+        should=[f("country", "eq", "ID"), f("score", "lt", 2)],
+        shouldnt=[f("country", "eq", "ID"), f("score", "gt", 4)],
+    )
+    assert ids(store, groups) == [1, 2, 3]
+
+
+def test_order_and_pagination(store):
+    order = OrderSchema(order_by="score", order_type="desc")
+    assert ids(store, order=order) == [5, 1, 4, 2, 3]
+    assert ids(store, order=OrderSchema(order_by="tag", order_type=1)) == [1, 5, 2, 3, 4]
+    assert ids(store, order=order, pagination=PaginationSchema(page=2, size=2)) == [4, 2]
+
+
+def test_records_round_trip(store):
+    assert store.records(np.array([0, 1])) == RECORDS[:2]
+
+
+def test_partial_sort_keeps_ties_stable():
+    rng = np.random.default_rng(0)
+    rows = [{"id": idx, "score": int(score)} for idx, score in enumerate(rng.integers(0, 5, 500))]
+    store = ColumnStore.from_records(rows)
+    order = OrderSchema(order_by="score", order_type="desc")
+    full = ids(store, order=order)
+    for page in (1, 4, 9):
+        paged = ids(store, order=order, pagination=PaginationSchema(page=page, size=30))
+        assert paged == full[(page - 1) * 30 : page * 30]
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from typica.base import CreationMeta  # noqa: E402
+from typica.modules.nptime import (  # noqa: E402
+    normalize_timestamps,
+    to_datetimes,
+    validate_creation_batch,
+)
+
+
+def test_normalize_detects_epoch_units():
+    values = [
+        1661416000,
+        1661416000123,
+        1661416000123456,
+        1661416000123456789,
+    ]
+
+    result = normalize_timestamps(values)
+
+    assert result.astype("int64").tolist() == [
+        1661416000000000000,
+        1661416000123000000,
+        1661416000123456000,
+        1661416000123456789,
+    ]
+
+
+def test_normalize_mixed_column():
+    values = [
+        "2022-08-08T00:00:00.123456789",
+        "2022-08-08T07:00:00+07:00",
+        datetime(2022, 8, 8, tzinfo=timezone.utc),
+        None,
+    ]
+
+    result = normalize_timestamps(values)
+
+    assert str(result[0]) == "2022-08-08T00:00:00.123456789"
+    assert result[1] == result[2] == np.datetime64("2022-08-08T00:00:00", "ns")
+    assert np.isnat(result[3])
+    assert to_datetimes(result)[3] is None
+
+
+def test_validate_creation_batch():
+    rows = validate_creation_batch(
+        [{"created_at": 1661416000123}, {"created_by": "me"}]
+    )
+
+    assert rows[0].created_at == datetime(
+        2022, 8, 25, 8, 26, 40, 123000, tzinfo=timezone.utc
+    )
+    assert rows[1].created_by == "me"
+    assert rows[1].created_at is not None
+
+
+def test_out_of_range_epoch():
+    with pytest.raises(ValueError):
+        normalize_timestamps(np.array([99_999_999_999]))
+
+
+def test_float_epochs_keep_nanoseconds():
+    result = normalize_timestamps([1661416000123.5, 1661416000123456.5, 1661416000.25])
+
+    assert result.astype("int64").tolist() == [
+        1661416000123500000,
+        1661416000123456500,
+        1661416000250000000,
+    ]
+
+
+def test_utc_suffix():
+    result = normalize_timestamps(["2022-08-08T00:00:00Z", "2022-08-08T00:00:00.5z"])
+
+    assert result[0] == np.datetime64("2022-08-08T00:00:00", "ns")
+    assert result[1] == np.datetime64("2022-08-08T00:00:00.5", "ns")
+
+
+def test_compact_offset():
+    result = normalize_timestamps(["2022-08-08T07:00:00+0700", "2022-08-07T19:30:00-0430"])
+
+    assert result[0] == result[1] == np.datetime64("2022-08-08T00:00:00", "ns")
+
+
+def test_batch_matches_row_validation():
+    values = [
+        "2022-08-08T00:00:00",
+        "2022-08-08T00:00:00.123456",
+        "2022-08-08T07:00:00+07:00",
+        "2022-08-08T00:00:00Z",
+        datetime(2022, 8, 8),
+        datetime(2022, 8, 8, 7, tzinfo=timezone(timedelta(hours=7))),
+        1661416000,
+        1661416000123,
+        None,
+    ]
+
+    batch = validate_creation_batch([{"created_at": value} for value in values])
+    rows = [CreationMeta(created_at=value) for value in values]
+
+    assert [row.created_at for row in batch] == [row.created_at for row in rows]
+    assert all(
+        row.created_at.tzinfo is timezone.utc for row in batch + rows if row.created_at
+    )
@@ -0,0 +1,199 @@
+import threading
+
+from typing import Any
+
+import pytest
+
+from pydantic import BaseModel, Field
+
+pytest.importorskip("pymongo")
+
+import bson  # noqa: E402
+
+from bson.codec_options import CodecOptions  # noqa: E402
+from pymongo.errors import BulkWriteError  # noqa: E402
+
+from typica.base import StringIdentifier_, UUIDIdentifier_  # noqa: E402
+from typica.connection import DBConnectionMeta  # noqa: E402
+from typica.modules.pmongo import MongoConnector, _write_batch, dump_documents  # noqa: E402
+
+
+class Item(StringIdentifier_):
+    name: str
+
+
+class FakeResult:
+    def __init__(self, count: int) -> None:
+        self.inserted_count = count
+        self.matched_count = 0
+        self.modified_count = 0
+        self.upserted_count = 0
+
+
+class FakeCollection:
+    def __init__(self) -> None:
+        self.docs: dict = {}
+        self.lock = threading.Lock()
+        self.calls: list[int] = []
+
+    def bulk_write(self, ops, ordered=True):
+        assert ordered is False
+        errors = []
+        with self.lock:
+            self.calls.append(len(ops))
+            for index, op in enumerate(ops):
+                doc = op._doc
+                if doc["_id"] in self.docs:
+                    errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+                else:
+                    self.docs[doc["_id"]] = doc
+        if errors:
+            raise BulkWriteError({"nInserted": len(ops) - len(errors), "writeErrors": errors})
+        return FakeResult(len(ops))
+
+
+META = DBConnectionMeta(host="localhost", port=27017, database="test")
+
+
+def connector(collection: FakeCollection) -> MongoConnector:
+    conn = MongoConnector(META)
+    conn._db = {"items": collection}  # type: ignore[assignment]
+    return conn
+
+
+def test_dump_documents_uses_alias():
+    docs = dump_documents([Item(_id="a", name="x")])
+    assert docs == [{"_id": "a", "name": "x"}]
+
+
+def test_bulk_write_chunks_and_collects_errors():
+    collection = FakeCollection()
+    collection.docs["dup-3"] = {"_id": "dup-3"}
+    models = (Item(_id=f"dup-{idx}", name=str(idx)) for idx in range(2_500))
+
+    stats = connector(collection).bulk_write(
+        "items", models, batch_size=1_000, max_in_flight=2
+    )
+
+    assert sorted(collection.calls) == [500, 1_000, 1_000]
+    assert stats.batches == 3
+    assert stats.inserted == 2_499
+    assert [(error.id, error.code) for error in stats.errors] == [("dup-3", 11000)]
+
+
+def test_bulk_write_rejects_bad_batch_size():
+    with pytest.raises(ValueError):
+        connector(FakeCollection()).bulk_write("items", [], batch_size=0)
+
+
+class FakeCursor:
+    def __init__(self, docs: list) -> None:
+        self.docs = iter(docs)
+        self.closed = False
+
+    def __iter__(self):
+        return self.docs
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FindCollection:
+    def __init__(self, docs: list) -> None:
+        self.cursor = FakeCursor(docs)
+        self.args: tuple = ()
+
+    def find(self, filter, projection, **kwargs):
+        self.args = (filter, projection, kwargs)
+        return self.cursor
+
+
+def test_find_models_projects_and_streams():
+    docs = [{"_id": str(idx), "name": str(idx)} for idx in range(5)]
+    collection = FindCollection(docs)
+    conn = MongoConnector(META)
+    conn._db = {"items": collection}  # type: ignore[assignment]
+
+    stream = conn.find_models("items", Item, {"name": "x"}, batch_size=2)
+    first = next(stream)
+    assert isinstance(first, Item) and first.id == "0"
+    assert collection.args[1] == {"_id": 1, "name": 1}
+    assert collection.args[2]["batch_size"] == 2
+    assert [item.id for item in stream] == ["1", "2", "3", "4"]
+    assert collection.cursor.closed
+
+
+def test_find_models_trusted_skips_validation():
+    collection = FindCollection([{"_id": "a", "name": 1}])
+    conn = MongoConnector(META)
+    conn._db = {"items": collection}  # type: ignore[assignment]
+
+    (item,) = conn.find_models("items", Item, trusted=True)
+    assert item.id == "a" and item.name == 1
+
+
+class Named(BaseModel):
+    name: str
+
+
+def test_bulk_upsert_without_id_fails_before_writing():
+    collection = FakeCollection()
+    with pytest.raises(ValueError, match="_id"):
+        connector(collection).bulk_write("items", [Named(name="a")], mode="upsert")
+    assert collection.calls == []
+
+
+class EncodingCollection(FakeCollection):
+    """
+    Encodes every document with the codec options of a client, like the driver.
+    """
+
+    def __init__(self, codec_options: CodecOptions) -> None:
+        super().__init__()
+        self.codec_options = codec_options
+
+    def bulk_write(self, ops, ordered=True):
+        for op in ops:
+            bson.encode(op._doc, codec_options=self.codec_options)
+        return super().bulk_write(ops, ordered)
+
+
+class Mixed(BaseModel):
+    id: Any = Field(..., alias="_id")
+    name: Any
+
+
+def test_bulk_write_encodes_uuid_ids():
+    conn = MongoConnector(META)
+    conn.connect(connect=False)
+    try:
+        collection = EncodingCollection(conn._client.codec_options)
+        conn._db = {"items": collection}  # type: ignore[assignment]
+        models = [UUIDIdentifier_() for _ in range(3)]
+
+        stats = conn.bulk_write("items", models, batch_size=2)
+    finally:
+        conn.close()
+
+    assert stats.inserted == 3 and not stats.errors
+    assert set(collection.docs) == {model.id for model in models}
+
+
+def test_bulk_write_reports_unencodable_batches():
+    collection = EncodingCollection(CodecOptions())
+    models = [Mixed(_id=f"s-{idx}", name="x") for idx in range(3)] + [
+        Mixed(_id=f"o-{idx}", name=object()) for idx in range(2)
+    ]
+
+    stats = connector(collection).bulk_write("items", models, batch_size=3, max_in_flight=1)
+
+    assert stats.inserted == 3 and stats.batches == 2
+    assert [error.id for error in stats.errors] == ["o-0", "o-1"]
+    assert "cannot encode" in stats.errors[0].message
+
+
+def test_upsert_batch_reports_documents_without_id():
+    collection = FakeCollection()
+    stats = _write_batch(collection, [{"_id": "a", "name": "x"}, {"name": "y"}], "upsert")
+    assert list(collection.docs) == ["a"]
+    assert [(error.id, error.message) for error in stats.errors] == [(None, "upsert needs an _id")]
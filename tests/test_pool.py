@@ -0,0 +1,219 @@
+import os
+import threading
+import time
+
+import pytest
+
+from typica.connection import DBConnectionMeta
+from typica.modules.pool import (
+    ClientPool,
+    ConnectionRegistry,
+    PoolConfig,
+    meta_key,
+)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_pool(**config) -> ClientPool[FakeClient]:
+    return ClientPool(
+        "key", "fake", FakeClient, FakeClient.close, PoolConfig(**config)
+    )
+
+
+def test_pool_reuses_released_clients():
+    pool = make_pool(max_size=2)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert first is second
+    stats = pool.stats()
+    assert (stats.created, stats.reused, stats.in_use) == (1, 1, 1)
+
+
+def test_pool_blocks_at_max_size():
+    pool = make_pool(max_size=1, acquire_timeout=0.05)
+    client = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    threading.Timer(0.01, pool.release, args=(client,)).start()
+    pool.config.acquire_timeout = 1
+    assert pool.acquire() is client
+    assert pool.stats().waits == 2
+
+
+def test_pool_evicts_idle_clients_above_min_size():
+    pool = make_pool(min_size=1, idle_timeout=0)
+    pool.warm()
+    clients = [pool.acquire(), pool.acquire()]
+    for client in clients:
+        pool.release(client)
+    time.sleep(0.001)
+
+    pool.evict_idle()
+
+    assert pool.stats().size == 1
+    assert sum(client.closed for client in clients) == 1
+
+
+def test_pool_discards_broken_clients():
+    pool = make_pool()
+    client = pool.acquire()
+
+    pool.release(client, discard=True)
+
+    assert client.closed
+    assert pool.stats().size == 0
+
+
+def test_registry_keys_on_normalized_meta():
+    registry = ConnectionRegistry()
+    from_uri = DBConnectionMeta(uri="postgresql://user:pass@db:5432/app")
+    same = DBConnectionMeta(uri="postgresql://user:pass@db:5432/app")
+
+    pool = registry.pool("postgresql", from_uri, FakeClient, FakeClient.close)
+
+    assert registry.pool("postgresql", same, FakeClient, FakeClient.close) is pool
+    assert registry.pool("mongo", same, FakeClient, FakeClient.close) is not pool
+    assert meta_key("redis", same, db=1) != meta_key("redis", same, db=2)
+    assert [stats.kind for stats in registry.stats()] == ["postgresql", "mongo"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_registry_forgets_pools_after_fork():
+    registry = ConnectionRegistry()
+    meta = DBConnectionMeta(host="db", port=5432)
+    pool = registry.pool("postgresql", meta, FakeClient, FakeClient.close)
+    registry._pid = -1  # simulate running in a forked child
+
+    assert registry.pool("postgresql", meta, FakeClient, FakeClient.close) is not pool
+
+
+def test_pool_recycles_clients_after_max_lifetime():
+    pool = make_pool(max_lifetime=0.001)
+    client = pool.acquire()
+    time.sleep(0.002)
+
+    pool.release(client)
+
+    assert client.closed
+    assert pool.stats().recycled == 1
+    assert pool.acquire() is not client
+
+
+def test_pool_checks_clients_when_borrowed():
+    pool = ClientPool(
+        "key",
+        "fake",
+        FakeClient,
+        FakeClient.close,
+        PoolConfig(),
+        check=lambda client: not getattr(client, "broken", False),
+    )
+    client = pool.acquire()
+    pool.release(client)
+    client.broken = True  # type: ignore[attr-defined]
+
+    fresh = pool.acquire()
+
+    assert fresh is not client
+    assert client.closed
+    stats = pool.stats()
+    assert (stats.failed_checks, stats.created, stats.size) == (1, 2, 1)
+
+
+class FakeDriverClient(FakeClient):
+    """
+    Stands in for the client of every driver: a Mongo client, a Redis
+    client, a ClickHouse client or a psycopg2 connection.
+    """
+
+    created: list["FakeDriverClient"] = []
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.created.append(self)
+
+    def __getitem__(self, name):
+        return {}
+
+    def cursor(self) -> FakeClient:
+        return FakeClient()
+
+    def rollback(self) -> None:
+        pass
+
+    def get_transaction_status(self) -> int:
+        return 0
+
+
+# ? the driver names each connector builds its clients and closer from
+DRIVERS = {
+    "cclickhouse": ("CHConnector", ["get_client", "Client"]),
+    "pmongo": ("MongoConnector", ["MongoClient"]),
+    "redis": ("RedisConnector", ["Redis"]),
+    "psycopg": ("PostgreConnector", ["psycopg2.connect", "connection"]),
+}
+
+
+@pytest.fixture(params=sorted(DRIVERS))
+def pooled_connector(request, monkeypatch):
+    module = pytest.importorskip(f"typica.modules.{request.param}")
+    name, drivers = DRIVERS[request.param]
+    for driver in drivers:
+        target, _, attribute = driver.rpartition(".")
+        owner = getattr(module, target) if target else module
+        monkeypatch.setattr(owner, attribute, FakeDriverClient)
+    registry = ConnectionRegistry()
+    monkeypatch.setattr(module, "connection_registry", registry)
+    monkeypatch.setattr(FakeDriverClient, "created", [])
+
+    meta = DBConnectionMeta(host="db", port=5432, database="0")
+    if request.param == "redis":
+        from typica.connection import RedisConnectionMeta
+
+        meta = RedisConnectionMeta(host="db", port=6379, database=0)
+    return getattr(module, name)(meta, pooled=True), registry
+
+
+def test_pooled_connector_close_is_idempotent(pooled_connector):
+    connector, registry = pooled_connector
+    connector.connect()
+
+    connector.close()
+    connector.close()
+
+    (stats,) = registry.stats()
+    assert (stats.created, stats.idle, stats.in_use, stats.closed) == (1, 1, 0, 0)
+    assert not any(client.closed for client in FakeDriverClient.created)
+
+    connector.connect()
+    connector.close()
+    (stats,) = registry.stats()
+    assert (stats.created, stats.reused, stats.idle) == (1, 1, 1)
+
+
+def test_pooled_connector_closes_after_failed_acquire(pooled_connector, monkeypatch):
+    connector, registry = pooled_connector
+
+    def fail(self):
+        raise TimeoutError("no client")
+
+    monkeypatch.setattr(ClientPool, "acquire", fail)
+    with pytest.raises((TimeoutError, ValueError)):
+        connector.connect()
+
+    # ? nothing was borrowed, so there is nothing to release
+    connector.close()
+    connector.close()
+    assert [stats.in_use for stats in registry.stats()] == [0]
@@ -0,0 +1,111 @@
+import json
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from typica.modules.profiler import (  # noqa: E402
+    HyperLogLog,
+    TableProfile,
+    hash_strings,
+    iter_chunks,
+    profile,
+    read_csv,
+    read_jsonl,
+    splitmix64,
+)
+
+
+def rows(size: int = 20_000) -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "id": idx,
+            "country": rng.choice(["ID", "SG", "MY"]),
+            "score": None if idx % 10 == 0 else rng.gauss(50, 10),
+            **({"extra": "x"} if idx >= size // 2 else {}),
+        }
+        for idx in range(size)
+    ]
+
+
+def by_name(schemas):
+    return {meta.field_name: meta for meta in schemas}
+
+
+def test_hyperloglog_estimate_and_merge():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.add_hashes(splitmix64(np.arange(0, 60_000)))
+    right.add_hashes(splitmix64(np.arange(40_000, 100_000)))
+    left.merge(right)
+    assert abs(left.count() - 100_000) / 100_000 < 0.03
+
+    small = HyperLogLog()
+    small.add_hashes(hash_strings(["a", "b", "c", "a"]))
+    assert small.count() == 3
+
+
+def test_profile_schemas():
+    schemas = by_name(profile(iter_chunks(rows(), 3_000)))
+
+    assert schemas["id"].field_type == "int"
+    assert abs(json.loads(schemas["id"].describe_field)["distinct"] - 20_000) < 600
+    assert schemas["score"].none_percentage == 10.0
+    describe = json.loads(schemas["score"].describe_field)
+    assert abs(describe["mean"] - 50) < 1 and abs(describe["std"] - 10) < 1
+    assert sorted(schemas["country"].unique_value) == ["ID", "MY", "SG"]
+    assert schemas["extra"].none_percentage == 50.0
+
+
+def test_chunked_and_merged_profiles_agree():
+    data = rows(5_000)
+    whole = TableProfile()
+    whole.update(data)
+
+    merged = TableProfile()
+    for chunk in iter_chunks(data, 700):
+        part = TableProfile()
+        part.update(chunk)
+        merged.merge(part)
+
+    for name, column in whole.columns.items():
+        other = merged.columns[name]
+        assert (column.rows, column.nulls) == (other.rows, other.nulls)
+        assert np.array_equal(column.distinct.registers, other.distinct.registers)
+        assert column.describe.mean == pytest.approx(other.describe.mean)
+        assert column.describe.m2 == pytest.approx(other.describe.m2)
+
+
+def test_mixed_ints_and_floats_count_once():
+    ints = TableProfile()
+    ints.update([{"n": value} for value in (1, 2, 3)])
+    floats = TableProfile()
+    floats.update([{"n": value} for value in (1.0, 2.0, 3.5)])
+    ints.merge(floats)
+
+    schema = ints.schemas().root[0]
+    assert json.loads(schema.describe_field)["distinct"] == 4
+    assert sorted(schema.unique_value) == ["1", "2", "3", "3.5"]
+    assert ints.columns["n"].frequent.counts["1"] == 2
+
+
+def test_process_pool_matches_in_process():
+    data = rows(6_000)
+    local = by_name(profile(iter_chunks(data, 1_000)))
+    pooled = by_name(profile(iter_chunks(data, 1_000), workers=2))
+    for name in local:
+        assert json.loads(local[name].describe_field) == pytest.approx(
+            json.loads(pooled[name].describe_field)
+        )
+        assert local[name].none_percentage == pooled[name].none_percentage
+
+
+def test_readers(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,b\n1,\n2,x\n")
+    assert list(read_csv(str(csv_path))) == [[{"a": "1", "b": None}, {"a": "2", "b": "x"}]]
+
+    jsonl_path = tmp_path / "data.jsonl"
+    jsonl_path.write_text('{"a": 1}\n\n{"a": 2}\n')
+    assert list(read_jsonl(str(jsonl_path), 1)) == [[{"a": 1}], [{"a": 2}]]
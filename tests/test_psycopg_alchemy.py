@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("psycopg2")
+
+from typica.connection import DBConnectionMeta  # noqa: E402
+from typica.modules.pool import PoolConfig  # noqa: E402
+from typica.modules.psycopg_alchemy import (  # noqa: E402
+    EngineConfig,
+    PostgreConnector,
+    cached_text,
+    dispose_engines,
+    get_engine,
+)
+
+
+def test_engine_is_cached_per_meta_and_config():
+    meta = DBConnectionMeta(uri="postgresql://user:pass@db:5432/app")
+    same = DBConnectionMeta(uri="postgresql://user:pass@db:5432/app")
+
+    engine = get_engine(meta, EngineConfig(pool_size=2, pool_pre_ping=True))
+
+    assert get_engine(same, EngineConfig(pool_size=2, pool_pre_ping=True)) is engine
+    assert get_engine(meta) is not engine
+    assert engine.pool.size() == 2
+    assert engine.pool._pre_ping  # type: ignore[attr-defined]
+    dispose_engines()
+    assert get_engine(meta, EngineConfig(pool_size=2, pool_pre_ping=True)) is not engine
+
+
+def test_text_constructs_are_cached():
+    clause = cached_text("SELECT * FROM items WHERE id = :id")
+
+    assert cached_text("SELECT * FROM items WHERE id = :id") is clause
+    assert list(clause._bindparams) == ["id"]
+
+
+def test_pool_config_maps_onto_engine_config():
+    meta = DBConnectionMeta(uri="postgresql://user:pass@db:5432/app")
+    pool_config = PoolConfig(max_size=4, acquire_timeout=5, max_lifetime=30.5, pre_ping=True)
+
+    connector = PostgreConnector(meta, pool_config=pool_config)
+
+    assert connector._engine_config == EngineConfig(
+        pool_size=4, max_overflow=0, pool_recycle=31, pool_pre_ping=True, pool_timeout=5
+    )
+    assert PostgreConnector(meta, pooled=True)._engine_config is None
+    with pytest.raises(ValueError):
+        PostgreConnector(meta, pool_config=pool_config, engine_config=EngineConfig())
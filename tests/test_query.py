@@ -0,0 +1,163 @@
+import pytest
+
+from typica.query import _sql_plan, compile_mongo, compile_sql, plan_cache_clear
+from typica.schema import FilterGroupSchema, FilterOpsSchema, OrderSchema, PaginationSchema
+
+
+def f(field, op, value):
+    return FilterOpsSchema(filter_by=field, filter_op=op, filter_value=value)
+
+
+GROUPS = FilterGroupSchema(
+    must=[f("country", "eq", "ID"), f("year", "gte", 2020)],
+    mustnt=[f("category", "in", ["a", "b"])],
+    should=[f("title", "re", "^x"), f("source", "exist", False)],
+    shouldnt=[f("level", "lt", 3), f("range", "ne", None)],
+)
+
+
+def test_compile_mongo():
+    query = compile_mongo(
+        GROUPS, OrderSchema(order_by="year", order_type="desc"), PaginationSchema(page=3, size=10)
+    )
+    assert query.filter == {
+        "$and": [
+            {"$and": [{"country": {"$eq": "ID"}}, {"year": {"$gte": 2020}}]},
+            {"$nor": [{"category": {"$in": ["a", "b"]}}]},
+            {"$or": [{"title": {"$regex": "^x"}}, {"source": {"$exists": False}}]},
+            {"$nor": [{"$and": [{"level": {"$lt": 3}}, {"range": {"$ne": None}}]}]},
+        ]
+    }
+    assert (query.sort, query.skip, query.limit) == ([("year", -1)], 20, 10)
+
+
+def test_compile_mongo_list_is_must():
+    assert compile_mongo([f("a", None, 1)]).filter == {"a": {"$eq": 1}}
+    assert compile_mongo().filter == {}
+
+
+def test_compile_sql_dialects():
+    query = compile_sql(GROUPS, OrderSchema(order_by="year", order_type=1), PaginationSchema(size=5))
+    assert query.where == (
+        '("country" = %(p0)s AND "year" >= %(p1)s)'
+        ' AND (NOT COALESCE(("category" = ANY(%(p2)s)), FALSE))'
+        ' AND (("title" ~ %(p3)s OR "source" IS NULL))'
+        ' AND (NOT COALESCE(("level" < %(p4)s AND "range" IS NOT NULL), FALSE))'
+    )
+    assert query.params == {"p0": "ID", "p1": 2020, "p2": ["a", "b"], "p3": "^x", "p4": 3}
+    assert query.statement("SELECT * FROM t").endswith('ORDER BY "year" ASC LIMIT 5')
+
+    alchemy = compile_sql([f("a", "eq", 1)], dialect="sqlalchemy")
+    assert alchemy.where == '"a" = :p0'
+
+    clickhouse = compile_sql([f("a", "nin", [1, 2]), f("b", "re", "x")], dialect="clickhouse")
+    assert clickhouse.where == "`a` NOT IN %(p0)s AND match(`b`, %(p1)s)"
+    assert clickhouse.params == {"p0": (1, 2), "p1": "x"}
+
+
+def test_empty_in_and_nin():
+    filters = [f("a", "in", []), f("b", "nin", ()), f("c", "in", [1])]
+
+    for dialect in ("psycopg", "clickhouse"):
+        query = compile_sql(filters, dialect=dialect)
+        assert query.where.startswith("FALSE AND TRUE AND ")
+        assert query.params == {"p0": [1] if dialect == "psycopg" else (1,)}
+    assert compile_mongo(filters).filter == {
+        "$and": [{"a": {"$in": []}}, {"b": {"$nin": []}}, {"c": {"$in": [1]}}]
+    }
+
+
+def test_plan_cache_is_keyed_on_shape():
+    plan_cache_clear()
+    compile_sql([f("a", "eq", 1)])
+    compile_sql([f("a", "eq", 2)])
+    compile_sql([f("a", "eq", None)])
+    info = _sql_plan.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+@pytest.mark.parametrize("field", ["a; DROP TABLE t", "a b", "1a", "", None, 'a"'])
+def test_rejects_unsafe_identifiers(field):
+    with pytest.raises(ValueError):
+        compile_sql([f(field, "eq", 1)])
+    with pytest.raises(ValueError):
+        compile_sql(order=OrderSchema(order_by=field or "x y"))
+
+
+def test_rejects_unknown_operator():
+    with pytest.raises(ValueError):
+        compile_mongo([f("a", "like", 1)])
+
+
+def test_cursor_tokens_are_signed():
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from typica.query import Cursor, decode_cursor, encode_cursor
+
+    cursor = Cursor("created_at", datetime(2024, 1, 1, tzinfo=timezone.utc), uuid4(), "next")
+    token = encode_cursor(cursor, "secret")
+    assert decode_cursor(token, "secret") == cursor
+    with pytest.raises(ValueError):
+        decode_cursor(token, "other")
+    with pytest.raises(ValueError):
+        decode_cursor("garbage", "secret")
+
+
+def test_keyset_pages_walk_both_ways():
+    import sqlite3
+
+    from typica.query import compile_keyset_sql, keyset_page
+    from typica.schema import CursorPaginationSchema
+
+    db = sqlite3.connect(":memory:")
+    db.row_factory = sqlite3.Row
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, score INTEGER)")
+    db.executemany("INSERT INTO t VALUES (?, ?)", [(i, i % 4) for i in range(1, 11)])
+    order = OrderSchema(order_by="score", order_type="desc")
+
+    def fetch(cursor):
+        pagination = CursorPaginationSchema(cursor=cursor, size=3)
+        query = compile_keyset_sql(
+            pagination, "s", order, [f("id", "gt", 0)], dialect="sqlalchemy"
+        )
+        rows = [dict(row) for row in db.execute(query.statement("SELECT * FROM t"), query.params)]
+        return keyset_page(rows, pagination, "s", order)
+
+    expected = sorted(range(1, 11), key=lambda i: (-(i % 4), -i))
+    pages, cursor = [], None
+    while True:
+        page = fetch(cursor)
+        pages.append(page)
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+    assert [row["id"] for page in pages for row in page.items] == expected
+    assert pages[0].prev_cursor is None
+
+    back = fetch(pages[-1].prev_cursor)
+    assert [row["id"] for row in back.items] == [row["id"] for row in pages[-2].items]
+    assert back.next_cursor and back.has_more
+
+
+def test_keyset_mongo():
+    from typica.query import Cursor, compile_keyset_mongo, encode_cursor
+    from typica.schema import CursorPaginationSchema
+
+    token = encode_cursor(Cursor("year", 2020, "x", "next"), "s")
+    query = compile_keyset_mongo(
+        CursorPaginationSchema(cursor=token, size=5), "s", OrderSchema(order_by="year")
+    )
+    assert query.filter == {
+        "$or": [{"year": {"$gt": 2020}}, {"year": 2020, "_id": {"$gt": "x"}}]
+    }
+    assert (query.sort, query.limit) == ([("year", 1), ("_id", 1)], 6)
+
+
+def test_not_exist_is_distinct_from_exist():
+    from typica.utils.enums import Operator
+
+    assert Operator("nexist") is Operator.not_exist
+    assert Operator.not_exist is not Operator.exist
+    assert compile_mongo([f("a", "nexist", True)]).filter == {"a": {"$exists": False}}
+    assert compile_sql([f("a", "nexist", None)]).where == '"a" IS NULL'
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("redis")
+
+from redis.exceptions import DataError  # noqa: E402
+
+from typica.connection import RedisConnectionMeta  # noqa: E402
+from typica.modules.redis import AsyncRedisConnector, RedisConnector  # noqa: E402
+
+
+class FakePipeline:
+    def __init__(self, server: "FakeRedis", transaction: bool) -> None:
+        self.server = server
+        self.transaction = transaction
+        self.commands: list[tuple] = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    def execute(self):
+        self.server.round_trips += 1
+        return [
+            getattr(self.server, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict = {}
+        self.round_trips = 0
+        self.transactions = 0
+
+    def pipeline(self, transaction: bool = False) -> FakePipeline:
+        self.transactions += transaction
+        return FakePipeline(self, transaction)
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def mset(self, mapping):
+        self.data.update(mapping)
+        return True
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def hset(self, key, mapping):
+        if not mapping:
+            raise DataError("'hset' with no key value pairs")
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def close(self) -> None:
+        pass
+
+
+META = RedisConnectionMeta(host="localhost", port=6379, database=0)
+
+
+def test_bulk_helpers_chunk_round_trips():
+    connector = RedisConnector(META, chunk_size=1_000)
+    connector._client = FakeRedis()  # type: ignore[assignment]
+
+    keys = [f"key:{idx}" for idx in range(10_000)]
+    assert connector.mset({key: idx for idx, key in enumerate(keys)}) == 10_000
+    assert connector.mget(keys)[1234] == 1234
+    assert connector.expire_many(keys + ["missing"], 60) == 10_000
+    assert connector.hset_many({"hash": {"a": 1}}, ex=60) == 1
+
+    assert connector._client.round_trips == 10 + 10 + 11 + 1  # type: ignore[attr-defined]
+
+
+def test_bulk_helpers_skip_empty_hashes_and_honor_transaction():
+    connector = RedisConnector(META, chunk_size=2, transaction=True)
+    connector._client = client = FakeRedis()  # type: ignore[assignment]
+
+    assert connector.hset_many({"empty": {}, "hash": {"a": 1}}) == 1
+    assert connector.hset_many({"empty": {}}) == 0
+    assert client.data == {"hash": {"a": 1}}
+
+    client.transactions = 0
+    assert connector.delete_many(["hash", "missing", "other"]) == 1
+    assert client.transactions == 2
+
+
+def test_client_requires_connection():
+    with pytest.raises(ValueError):
+        RedisConnector(META).client
+
+
+def test_async_context_manager(monkeypatch):
+    connector = AsyncRedisConnector(META)
+    events = []
+
+    async def connect(other_database=None):
+        events.append("connect")
+        connector._client = object()  # type: ignore[assignment]
+
+    async def close():
+        events.append("close")
+
+    monkeypatch.setattr(connector, "connect", connect)
+    monkeypatch.setattr(connector, "close", close)
+
+    async def run():
+        async with connector as redis:
+            assert redis is connector
+
+    asyncio.run(run())
+    assert events == ["connect", "close"]
@@ -0,0 +1,56 @@
+from pydantic import BaseModel
+
+from typica.response import ResponseRegistry, ServiceResponse
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_registry_reuses_models():
+    registry = ResponseRegistry()
+    service = ServiceResponse(Item, registry=registry)
+
+    first = service.get("ItemResponse", auth=True)
+    second = service.get("ItemResponse", auth=True)
+
+    for code in (200, 400, 401, 404, 500):
+        assert first[code]["model"] is second[code]["model"]
+    assert first[200]["model"] is not first[404]["model"]
+
+    stats = registry.stats()
+    assert stats.built == 5
+    assert stats.reused == 5
+
+
+def test_registry_keys_on_message_and_model():
+    registry = ResponseRegistry()
+    service = ServiceResponse(Item, registry=registry)
+
+    items = service.get("ItemResponse", obj="Item")
+    users = service.get("ItemResponse", obj="User", model=list[Item])
+
+    assert items[404]["model"] is not users[404]["model"]
+    assert items[200]["model"] is not users[200]["model"]
+    assert items[400]["model"] is users[400]["model"]
+
+
+def test_registry_disabled_builds_every_time():
+    registry = ResponseRegistry(enabled=False)
+    service = ServiceResponse(Item, registry=registry)
+
+    first = service.pagination("ItemResponse")
+    second = service.pagination("ItemResponse")
+
+    assert first[200]["model"] is not second[200]["model"]
+    assert registry.stats().reused == 0
+    assert registry.stats().size == 0
+
+
+def test_cursor_pagination_response():
+    service = ServiceResponse(Item, registry=ResponseRegistry())
+    model = service.cursor_pagination("ItemResponse")[200]["model"]
+
+    body = model(data=Item(name="a"), next_cursor="abc")
+    assert body.size == 10
+    assert (body.next_cursor, body.prev_cursor) == ("abc", None)
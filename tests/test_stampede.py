@@ -0,0 +1,213 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("redis")
+
+from typica.connection import RedisConnectionMeta  # noqa: E402
+from typica.modules.redis import RedisConnector  # noqa: E402
+from typica.modules.stampede import (  # noqa: E402
+    _ACQUIRE,
+    _RELEASE,
+    _WRITE,
+    RedisLock,
+    SingleFlight,
+    StampedeGuard,
+    should_refresh,
+)
+
+
+class FakeScriptRedis:
+    """
+    In-memory stand-in for the commands used by the stampede guard.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+        self.pttls: dict = {}
+        self.lock = threading.Lock()
+        self.registered: list[str] = []
+
+    def hmget(self, key, fields):
+        entry = self.data.get(key, {})
+        return [entry.get(field) for field in fields]
+
+    def register_script(self, source):
+        self.registered.append(source)
+
+        def acquire(keys, args):
+            with self.lock:
+                if keys[0] in self.data:
+                    return None
+                fence = self.data.setdefault(keys[1], {})
+                token = int(fence.get("n", 0)) + 1
+                fence["n"] = str(token).encode()
+                if self.pttls.get(keys[1], -1) < int(args[0]):
+                    self.pttls[keys[1]] = int(args[0])
+                self.data[keys[0]] = str(token).encode()
+                return token
+
+        def release(keys, args):
+            with self.lock:
+                if self.data.get(keys[0]) == str(args[0]).encode():
+                    del self.data[keys[0]]
+                    return 1
+                return 0
+
+        def write(keys, args):
+            with self.lock:
+                entry = self.data.get(keys[0], {})
+                if int(entry.get("f", 0)) > int(args[0]):
+                    return 0
+                self.data[keys[0]] = {
+                    **entry,
+                    "v": args[1],
+                    "d": str(args[2]).encode(),
+                    "e": str(args[3]).encode(),
+                    "f": str(args[0]).encode(),
+                }
+                self.pttls[keys[0]] = int(args[4])
+                return 1
+
+        return {_ACQUIRE: acquire, _RELEASE: release, _WRITE: write}[source]
+
+
+META = RedisConnectionMeta(host="localhost", port=6379, database=0)
+
+
+def connector(client: FakeScriptRedis) -> RedisConnector:
+    conn = RedisConnector(META)
+    conn._client = client  # type: ignore[assignment]
+    return conn
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = []
+    gate = threading.Event()
+
+    def compute():
+        calls.append(1)
+        gate.wait(1)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", compute)))
+        for _ in range(16)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 16
+    assert len(calls) == 1
+    assert "k" not in flight
+
+
+def test_single_flight_propagates_errors():
+    flight = SingleFlight()
+    with pytest.raises(RuntimeError):
+        flight.do("k", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    assert flight.do("k", lambda: 1) == 1
+
+
+def test_lock_fencing_token_increases():
+    conn = connector(FakeScriptRedis())
+    first = RedisLock(conn, "lock")
+    assert first.acquire()
+    assert not RedisLock(conn, "lock").acquire()
+    token = first.token
+    assert first.release()
+
+    second = RedisLock(conn, "lock")
+    assert second.acquire()
+    assert second.token == token + 1  # type: ignore[operator]
+
+
+def test_lock_fence_expires_and_ignores_contention():
+    client = FakeScriptRedis()
+    conn = connector(client)
+    holder = RedisLock(conn, "lock", lease=2.5)
+    assert holder.acquire()
+    for _ in range(5):
+        assert not RedisLock(conn, "lock", lease=2.5).acquire()
+
+    # ? failed attempts draw no token, and the counter expires after the lease
+    assert client.data["lock:fence"] == {"n": b"1"}
+    assert client.pttls["lock:fence"] == 2_500
+
+
+def test_should_refresh():
+    now = time.time()
+    assert should_refresh(1.0, now - 1, now=now)
+    assert not should_refresh(0.0, now + 60, now=now)
+
+
+def test_guard_computes_once_across_workers():
+    client = FakeScriptRedis()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"value": 1}
+
+    # ? one guard per simulated process, sharing the same Redis
+    guards = [StampedeGuard(connector(client), beta=0, poll_interval=0.01) for _ in range(4)]
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda guard=guard: results.append(
+                guard.get_or_compute("hot", compute, dict[str, int])
+            )
+        )
+        for guard in guards
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"value": 1}] * 32
+    assert guards[0].get_or_compute("hot", compute, dict[str, int]) == {"value": 1}
+    assert len(calls) == 1
+
+
+def test_guard_rejects_stale_fencing_token():
+    client = FakeScriptRedis()
+    guard = StampedeGuard(connector(client), beta=0)
+    guard._compute("k", lambda: 2, int, None, token=5)
+    guard._compute("k", lambda: 1, int, None, token=3)
+    assert guard.get_or_compute("k", lambda: 0, int) == 2
+
+
+def test_guard_registers_scripts_once():
+    client = FakeScriptRedis()
+    conn = connector(client)
+    guard = StampedeGuard(conn, beta=0)
+    for key in ("a", "b", "c"):
+        assert guard.get_or_compute(key, lambda: 1, int) == 1
+    assert sorted(client.registered) == sorted([_ACQUIRE, _RELEASE, _WRITE])
+
+    # ? a reconnected connector gets its scripts registered again
+    other = FakeScriptRedis()
+    conn._client = other  # type: ignore[assignment]
+    guard.get_or_compute("d", lambda: 1, int)
+    assert len(other.registered) == 3
+
+
+def test_guard_keeps_the_fence_in_the_entry():
+    client = FakeScriptRedis()
+    guard = StampedeGuard(connector(client), ttl=60, lease=5, beta=0)
+    guard.get_or_compute("k", lambda: 1, int)
+
+    assert set(client.data) == {"typica:sf:k"}
+    assert client.data["typica:sf:k"]["n"] == client.data["typica:sf:k"]["f"] == b"1"
+    assert client.pttls["typica:sf:k"] == 60_000
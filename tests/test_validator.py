@@ -0,0 +1,68 @@
+import gc
+import weakref
+
+from datetime import datetime
+
+import pytest
+
+from pydantic import ValidationError
+
+from typica.metadata import SchemaMeta, SchemaRawMeta, Schemas
+from typica.validator import SchemaCompiler, field_type, schema_fingerprint
+
+SCHEMAS = Schemas(
+    [
+        SchemaMeta(field_name="id", field_type="Int64", field_required=True),
+        SchemaMeta(field_name="name", field_type="varchar(255)", field_alias="Name"),
+        SchemaMeta(field_name="created at", field_type="Nullable(DateTime)", field_alias="createdAt"),
+        SchemaMeta(field_name="secret", field_type="str", field_hide=True),
+    ]
+)
+
+
+def test_field_types():
+    assert field_type("LowCardinality(Nullable(String))") is str
+    assert field_type("int|str") == int | str
+    assert field_type("geometry") is field_type(None)
+
+
+def test_fingerprint_ignores_profile_stats():
+    raw = Schemas([SchemaRawMeta(**meta.model_dump(), none_percentage=12.5) for meta in SCHEMAS])
+    assert schema_fingerprint(raw) == schema_fingerprint(SCHEMAS)
+
+
+def test_compile_is_cached():
+    compiler = SchemaCompiler()
+    model = compiler.compile(SCHEMAS)
+    assert compiler.compile(Schemas(list(SCHEMAS))) is model
+    assert compiler.compile(SCHEMAS, name="Other") is not model
+
+
+def test_validate_and_dump():
+    compiler = SchemaCompiler()
+    rows = compiler.validate(
+        SCHEMAS,
+        [
+            {"id": "1", "name": "a", "created at": "2024-01-01T00:00:00", "secret": "s"},
+            {"id": 2, "Name": "b", "createdAt": None},
+        ],
+    )
+    assert rows[0].id == 1 and rows[1].name == "b"
+    assert rows[0].field_2 == datetime(2024, 1, 1)
+    assert compiler.dump(SCHEMAS, rows) == [
+        {"id": 1, "Name": "a", "createdAt": datetime(2024, 1, 1)},
+        {"id": 2, "Name": "b", "createdAt": None},
+    ]
+    with pytest.raises(ValidationError):
+        compiler.validate(SCHEMAS, [{"name": "missing id"}])
+
+
+def test_evicted_models_are_released():
+    compiler = SchemaCompiler(maxsize=1)
+    compiler.validate(SCHEMAS, [{"id": 1}])
+    evicted = weakref.ref(compiler.compile(SCHEMAS))
+    compiler.compile(Schemas(list(SCHEMAS)[:1]))
+
+    gc.collect()
+
+    assert evicted() is None
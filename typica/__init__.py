@@ -1,5 +1,239 @@
-from .base import *
-from .connection import *
-from .utils import *
-from .response import *
-from .schema import *
+"""
+The public API is loaded on first access, so ``import typica`` costs no
+pydantic import; connector modules under ``typica.modules`` are never
+imported from here.
+"""
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import re
+    import uuid
+
+    from datetime import datetime
+    from enum import Enum
+    from typing import Optional
+
+    from pydantic import BaseModel, Field, create_model, model_validator
+
+    from . import base, connection, response, schema, utils
+    from .base import (
+        ModelT,
+        TimeOrderedIdGenerator,
+        id_generator,
+        uuid7,
+        ulid,
+        StringIdentifier,
+        StringIdentifier_,
+        UUIDIdentifier,
+        UUIDIdentifier_,
+        UUID7Identifier,
+        UUID7Identifier_,
+        ULIDIdentifier,
+        ULIDIdentifier_,
+        CreationMeta,
+        type_adapter,
+        iter_validate_many,
+        validate_many,
+    )
+    from .connection import (
+        ParsedURI,
+        parse_uri,
+        EndpointMeta,
+        AuthMeta,
+        URIConnectionMeta,
+        DBConnectionMeta,
+        ClusterConnectionMeta,
+        S3ConnectionMeta,
+        RedisConnectionMeta,
+        RMQConnectionMeta,
+    )
+    from .utils import (
+        EnumV2,
+        Operator,
+        FilterOption,
+        CountStrategy,
+        LocationLevel,
+        MedallionTypes,
+        ProjectConfig,
+        config,
+        enums,
+    )
+    from .response import (
+        BaseResponseMeta,
+        PaginationResponseMeta,
+        CursorPaginationResponseMeta,
+        ResponseRegistryStats,
+        ResponseRegistry,
+        response_registry,
+        ServiceResponse,
+    )
+    from .schema import (
+        PaginationSchema,
+        OrderSchema,
+        FilterValueSchema,
+        FilterSchema,
+        FilterOpsSchema,
+        FilterGroupSchema,
+        CursorPaginationSchema,
+    )
+
+_EXPORTS = {
+    ".base": [
+        "ModelT",
+        "TimeOrderedIdGenerator",
+        "id_generator",
+        "uuid7",
+        "ulid",
+        "StringIdentifier",
+        "StringIdentifier_",
+        "UUIDIdentifier",
+        "UUIDIdentifier_",
+        "UUID7Identifier",
+        "UUID7Identifier_",
+        "ULIDIdentifier",
+        "ULIDIdentifier_",
+        "CreationMeta",
+        "type_adapter",
+        "iter_validate_many",
+        "validate_many",
+    ],
+    ".connection": [
+        "ParsedURI",
+        "parse_uri",
+        "EndpointMeta",
+        "AuthMeta",
+        "URIConnectionMeta",
+        "DBConnectionMeta",
+        "ClusterConnectionMeta",
+        "S3ConnectionMeta",
+        "RedisConnectionMeta",
+        "RMQConnectionMeta",
+    ],
+    ".utils": [
+        "EnumV2",
+        "Operator",
+        "FilterOption",
+        "CountStrategy",
+        "LocationLevel",
+        "MedallionTypes",
+        "ProjectConfig",
+    ],
+    ".response": [
+        "BaseResponseMeta",
+        "PaginationResponseMeta",
+        "CursorPaginationResponseMeta",
+        "ResponseRegistryStats",
+        "ResponseRegistry",
+        "response_registry",
+        "ServiceResponse",
+    ],
+    ".schema": [
+        "PaginationSchema",
+        "OrderSchema",
+        "FilterValueSchema",
+        "FilterSchema",
+        "FilterOpsSchema",
+        "FilterGroupSchema",
+        "CursorPaginationSchema",
+    ],
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [
+    # ? .base
+    "ModelT",
+    "TimeOrderedIdGenerator",
+    "id_generator",
+    "uuid7",
+    "ulid",
+    "StringIdentifier",
+    "StringIdentifier_",
+    "UUIDIdentifier",
+    "UUIDIdentifier_",
+    "UUID7Identifier",
+    "UUID7Identifier_",
+    "ULIDIdentifier",
+    "ULIDIdentifier_",
+    "CreationMeta",
+    "type_adapter",
+    "iter_validate_many",
+    "validate_many",
+    # ? .connection
+    "ParsedURI",
+    "parse_uri",
+    "EndpointMeta",
+    "AuthMeta",
+    "URIConnectionMeta",
+    "DBConnectionMeta",
+    "ClusterConnectionMeta",
+    "S3ConnectionMeta",
+    "RedisConnectionMeta",
+    "RMQConnectionMeta",
+    # ? .utils
+    "EnumV2",
+    "Operator",
+    "FilterOption",
+    "CountStrategy",
+    "LocationLevel",
+    "MedallionTypes",
+    "ProjectConfig",
+    # ? .response
+    "BaseResponseMeta",
+    "PaginationResponseMeta",
+    "CursorPaginationResponseMeta",
+    "ResponseRegistryStats",
+    "ResponseRegistry",
+    "response_registry",
+    "ServiceResponse",
+    # ? .schema
+    "PaginationSchema",
+    "OrderSchema",
+    "FilterValueSchema",
+    "FilterSchema",
+    "FilterOpsSchema",
+    "FilterGroupSchema",
+    "CursorPaginationSchema",
+    # ? names the former star imports re-exported as a side effect
+    "Any",
+    "BaseModel",
+    "Enum",
+    "Field",
+    "Optional",
+    "create_model",
+    "datetime",
+    "model_validator",
+    "re",
+    "uuid",
+    "base",
+    "config",
+    "connection",
+    "enums",
+    "response",
+    "schema",
+    "utils",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    if f".{name}" in _EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    if not name.startswith("_"):
+        # ? names the former star imports re-exported as a side effect, e.g. BaseModel
+        for module in reversed(_EXPORTS):
+            imported = importlib.import_module(module, __name__)
+            if name in vars(imported) or name in getattr(imported, "__all__", ()):
+                return getattr(imported, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,144 @@
+import os
+import time
 import uuid
+import threading
+import weakref
 
-from typing import Optional
-from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+from datetime import datetime, timezone
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RAND_MASK = (1 << 74) - 1
+
+
+class TimeOrderedIdGenerator:
+    """
+    Generator of time-ordered identifiers (UUIDv7 and ULID).
+
+    Random bits are read from ``os.urandom`` in bulk and sliced per id.
+    Identifiers created within the same millisecond are monotonic: the
+    random part is incremented instead of redrawn.
+    """
+
+    _instances: "weakref.WeakSet[TimeOrderedIdGenerator]" = weakref.WeakSet()
+
+    def __init__(self, pool_size: int = 4096) -> None:
+        """
+        :param pool_size: The number of identifiers served per ``os.urandom`` call.
+        """
+        self._pool_bytes = 10 * pool_size
+        self._lock = threading.Lock()
+        self.reset()
+        TimeOrderedIdGenerator._instances.add(self)
+
+    def reset(self) -> None:
+        """
+        Drop the buffered random bytes and the monotonic state.
+        Called in forked children, so they never replay the parent's bytes.
+        """
+        self._buffer = b""
+        self._offset = 0
+        self._last_ms = -1
+        self._last_rand = 0
+
+    def _random(self) -> int:
+        if self._offset >= len(self._buffer):
+            self._buffer = os.urandom(self._pool_bytes)
+            self._offset = 0
+        start = self._offset
+        self._offset += 10
+        return int.from_bytes(self._buffer[start : start + 10], "big")
+
+    def next_raw(self) -> tuple[int, int]:
+        """
+        Return the next (unix millisecond, 80 random bits) pair.
+        """
+        with self._lock:
+            ms = time.time_ns() // 1_000_000
+            if ms <= self._last_ms:
+                ms = self._last_ms
+                rand = self._last_rand + 1
+                if not rand & _RAND_MASK:
+                    ms += 1
+                    rand = self._random()
+            else:
+                rand = self._random()
+            self._last_ms = ms
+            self._last_rand = rand
+            return ms, rand
+
+    def uuid7(self) -> uuid.UUID:
+        """
+        Return a new UUIDv7 (RFC 9562): 48-bit unix ms timestamp, 74 random bits.
+        """
+        ms, rand = self.next_raw()
+        rand &= _RAND_MASK
+        value = (
+            (ms & 0xFFFFFFFFFFFF) << 80
+            | 0x7 << 76
+            | (rand >> 62) << 64
+            | 0b10 << 62
+            | (rand & 0x3FFFFFFFFFFFFFFF)
+        )
+        return uuid.UUID(int=value)
+
+    def ulid(self) -> str:
+        """
+        Return a new ULID: 48-bit unix ms timestamp and 80 random bits,
+        encoded as 26 characters of Crockford base32.
+        """
+        ms, rand = self.next_raw()
+        value = (ms & 0xFFFFFFFFFFFF) << 80 | rand
+        chars = []
+        for _ in range(26):
+            chars.append(_CROCKFORD[value & 0x1F])
+            value >>= 5
+        return "".join(reversed(chars))
+
+    def uuid7_many(self, size: int) -> list[uuid.UUID]:
+        """
+        Return ``size`` UUIDv7 in ascending order.
+        """
+        return [self.uuid7() for _ in range(size)]
+
+    def ulid_many(self, size: int) -> list[str]:
+        """
+        Return ``size`` ULIDs in ascending order.
+        """
+        return [self.ulid() for _ in range(size)]
+
+
+def _reset_generators() -> None:
+    for generator in list(TimeOrderedIdGenerator._instances):
+        generator._lock = threading.Lock()
+        generator.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_generators)
+
+id_generator = TimeOrderedIdGenerator()
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Return a new time-ordered UUIDv7 from the shared generator.
+    """
+    return id_generator.uuid7()
+
+
+def ulid() -> str:
+    """
+    Return a new time-ordered ULID string from the shared generator.
+    """
+    return id_generator.ulid()
 
 
 class StringIdentifier(BaseModel):
@@ -17,49 +152,111 @@ class StringIdentifier_(BaseModel):
 class UUIDIdentifier(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, description="Identifier of data with UUID format", examples=['f82192c2460965cd0a9ce68305c1969a4'])
 
-    @model_validator(mode="before")
-    def validate_uuid(cls, values):
-        """
-        Validate if id is str, then convert to uuid.UUID
-        """
-        
-        if isinstance(values.get("id"), str):
-            values["id"] = uuid.UUID(values["id"])
-        return values
-
 
 class UUIDIdentifier_(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, alias='_id', description='Identifier of data with UUID format', examples=['f82192c2460965cd0a9ce68305c1969a4'])
-
-    @model_validator(mode="before")
-    def validate_uuid(cls, values):
-        """
-        Validate if _id is str, then convert to uuid.UUID
-        """
-        if isinstance(values.get("_id"), str):
-            values["_id"] = uuid.UUID(values["_id"])
-        return values
     
 
+class UUID7Identifier(BaseModel):
+    id: uuid.UUID = Field(default_factory=uuid7, description="Identifier of data with time-ordered UUIDv7 format", examples=['01929b4e-6f3a-7c1d-9a4b-3f0e2d1c5b6a'])
+
+
+class UUID7Identifier_(BaseModel):
+    id: uuid.UUID = Field(default_factory=uuid7, alias='_id', description="Identifier of data with time-ordered UUIDv7 format", examples=['01929b4e-6f3a-7c1d-9a4b-3f0e2d1c5b6a'])
+
+
+class ULIDIdentifier(BaseModel):
+    id: str = Field(default_factory=ulid, description="Identifier of data with time-ordered ULID string", examples=['01JAHMWVSTF0XQ3J1N8DKCZ9RT'])
+
+
+class ULIDIdentifier_(BaseModel):
+    id: str = Field(default_factory=ulid, alias='_id', description="Identifier of data with time-ordered ULID string", examples=['01JAHMWVSTF0XQ3J1N8DKCZ9RT'])
+
+
 class CreationMeta(BaseModel):
+    """
+    ``created_at`` accepts datetimes, ISO strings and epoch seconds or
+    milliseconds; the parsing is done by pydantic-core. The result is
+    always a UTC-aware datetime, naive values are taken as UTC, the same
+    as the vectorized path in ``typica.modules.nptime``.
+    """
+
     created_at: Optional[datetime] = Field(
-        default_factory=datetime.now, description="When data was created", examples=['2022-08-08T00:00:00.000000+00:00', 1661416000, 1661416000000]
+        default_factory=lambda: datetime.now(timezone.utc), description="When data was created", examples=['2022-08-08T00:00:00.000000+00:00', 1661416000, 1661416000000]
     )
     created_by: Optional[str] = Field(None, description="Whos created the data")
 
-    @model_validator(mode="before")
-    def validate_created_at(cls, values):
+    @field_validator("created_at")
+    @classmethod
+    def as_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
         """
-        Validate if created_at is str, then convert to datetime
-        If created_at is int, then convert to datetime using fromtimestamp
-        If created_at is int and length is more than 10, then divide by 1000 first
+        Convert ``created_at`` to UTC, attaching UTC to naive datetimes.
         """
-        if isinstance(values.get("created_at"), str):
-            values["created_at"] = datetime.fromisoformat(values["created_at"])
-        if isinstance(values.get("created_at"), int):
-            if str(values["created_at"]).__len__() <= 10:
-                values["created_at"] = datetime.fromtimestamp(values["created_at"])
-            else:
-                values["created_at"] = datetime.fromtimestamp(int(values["created_at"] / 1000))
-        return values
-    
\ No newline at end of file
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=512)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """
+    Return a cached TypeAdapter for the given type.
+
+    :param tp: The type to validate, e.g. ``list[UUIDIdentifier]``
+    :return: The TypeAdapter shared by every caller in the process, the
+        least recently used of more than 512 types is rebuilt on demand
+    """
+    return TypeAdapter(tp)
+
+
+def iter_validate_many(
+    model: type[ModelT],
+    rows: Iterable[Any],
+    chunk_size: int = 10_000,
+    adapter: Optional[TypeAdapter] = None,
+) -> Iterator[list[ModelT]]:
+    """
+    Validate raw rows into models in chunks, yielding each validated chunk.
+
+    :param model: The model to validate the rows into
+    :param rows: A list or any iterable of raw dicts (or models)
+    :param chunk_size: The number of rows validated per call into pydantic-core
+    :param adapter: The TypeAdapter of ``list[model]``, defaults to the cached one
+    :return: An iterator of lists of validated models
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    if adapter is None:
+        adapter = type_adapter(list[model])  # type: ignore[valid-type]
+    if isinstance(rows, (list, tuple)):
+        for start in range(0, len(rows), chunk_size):
+            yield adapter.validate_python(rows[start : start + chunk_size])
+        return
+
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield adapter.validate_python(chunk)
+
+
+def validate_many(
+    model: type[ModelT],
+    rows: Iterable[Any],
+    chunk_size: int = 10_000,
+    adapter: Optional[TypeAdapter] = None,
+) -> list[ModelT]:
+    """
+    Validate raw rows into a list of models.
+
+    :param model: The model to validate the rows into
+    :param rows: A list or any iterable of raw dicts (or models)
+    :param chunk_size: The number of rows validated per call into pydantic-core
+    :param adapter: The TypeAdapter of ``list[model]``, defaults to the cached one
+    :return: The list of validated models
+    """
+    result: list[ModelT] = []
+    for chunk in iter_validate_many(model, rows, chunk_size, adapter):
+        result.extend(chunk)
+    return result
@@ -0,0 +1,190 @@
+import os
+import threading
+
+from collections import deque
+from typing import Any, Iterable, Iterator, Optional
+
+from .base import type_adapter
+from .loader import LazyMetadata, MetadataRecord, load_json
+from .metadata import FullMetadata
+
+INDEXED_FIELDS = ("medalion_type", "category", "country", "location_level")
+
+
+def _key(value: Any) -> Any:
+    # ? enums are indexed by value so lookups accept either form
+    return getattr(value, "value", value)
+
+
+class MetadataCatalog:
+    """
+    In-memory catalog of ``FullMetadata`` or ``LazyMetadata`` with
+    secondary hash indexes and a lineage graph.
+
+    - ``find`` intersects the indexes of ``medalion_type``, ``category``,
+      ``country`` and ``location_level``, smallest first.
+    - ``upstream`` and ``downstream`` walk the ``parents_id`` adjacency
+      lists, visiting only the records they return.
+    - ``add`` and ``remove`` update the indexes and the graph incrementally.
+    - ``save`` and ``load`` snapshot the records to a JSON file.
+    """
+
+    def __init__(self, records: Iterable[MetadataRecord] = ()) -> None:
+        self.records: dict[str, MetadataRecord] = {}
+        self.indexes: dict[str, dict[Any, set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self.parents: dict[str, set[str]] = {}
+        self.children: dict[str, set[str]] = {}
+        self._order: dict[str, int] = {}
+        self._sequence = 0
+        self._lock = threading.RLock()
+        self.add_many(records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.records
+
+    def __iter__(self) -> Iterator[MetadataRecord]:
+        return iter(list(self.records.values()))
+
+    def get(self, id: str) -> Optional[MetadataRecord]:
+        return self.records.get(id)
+
+    def add(self, record: MetadataRecord) -> None:
+        """
+        Add a record, replacing the record with the same id.
+        """
+        with self._lock:
+            if record.id in self.records:
+                self._unlink(self.records[record.id])
+            else:
+                self._order[record.id] = self._sequence
+                self._sequence += 1
+            self.records[record.id] = record
+            for field in INDEXED_FIELDS:
+                self.indexes[field].setdefault(_key(getattr(record, field)), set()).add(record.id)
+            parents = set(record.parents_id or ())
+            self.parents[record.id] = parents
+            for parent in parents:
+                self.children.setdefault(parent, set()).add(record.id)
+
+    def add_many(self, records: Iterable[MetadataRecord]) -> None:
+        with self._lock:
+            for record in records:
+                self.add(record)
+
+    def remove(self, id: str) -> Optional[MetadataRecord]:
+        """
+        Remove a record. Its children keep their ``parents_id``, so the
+        lineage still reaches them if the record is added back.
+
+        :return: The removed record, or None if missing.
+        """
+        with self._lock:
+            record = self.records.pop(id, None)
+            if record is not None:
+                self._unlink(record)
+                del self._order[id]
+            return record
+
+    def _unlink(self, record: MetadataRecord) -> None:
+        for field in INDEXED_FIELDS:
+            index = self.indexes[field]
+            key = _key(getattr(record, field))
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(record.id)
+                if not ids:
+                    del index[key]
+        for parent in self.parents.pop(record.id, ()):
+            children = self.children.get(parent)
+            if children is not None:
+                children.discard(record.id)
+                if not children:
+                    del self.children[parent]
+
+    def find(self, **criteria: Any) -> list[MetadataRecord]:
+        """
+        Return the records matching every criterion, e.g.
+        ``find(medalion_type=MedallionTypes.GOLD, country="ID")``.
+
+        :param criteria: Values of the indexed fields, enums or their values.
+        :return: The matching records, in insertion order.
+        :raises ValueError: If a field is not indexed.
+        """
+        unknown = criteria.keys() - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Fields are not indexed: {', '.join(sorted(unknown))}")
+        with self._lock:
+            if not criteria:
+                return list(self.records.values())
+            matches = sorted(
+                (self.indexes[field].get(_key(value), set()) for field, value in criteria.items()),
+                key=len,
+            )
+            ids = matches[0].intersection(*matches[1:])
+            return [self.records[id] for id in sorted(ids, key=self._order.__getitem__)]
+
+    def _walk(self, edges: dict[str, set[str]], id: str, depth: Optional[int]) -> list[str]:
+        seen = {id}
+        result: list[str] = []
+        queue = deque([(id, 0)])
+        with self._lock:
+            while queue:
+                node, level = queue.popleft()
+                if depth is not None and level >= depth:
+                    continue
+                for neighbour in edges.get(node, ()):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        result.append(neighbour)
+                        queue.append((neighbour, level + 1))
+        return result
+
+    def upstream(self, id: str, depth: Optional[int] = None) -> list[str]:
+        """
+        Return the ids of every ancestor, nearest first.
+
+        Parents that are not in the catalog are included, but not walked further.
+
+        :param id: The record id.
+        :param depth: The maximum number of hops, None for the full closure.
+        """
+        return self._walk(self.parents, id, depth)
+
+    def downstream(self, id: str, depth: Optional[int] = None) -> list[str]:
+        """
+        Return the ids of every descendant, nearest first.
+
+        :param id: The record id.
+        :param depth: The maximum number of hops, None for the full closure.
+        """
+        return self._walk(self.children, id, depth)
+
+    def save(self, path: str) -> None:
+        """
+        Write the records to a JSON snapshot, replacing the file atomically.
+
+        Default values are left out, which halves the file and its parse time.
+        """
+        with self._lock:
+            records = [
+                record.to_full() if isinstance(record, LazyMetadata) else record
+                for record in self.records.values()
+            ]
+        payload = type_adapter(list[FullMetadata]).dump_json(records, exclude_defaults=True)
+        temp = f"{path}.tmp"
+        with open(temp, "wb") as file:
+            file.write(payload)
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path: str, lazy: bool = False) -> "MetadataCatalog":
+        """
+        Build a catalog from a snapshot written by ``save``.
+
+        :param path: The snapshot path.
+        :param lazy: Load ``LazyMetadata`` records, see ``typica.loader``.
+        """
+        return cls(load_json(path, lazy))
@@ -0,0 +1,108 @@
+from typing import Any, Callable, NamedTuple, Optional
+
+from .utils.enums import CountStrategy
+from .utils.keys import key_digest
+from .utils.lru import LRUCache
+
+
+class TotalCount(NamedTuple):
+    total: Optional[int]
+    strategy: CountStrategy
+    has_more: Optional[bool]
+
+    def meta(self) -> dict[str, Any]:
+        """
+        Return the fields of ``PaginationResponseMeta`` describing the count.
+        """
+        return {
+            "total": self.total,
+            "count_strategy": self.strategy.value,
+            "has_more": self.has_more,
+        }
+
+
+def count_key(*parts: Any) -> str:
+    """
+    Build the cache key of a count, e.g. from a table name and its filters.
+
+    :return: The key, equal for equal parts.
+    """
+    return key_digest(parts)
+
+
+class PaginationCounter:
+    """
+    Resolve the total of a paginated response with a selectable strategy.
+
+    - ``exact`` runs the exact count every time.
+    - ``estimated`` runs a cheap estimate, e.g. ``compile_estimated_count_sql``
+      or Mongo ``estimated_document_count``; filters are ignored.
+    - ``cached`` runs the exact count once per key and time to live.
+    - ``has_more`` runs no count; the page query fetches ``size + 1`` rows
+      and the extra row tells whether another page exists.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 60.0) -> None:
+        """
+        :param maxsize: The maximum number of cached counts.
+        :param ttl: Time to live of a cached count in seconds.
+        """
+        self.cache: LRUCache[int] = LRUCache(maxsize, ttl)
+
+    def count(
+        self,
+        strategy: CountStrategy | str,
+        exact: Callable[[], int],
+        estimated: Optional[Callable[[], int]] = None,
+        key: Optional[str] = None,
+        page: int = 1,
+        size: int = 10,
+        fetched: Optional[int] = None,
+    ) -> TotalCount:
+        """
+        Return the total and whether another page exists.
+
+        :param strategy: The count strategy.
+        :param exact: Runs the exact count.
+        :param estimated: Runs the estimate, required for ``estimated``.
+        :param key: The cache key, required for ``cached``, see ``count_key``.
+        :param page: The current page.
+        :param size: The page size.
+        :param fetched: The rows fetched with a ``size + 1`` limit, required
+                        for ``has_more``.
+        :return: The total, the strategy used and ``has_more``.
+        """
+        strategy = CountStrategy(strategy)
+        has_more = None if fetched is None else fetched > size
+
+        if strategy is CountStrategy.has_more:
+            if has_more is None:
+                raise ValueError("has_more needs the number of fetched rows")
+            return TotalCount(None, strategy, has_more)
+
+        if strategy is CountStrategy.estimated:
+            if estimated is None:
+                raise ValueError("estimated needs an estimate function")
+            total = int(estimated())
+        elif strategy is CountStrategy.cached:
+            if key is None:
+                raise ValueError("cached needs a cache key")
+            total = self.cache.get(key)
+            if total is None:
+                total = int(exact())
+                self.cache.set(key, total)
+        else:
+            total = int(exact())
+
+        if has_more is None:
+            has_more = page * size < total
+        return TotalCount(total, strategy, has_more)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Forget one cached count, or all of them.
+        """
+        if key is None:
+            self.cache.clear()
+        else:
+            self.cache.delete(key)
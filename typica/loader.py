@@ -0,0 +1,269 @@
+import gc
+import mmap
+
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    SerializationInfo,
+    create_model,
+    model_serializer,
+    model_validator,
+)
+
+from pydantic.functional_validators import ModelWrapValidatorHandler
+
+from .base import type_adapter
+from .metadata import DatabaseAccess, FullMetadata, LakeAccess, Schemas
+
+LAZY_FIELDS: dict[str, Any] = {
+    "schemas": Schemas,
+    "database_access": DatabaseAccess,
+    "lake_access": Optional[LakeAccess],
+}
+
+
+@lru_cache(maxsize=None)
+def _partial_model(names: tuple[str, ...]) -> type[BaseModel]:
+    """
+    Return a model validating only the given ``FullMetadata`` fields of a
+    record, ignoring the others.
+    """
+    fields = FullMetadata.model_fields
+    definitions: dict[str, Any] = {name: (fields[name].annotation, fields[name]) for name in names}
+    return create_model("_Metadata_" + "_".join(names), __config__=ConfigDict(extra="ignore"), **definitions)
+
+
+def _head_model() -> type[BaseModel]:
+    return _partial_model(tuple(name for name in FullMetadata.model_fields if name not in LAZY_FIELDS))
+
+
+class LazyMetadata(_head_model()):  # type: ignore[misc]
+    """
+    Metadata record with the fields of ``FullMetadata``, whose ``schemas``,
+    ``database_access`` and ``lake_access`` are validated on first access.
+
+    Records loaded by ``iter_jsonl`` keep their JSON line and validate only
+    the other fields up front, so pydantic-core skips building the nested
+    values; records validated directly keep them as parsed JSON.
+    ``decode`` validates every field left, and serialization decodes first.
+
+    It is not a ``FullMetadata`` subclass: a parent model typed with
+    ``FullMetadata`` would serialize it with the ``FullMetadata`` fields
+    and drop the undecoded ones. Use ``to_full`` where a ``FullMetadata``
+    is expected; validation into a ``FullMetadata`` field rejects it.
+    """
+
+    # ? parsed JSON values of the lazy fields given to model validation
+    _raw: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # ? JSON line the lazy fields are validated from, dropped once all are decoded
+    _source: Optional[bytes] = PrivateAttr(None)
+    _decoded: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # ? lazy fields present in the input, for exclude_unset
+    _lazy_set: set[str] = PrivateAttr(default_factory=set)
+
+    if TYPE_CHECKING:
+        # ? the head fields come from a model built at import time
+        def __getattr__(self, name: str) -> Any: ...
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _keep_raw(cls, data: Any, handler: ModelWrapValidatorHandler["LazyMetadata"]) -> "LazyMetadata":
+        record = handler(data)
+        if isinstance(data, dict):
+            missing = [name for name in LAZY_FIELDS if name not in data and FullMetadata.model_fields[name].is_required()]
+            if missing:
+                raise ValueError(f"Missing required fields: {', '.join(missing)}")
+            record._raw = {name: data[name] for name in LAZY_FIELDS if name in data}
+            record._lazy_set = set(record._raw)
+        return record
+
+    @classmethod
+    def from_head(cls, head: BaseModel, source: bytes) -> "LazyMetadata":
+        """
+        Build a record from its validated head fields and its JSON source.
+        """
+        record = cls.model_construct(_fields_set=head.model_fields_set, **dict(head))
+        record._source = source
+        return record
+
+    @property
+    def schemas(self) -> Schemas:
+        return self._field("schemas")
+
+    @property
+    def database_access(self) -> DatabaseAccess:
+        return self._field("database_access")
+
+    @property
+    def lake_access(self) -> Optional[LakeAccess]:
+        return self._field("lake_access")
+
+    def _field(self, name: str) -> Any:
+        if name not in self._decoded:
+            self._decode((name,))
+        return self._decoded[name]
+
+    def _decode(self, names: tuple[str, ...]) -> None:
+        pending = tuple(name for name in names if name not in self._decoded)
+        if self._source is not None and pending:
+            values = _partial_model(pending).model_validate_json(self._source)
+            self._decoded.update((name, getattr(values, name)) for name in pending)
+            self._lazy_set.update(values.model_fields_set)
+        for name in pending:
+            if name in self._raw:
+                self._decoded[name] = type_adapter(LAZY_FIELDS[name]).validate_python(self._raw.pop(name))
+            elif name not in self._decoded:
+                self._decoded[name] = FullMetadata.model_fields[name].get_default(call_default_factory=True)
+        if self._source is not None and len(self._decoded) == len(LAZY_FIELDS):
+            self._source = None
+
+    def decode(self) -> "LazyMetadata":
+        """
+        Validate every field still undecoded.
+
+        :return: The same record.
+        """
+        self._decode(tuple(LAZY_FIELDS))
+        return self
+
+    @model_serializer(mode="plain")
+    def _serialize(self, info: SerializationInfo) -> Any:
+        # ? the lazy fields are not model fields, so dump the record as FullMetadata
+        options: dict[str, Any] = {
+            "mode": info.mode,
+            "include": info.include,
+            "exclude": info.exclude,
+            "by_alias": info.by_alias,
+            "exclude_unset": info.exclude_unset,
+            "exclude_defaults": info.exclude_defaults,
+            "exclude_none": info.exclude_none,
+            "round_trip": info.round_trip,
+        }
+        return self.to_full().model_dump(**options)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyMetadata):
+            other = other.to_full()
+        if isinstance(other, FullMetadata):
+            return self.to_full() == other
+        return NotImplemented
+
+    def to_full(self) -> FullMetadata:
+        """
+        Return the record as a validated ``FullMetadata``.
+        """
+        self.decode()
+        values = {**dict(self), **self._decoded}
+        return FullMetadata.model_construct(
+            _fields_set=self.model_fields_set | self._lazy_set,
+            **{name: values[name] for name in FullMetadata.model_fields},
+        )
+
+
+MetadataRecord = Union[FullMetadata, LazyMetadata]
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector.
+
+    Bulk validation allocates millions of containers, each allocation
+    counting towards a collection that walks every live object and finds
+    nothing to free.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """
+    Iterate over the non-blank lines of a memory-mapped file.
+    """
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # ? empty files cannot be mapped
+            return
+        with mapped:
+            start, size = 0, len(mapped)
+            while start < size:
+                end = mapped.find(b"\n", start)
+                if end < 0:
+                    end = size
+                line = mapped[start:end].strip()
+                if line:
+                    yield line
+                start = end + 1
+
+
+def iter_jsonl(
+    path: str, lazy: bool = False, chunk_size: int = 1000
+) -> Iterator[list[MetadataRecord]]:
+    """
+    Validate a JSON Lines file of metadata in chunks.
+
+    Each chunk of lines is joined into one JSON array and validated by a
+    single call into pydantic-core through the cached TypeAdapter.
+
+    :param path: The file path.
+    :param lazy: Return ``LazyMetadata`` records.
+    :param chunk_size: The number of records validated per call.
+    :return: An iterator of lists of records.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    adapter = type_adapter(list[_head_model() if lazy else FullMetadata])  # type: ignore[misc]
+
+    def validate(chunk: list[bytes]) -> list[MetadataRecord]:
+        records = adapter.validate_json(b"[" + b",".join(chunk) + b"]")
+        if lazy:
+            return [LazyMetadata.from_head(head, line) for head, line in zip(records, chunk)]
+        return records
+
+    chunk: list[bytes] = []
+    for line in iter_lines(path):
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield validate(chunk)
+            chunk = []
+    if chunk:
+        yield validate(chunk)
+
+
+def load_jsonl(path: str, lazy: bool = False, chunk_size: int = 1000) -> list[MetadataRecord]:
+    """
+    Load a JSON Lines file of metadata, see ``iter_jsonl``.
+    """
+    records: list[MetadataRecord] = []
+    with paused_gc():
+        for chunk in iter_jsonl(path, lazy, chunk_size):
+            records.extend(chunk)
+    return records
+
+
+def load_json(path: str, lazy: bool = False) -> list[MetadataRecord]:
+    """
+    Load a JSON array of metadata, e.g. a ``MetadataCatalog`` snapshot,
+    in one validation call.
+
+    :param path: The file path.
+    :param lazy: Return ``LazyMetadata`` records.
+    :return: The records.
+    """
+    adapter = type_adapter(list[LazyMetadata if lazy else FullMetadata])
+    with open(path, "rb") as file:
+        payload = file.read()
+    with paused_gc():
+        return adapter.validate_json(payload)
@@ -1,9 +1,69 @@
-from typing import Optional
+from typing import Annotated, Any, Optional, Union
 
-from pydantic import BaseModel, RootModel, Field
+from pydantic import BaseModel, Discriminator, RootModel, Field, Tag
 
 from .utils import MedallionTypes, LocationLevel
-from .connection import DBConnectionMeta, S3ConnectionMeta, ClusterConnectionMeta
+from .connection import DBConnectionMeta, S3ConnectionMeta, ClusterConnectionMeta, parse_uri
+
+_CONNECTION_TAGS = {
+    S3ConnectionMeta: "s3",
+    ClusterConnectionMeta: "cluster",
+    DBConnectionMeta: "db",
+}
+
+
+def _multi_host(uri: Any) -> bool:
+    if not uri or not isinstance(uri, str):
+        return False
+    try:
+        return len(parse_uri(uri).hosts) > 1
+    except ValueError:
+        # ? left to the validation of the database member to report
+        return False
+
+
+def connection_tag(value: Any) -> str:
+    """
+    Pick the connection meta of a union member in one lookup, instead of
+    validating every member and keeping the best match.
+
+    A ``bucket`` makes an S3 connection; a ``cluster_uri``, or a ``uri``
+    with several hosts, without a ``host`` or ``port`` makes a cluster;
+    anything else a database.
+    """
+    if isinstance(value, dict):
+        if "bucket" in value:
+            return "s3"
+        if "host" not in value and "port" not in value:
+            if "cluster_uri" in value or _multi_host(value.get("uri")):
+                return "cluster"
+        return "db"
+    return _CONNECTION_TAGS.get(type(value), "db")
+
+
+def database_tag(value: Any) -> str:
+    """
+    Like ``connection_tag`` for unions without an S3 member.
+    """
+    return "cluster" if connection_tag(value) == "cluster" else "db"
+
+
+DatabaseAccess = Annotated[
+    Union[
+        Annotated[DBConnectionMeta, Tag("db")],
+        Annotated[ClusterConnectionMeta, Tag("cluster")],
+    ],
+    Discriminator(database_tag),
+]
+
+LakeAccess = Annotated[
+    Union[
+        Annotated[S3ConnectionMeta, Tag("s3")],
+        Annotated[DBConnectionMeta, Tag("db")],
+        Annotated[ClusterConnectionMeta, Tag("cluster")],
+    ],
+    Discriminator(connection_tag),
+]
 
 
 class SchemaMeta(BaseModel):
@@ -58,7 +118,7 @@ class SimplifieMetadata(BaseModel):
     schemas: Schemas = Field(..., description="Description of all fields in data")
 
     # ? Database
-    database_access: DBConnectionMeta | ClusterConnectionMeta
+    database_access: DatabaseAccess
     table_name: str = Field(..., description="Table name in database")
 
 
@@ -88,9 +148,7 @@ class FullMetadata(SimplifieMetadata):
 
     # ? Data lake
     # * Use case: bronze
-    lake_access: Optional[
-        S3ConnectionMeta | DBConnectionMeta | ClusterConnectionMeta
-    ] = Field(None, description="Data lake access")
+    lake_access: Optional[LakeAccess] = Field(None, description="Data lake access")
     lake_meta_path: Optional[str] = Field(None, description="Data lake metadata path")
     lake_data_path: Optional[str] = Field(None, description="Data lake data path")
     lake_data_format: Optional[str] = Field(None, description="Data lake data format")
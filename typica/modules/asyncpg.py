@@ -0,0 +1,221 @@
+import asyncio
+import weakref
+
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Optional, Sequence, cast
+
+import asyncpg
+
+from asyncpg import Connection, Pool, Record
+
+from typica.connection import DBConnectionMeta
+from typica.modules.pool import meta_key
+
+
+# ? keyed on the loop itself: a new loop reusing the id() of a dead one never
+# ? gets its pools, and the entries go with the loop or with close_pools
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Pool]]" = (
+    weakref.WeakKeyDictionary()
+)
+_pools_lock: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def get_pool(
+    meta: DBConnectionMeta, min_size: int = 1, max_size: int = 10, **kwargs: Any
+) -> Pool:
+    """
+    Return the asyncpg pool of the given connection for the running event loop.
+
+    Pools are shared by every connector built from the same meta, and are
+    bound to the loop that created them.
+
+    :param meta: The metadata of the database connection.
+    :param min_size: Connections opened when the pool is created.
+    :param max_size: Maximum connections open at once.
+    :param kwargs: Additional keyword arguments for asyncpg.create_pool.
+    :return: The shared pool.
+    """
+    loop = asyncio.get_running_loop()
+    key = meta_key("postgresql+asyncpg", meta, min_size=min_size, max_size=max_size, **kwargs)
+    pools = _pools.setdefault(loop, {})
+    pool = pools.get(key)
+    if pool is not None:
+        return pool
+
+    async with _pools_lock.setdefault(loop, asyncio.Lock()):
+        pool = pools.get(key)
+        if pool is None:
+            pool = await asyncpg.create_pool(
+                host=meta.host,
+                port=int(meta.port),  # type: ignore
+                user=meta.username,
+                password=meta.password,
+                database=meta.database,
+                min_size=min_size,
+                max_size=max_size,
+                **kwargs,
+            )
+            pools[key] = pool
+        return pool
+
+
+async def close_pools() -> None:
+    """
+    Close every pool created by the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pools = _pools.pop(loop, {})
+    _pools_lock.pop(loop, None)
+    for pool in pools.values():
+        await pool.close()
+
+
+class AsyncPostgreConnector:
+
+    _meta: DBConnectionMeta
+    _pool: Pool
+    _conn: Optional[Connection] = None
+
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        min_size: int = 1,
+        max_size: int = 10,
+        **pool_kwargs: Any,
+    ) -> None:
+        """
+        Initialize the async Postgre connector with the given connection metadata.
+
+        :param meta: The metadata of the database connection.
+        :type meta: DBConnectionMeta
+        :param min_size: Connections opened when the shared pool is created.
+        :param max_size: Maximum connections of the shared pool.
+        :param pool_kwargs: Additional keyword arguments for asyncpg.create_pool.
+        """
+        self._meta = meta
+        self._min_size = min_size
+        self._max_size = max_size
+        self._pool_kwargs = pool_kwargs
+
+    async def __aenter__(self) -> "AsyncPostgreConnector":
+        """
+        Borrow a connection from the pool and return the connector.
+
+        :return: The connector.
+        :rtype: AsyncPostgreConnector
+        :raises ValueError: If the connection to the PostgreSQL server fails.
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Return the connection to the pool.
+
+        This method is called when the context manager exits its scope.
+        """
+        await self.close()
+
+    @property
+    def connection(self) -> Connection:
+        """
+        The borrowed asyncpg connection.
+        """
+        if self._conn is None:
+            raise ValueError("PostgreSQL not connected.")
+        return self._conn
+
+    async def connect(self, timeout: Optional[float] = None) -> None:
+        """
+        Borrow a connection from the shared pool.
+
+        :param timeout: Seconds to wait for a free connection.
+        :raises ValueError: If the connection to the PostgreSQL server fails.
+        :raises Exception: If any other error occurs during the connection.
+        """
+        try:
+            self._pool = await get_pool(
+                self._meta, self._min_size, self._max_size, **self._pool_kwargs
+            )
+            # ? the pool hands out a proxy forwarding every Connection method
+            self._conn = cast(Connection, await self._pool.acquire(timeout=timeout))
+        except (asyncio.TimeoutError, OSError):
+            raise ValueError("PostgreSQL connection failed.")
+        except Exception as e:
+            raise e
+
+    async def close(self) -> None:
+        """
+        Return the connection to the pool.
+
+        This method is a no-op if the connection is already released.
+        """
+        if self._conn is not None:
+            await self._pool.release(self._conn)
+            self._conn = None
+
+    async def execute(self, sql: str, *args: Any) -> str:
+        """
+        Execute a statement with ``$1`` style parameters.
+
+        :return: The status of the last command.
+        """
+        return await self.connection.execute(sql, *args)
+
+    async def fetch(self, sql: str, *args: Any) -> list[Record]:
+        """
+        Fetch every row of a query.
+        """
+        return await self.connection.fetch(sql, *args)
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Record]:
+        """
+        Fetch the first row of a query.
+        """
+        return await self.connection.fetchrow(sql, *args)
+
+    async def stream(
+        self, sql: str, *args: Any, prefetch: int = 500
+    ) -> AsyncIterator[Record]:
+        """
+        Stream the rows of a query through a server-side cursor.
+
+        Only ``prefetch`` rows are held in memory at a time.
+
+        :param sql: The query, with ``$1`` style parameters.
+        :param prefetch: The number of rows fetched per round trip.
+        :return: An async iterator of rows.
+        """
+        conn = self.connection
+        if conn.is_in_transaction():
+            async for record in conn.cursor(sql, *args, prefetch=prefetch):
+                yield record
+            return
+
+        async with conn.transaction():
+            async for record in conn.cursor(sql, *args, prefetch=prefetch):
+                yield record
+
+    async def executemany(
+        self, sql: str, args: Iterable[Sequence[Any]], chunk_size: int = 5_000
+    ) -> int:
+        """
+        Execute a statement for every parameter set, in chunks.
+
+        Every chunk is sent as one pipelined batch, inside one transaction.
+
+        :param sql: The statement, with ``$1`` style parameters.
+        :param args: The parameter sets; any iterable, consumed lazily.
+        :param chunk_size: The number of parameter sets sent per batch.
+        :return: The number of parameter sets executed.
+        """
+        conn = self.connection
+        iterator = iter(args)
+        total = 0
+        async with conn.transaction():
+            while chunk := list(islice(iterator, chunk_size)):
+                await conn.executemany(sql, chunk)
+                total += len(chunk)
+        return total
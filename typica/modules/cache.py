@@ -0,0 +1,355 @@
+import time
+import asyncio
+import inspect
+import threading
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterable, Optional, cast
+
+from pydantic import BaseModel, Field
+
+from typica.base import type_adapter
+from typica.modules.redis import AsyncRedisConnector, RedisConnector, registered_script
+from typica.utils.keys import key_digest
+from typica.utils.lru import LRUCache
+
+_MISSING = object()
+
+# ? add the key to a tag set and only ever extend its TTL, so the set outlives
+# ? its longest entry; TTL is -1 for a set without one. EXPIRE GT needs Redis 7
+_TAG = """
+redis.call('SADD', KEYS[1], ARGV[1])
+if redis.call('TTL', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+
+class CacheStats(BaseModel):
+    local_hits: int = Field(default=0, description="Hits served by the in-process LRU")
+    redis_hits: int = Field(default=0, description="Hits served by Redis")
+    misses: int = Field(default=0, description="Lookups that had to compute the value")
+    writes: int = Field(default=0, description="Values written to the cache")
+    invalidated: int = Field(default=0, description="Keys removed by tag invalidation")
+    compute_seconds: float = Field(default=0.0, description="Time spent computing misses")
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.redis_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """
+        Estimated latency saved: hits times the average cost of a miss.
+        """
+        return self.hits * self.compute_seconds / self.misses if self.misses else 0.0
+
+
+def cache_key(namespace: str, endpoint: str, *args: Any, **kwargs: Any) -> str:
+    """
+    Build the cache key of an endpoint call.
+
+    Pydantic models such as ``PaginationSchema``, ``OrderSchema`` or lists of
+    ``FilterOpsSchema`` are keyed by their values, so equal requests share
+    the same key.
+
+    :param namespace: The key prefix.
+    :param endpoint: The endpoint name.
+    :return: The cache key.
+    """
+    return f"{namespace}:{endpoint}:{key_digest([args, kwargs])}"
+
+
+class ResponseCache:
+    """
+    Two-tier response cache: a bounded in-process LRU in front of Redis.
+
+    Values are stored in Redis as compact JSON bytes produced by the
+    model's cached TypeAdapter. The local tier keeps the decoded objects,
+    which must therefore be treated as read-only. Tag invalidation clears
+    Redis and the local tier of this process; other processes keep their
+    local entries for at most ``local_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        connector: RedisConnector | AsyncRedisConnector | None = None,
+        namespace: str = "typica",
+        ttl: int = 60,
+        local_maxsize: int = 1024,
+        local_ttl: Optional[float] = 5.0,
+    ) -> None:
+        """
+        :param connector: A connected Redis connector, None for a local-only cache.
+        :param namespace: Prefix of every key.
+        :param ttl: Time to live of the Redis entries in seconds.
+        :param local_maxsize: Maximum entries of the in-process LRU.
+        :param local_ttl: Time to live of the in-process entries in seconds.
+        """
+        self.connector = connector
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local: LRUCache[Any] = LRUCache(local_maxsize, local_ttl)
+        self._stats = CacheStats()
+        self._generations: dict[str, int] = {}
+        self._scripts: dict[str, tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def key(self, endpoint: str, *args: Any, **kwargs: Any) -> str:
+        return cache_key(self.namespace, endpoint, *args, **kwargs)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    def _count(self, field: str, amount: float = 1) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + amount)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    def _tag_script(self, client: Any) -> Any:
+        return registered_script(self._scripts, client, _TAG)
+
+    # ? local entries carry the generation of their tags; invalidating a tag
+    # ? bumps its generation, so stale entries are dropped on their next read
+
+    def _local_get(self, key: str) -> Any:
+        entry = self.local.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+        value, generations = entry
+        with self._lock:
+            if any(self._generations.get(tag, 0) != gen for tag, gen in generations):
+                self.local.delete(key)
+                return _MISSING
+        return value
+
+    def _local_set(self, key: str, value: Any, tags: tuple[str, ...]) -> None:
+        with self._lock:
+            generations = tuple((tag, self._generations.get(tag, 0)) for tag in tags)
+        self.local.set(key, (value, generations))
+
+    def _bump(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+
+    # ? sync API, used with RedisConnector
+
+    def get(
+        self, key: str, model: Any, default: Any = None, tags: Iterable[str] = ()
+    ) -> Any:
+        """
+        Return the cached value of a key, looking at the local tier first.
+
+        :param key: The cache key.
+        :param model: The type of the value, e.g. a response model.
+        :param default: The value returned on a miss.
+        :param tags: Tags of the entry, kept with the local copy of a Redis hit.
+        """
+        value = self._get(key, model, tuple(tags))
+        return default if value is _MISSING else value
+
+    def _get(self, key: str, model: Any, tags: tuple[str, ...] = ()) -> Any:
+        value = self._local_get(key)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+        if isinstance(self.connector, RedisConnector):
+            raw = cast(Optional[bytes], self.connector.client.get(key))
+            if raw is not None:
+                value = type_adapter(model).validate_json(raw)
+                self._local_set(key, value, tags)
+                self._count("redis_hits")
+                return value
+        self._count("misses")
+        return _MISSING
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        model: Any,
+        tags: Iterable[str] = (),
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Store a value in both tiers.
+
+        :param key: The cache key.
+        :param value: The value to store.
+        :param model: The type of the value, used to serialize it.
+        :param tags: Tags used to invalidate the entry.
+        :param ttl: Time to live in Redis, defaults to the cache ``ttl``.
+        """
+        tags = tuple(tags)
+        self._local_set(key, value, tags)
+        if isinstance(self.connector, RedisConnector):
+            client = self.connector.client
+            pipe = client.pipeline(transaction=False)
+            pipe.set(key, type_adapter(model).dump_json(value), ex=ttl or self.ttl)
+            script = self._tag_script(client)
+            for tag in tags:
+                script(keys=[self._tag_key(tag)], args=[key, ttl or self.ttl], client=pipe)
+            pipe.execute()
+        self._count("writes")
+
+    def invalidate(self, *tags: str) -> int:
+        """
+        Remove every entry stored with one of the given tags.
+
+        :return: The number of keys removed from Redis.
+        """
+        self._bump(tags)
+        removed = 0
+        if isinstance(self.connector, RedisConnector) and tags:
+            client = self.connector.client
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            keys = cast(set[bytes], client.sunion(tag_keys))
+            if keys:
+                removed = cast(int, client.delete(*keys))
+            client.delete(*tag_keys)
+        self._count("invalidated", removed)
+        return removed
+
+    # ? async API, used with AsyncRedisConnector
+
+    async def aget(
+        self, key: str, model: Any, default: Any = None, tags: Iterable[str] = ()
+    ) -> Any:
+        """
+        Async version of ``get``.
+        """
+        value = await self._aget(key, model, tuple(tags))
+        return default if value is _MISSING else value
+
+    async def _aget(self, key: str, model: Any, tags: tuple[str, ...] = ()) -> Any:
+        value = self._local_get(key)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+        if isinstance(self.connector, AsyncRedisConnector):
+            raw = await self.connector.client.get(key)
+            if raw is not None:
+                value = type_adapter(model).validate_json(raw)
+                self._local_set(key, value, tags)
+                self._count("redis_hits")
+                return value
+        self._count("misses")
+        return _MISSING
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        model: Any,
+        tags: Iterable[str] = (),
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Async version of ``set``.
+        """
+        tags = tuple(tags)
+        self._local_set(key, value, tags)
+        if isinstance(self.connector, AsyncRedisConnector):
+            client = self.connector.client
+            pipe = client.pipeline(transaction=False)
+            pipe.set(key, type_adapter(model).dump_json(value), ex=ttl or self.ttl)
+            script = self._tag_script(client)
+            for tag in tags:
+                await script(keys=[self._tag_key(tag)], args=[key, ttl or self.ttl], client=pipe)
+            await pipe.execute()
+        self._count("writes")
+
+    async def ainvalidate(self, *tags: str) -> int:
+        """
+        Async version of ``invalidate``.
+        """
+        self._bump(tags)
+        removed = 0
+        if isinstance(self.connector, AsyncRedisConnector) and tags:
+            client = self.connector.client
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            keys = await cast(Awaitable[set[bytes]], client.sunion(tag_keys))
+            if keys:
+                removed = await cast(Awaitable[int], client.delete(*keys))
+            await client.delete(*tag_keys)
+        self._count("invalidated", removed)
+        return removed
+
+    def cached(
+        self,
+        endpoint: str,
+        model: Any,
+        tags: Iterable[str] = (),
+        ttl: Optional[int] = None,
+        exclude: Iterable[str] = ("self", "cls"),
+    ) -> Callable:
+        """
+        Decorate an endpoint function so its result is cached.
+
+        The key is built from the endpoint name and every argument of the
+        call, e.g. ``PaginationSchema``, ``OrderSchema`` and filter lists.
+        Works with sync and async functions.
+
+        :param endpoint: The endpoint name.
+        :param model: The return type of the function.
+        :param tags: Tags used to invalidate the cached results.
+        :param ttl: Time to live in Redis, defaults to the cache ``ttl``.
+        :param exclude: Arguments left out of the key, e.g. a database session.
+        """
+        tags = tuple(tags)
+        exclude = frozenset(exclude)
+
+        def decorator(fn: Callable) -> Callable:
+            signature = inspect.signature(fn)
+
+            def build_key(args: tuple, kwargs: dict) -> str:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = {
+                    name: value
+                    for name, value in bound.arguments.items()
+                    if name not in exclude
+                }
+                return self.key(endpoint, **arguments)
+
+            if asyncio.iscoroutinefunction(fn):
+
+                @wraps(fn)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    key = build_key(args, kwargs)
+                    value = await self._aget(key, model, tags)
+                    if value is not _MISSING:
+                        return value
+                    start = time.perf_counter()
+                    value = await fn(*args, **kwargs)
+                    self._count("compute_seconds", time.perf_counter() - start)
+                    await self.aset(key, value, model, tags, ttl)
+                    return value
+
+                return async_wrapper
+
+            @wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = build_key(args, kwargs)
+                value = self._get(key, model, tags)
+                if value is not _MISSING:
+                    return value
+                start = time.perf_counter()
+                value = fn(*args, **kwargs)
+                self._count("compute_seconds", time.perf_counter() - start)
+                self.set(key, value, model, tags, ttl)
+                return value
+
+            return wrapper
+
+        return decorator
@@ -1,22 +1,116 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, TypeVar, cast
+
 from clickhouse_connect import get_client
 from clickhouse_connect.driver.client import Client
+from clickhouse_connect.driver.query import QueryResult
+from pydantic import BaseModel, Field
 
+from typica.base import type_adapter
 from typica.connection import DBConnectionMeta
+from typica.metadata import Schemas
+from typica.modules.pool import ClientPool, PoolConfig, connection_registry, release_or_close
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class InsertSettings(BaseModel):
+    async_insert: bool = Field(
+        default=False, description="Buffer inserts on the server and flush them in batches"
+    )
+    wait_for_async_insert: bool = Field(
+        default=True, description="Return only after the buffered data is flushed"
+    )
+    async_insert_busy_timeout_ms: Optional[int] = Field(
+        default=None, ge=0, description="Maximum time before the server flushes the buffer"
+    )
+    async_insert_max_data_size: Optional[int] = Field(
+        default=None, ge=0, description="Maximum buffer size in bytes before a flush"
+    )
+
+    def as_settings(self) -> dict[str, Any]:
+        """
+        Return the ClickHouse settings of this configuration.
+        """
+        if not self.async_insert:
+            return {}
+        return {
+            key: int(value) if isinstance(value, bool) else value
+            for key, value in self.model_dump(exclude_none=True).items()
+        }
+
+
+def _stream_settings(
+    settings: Optional[dict[str, Any]], block_size: Optional[int]
+) -> dict[str, Any]:
+    settings = dict(settings or {})
+    if block_size:
+        settings["max_block_size"] = block_size
+    return settings
+
+
+class InsertStats(BaseModel):
+    rows: int = Field(default=0, description="Rows inserted")
+    blocks: int = Field(default=0, description="Blocks sent to the server")
+
+
+def insert_columns(
+    source: type[BaseModel] | Schemas,
+) -> tuple[list[str], list[str]]:
+    """
+    Return the attribute names and the column names of a model or a schema.
+
+    Columns are named by alias when one is set.
+
+    :param source: A pydantic model or a ``Schemas`` description.
+    :return: The attribute names and the matching column names.
+    """
+    if isinstance(source, Schemas):
+        fields = [(meta.field_name, meta.field_alias) for meta in source.root]
+    else:
+        fields = [(name, field.alias) for name, field in source.model_fields.items()]
+    return [name for name, _ in fields], [alias or name for name, alias in fields]
+
+
+def pivot(rows: list[BaseModel | Mapping[str, Any]], names: list[str]) -> list[list[Any]]:
+    """
+    Turn a block of models or dicts into one list per column.
+
+    Values are read straight from the model attributes, without dumping
+    every row into an intermediate dict.
+
+    :param rows: The rows of the block.
+    :param names: The attribute (or key) names, in column order.
+    :return: The column-oriented block.
+    """
+    if rows and isinstance(rows[0], BaseModel):
+        return [[getattr(row, name) for row in rows] for name in names]
+    return [[row.get(name) for row in rows] for name in names]  # type: ignore[union-attr]
 
 
 class CHConnector:
 
     _meta: DBConnectionMeta
     _client: Client
+    _pool: ClientPool[Client] | None = None
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        pooled: bool = False,
+        pool_config: PoolConfig | None = None,
+    ) -> None:
         """
         Initialize the ClickHouse connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: DBConnectionMeta
+        :param pooled: Borrow clients from the shared connection registry
+                       instead of opening a new one on every connect.
+        :param pool_config: Pool settings, implies ``pooled``.
         """
         self._meta = meta
+        self._pool_config = pool_config or (PoolConfig() if pooled else None)
 
     def __enter__(self) -> "CHConnector":
         """
@@ -45,23 +139,189 @@ class CHConnector:
         :raises Exception: If any other error occurs during the connection.
         """
         try:
-            self._client = get_client(
-                host=str(self._meta.host),
-                port=int(self._meta.port),  # type: ignore
-                user=self._meta.username,
-                password=self._meta.password
-                or "",  # cause get_client doesn't support empty password
-                database=str(self._meta.database),
-            )
+            if self._pool_config:
+                self._pool = connection_registry.pool(
+                    "clickhouse",
+                    self._meta,
+                    factory=self._create_client,
+                    closer=Client.close,
+                    config=self._pool_config,
+                )
+                self._client = self._pool.acquire()
+            else:
+                self._client = self._create_client()
 
         except Exception as e:
             raise e
 
+    def _create_client(self) -> Client:
+        return get_client(
+            host=str(self._meta.host),
+            port=int(self._meta.port),  # type: ignore
+            user=self._meta.username,
+            password=self._meta.password
+            or "",  # cause get_client doesn't support empty password
+            database=str(self._meta.database),
+        )
+
     def close(self) -> None:
         """
         Close the connection to the ClickHouse server.
+        A pooled client is returned to its pool instead.
 
         This method is a no-op if the connection is already closed.
         """
-        if self._client:
-            self._client.close()
+        release_or_close(self._pool, getattr(self, "_client", None), Client.close)
+        self._pool = None
+        self._client = None  # type: ignore[assignment]
+
+    def insert_models(
+        self,
+        table: str,
+        rows: Iterable[BaseModel | Mapping[str, Any]],
+        source: type[BaseModel] | Schemas | None = None,
+        block_size: int = 100_000,
+        settings: Optional[InsertSettings] = None,
+    ) -> InsertStats:
+        """
+        Insert models (or dicts) with column-oriented inserts.
+
+        Rows are consumed lazily and pivoted into columns one block of
+        ``block_size`` rows at a time, so memory stays bounded by the block
+        size. One insert context is reused for every block.
+
+        :param table: The target table.
+        :param rows: The rows to insert.
+        :param source: The model or ``Schemas`` describing the columns,
+                       defaults to the type of the first row.
+        :param block_size: The number of rows per insert.
+        :param settings: Async insert settings.
+        :return: The number of rows and blocks inserted.
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be greater than 0")
+        iterator = iter(rows)
+        block = list(islice(iterator, block_size))
+        stats = InsertStats()
+        if not block:
+            return stats
+
+        if source is None:
+            if not isinstance(block[0], BaseModel):
+                raise ValueError("source is required to insert dicts")
+            source = type(block[0])
+        names, columns = insert_columns(source)
+        context = self._client.create_insert_context(
+            table,
+            column_names=columns,
+            column_oriented=True,
+            settings=(settings or InsertSettings()).as_settings(),
+        )
+        while block:
+            context.data = pivot(block, names)
+            self._client.insert(context=context)
+            stats.rows += len(block)
+            stats.blocks += 1
+            block = list(islice(iterator, block_size))
+        return stats
+
+    def stream_blocks(
+        self,
+        query: str,
+        parameters: Optional[Sequence | dict[str, Any]] = None,
+        settings: Optional[dict[str, Any]] = None,
+        block_size: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Iterator[Sequence[Sequence[Any]]]:
+        """
+        Stream the result of a query one block at a time.
+
+        Only the current block is held in memory, whatever the size of the
+        result. The block size is set with the ``max_block_size`` setting.
+
+        :param query: The query.
+        :param parameters: The query parameters.
+        :param settings: Additional ClickHouse settings.
+        :param block_size: The maximum number of rows per block.
+        :param columnar: Yield column blocks instead of row blocks.
+        :return: A generator of row (or column) blocks.
+        """
+        method = (
+            self._client.query_column_block_stream
+            if columnar
+            else self._client.query_row_block_stream
+        )
+        with method(query, parameters, _stream_settings(settings, block_size)) as stream:
+            yield from stream
+
+    def stream_numpy(
+        self,
+        query: str,
+        parameters: Optional[Sequence | dict[str, Any]] = None,
+        settings: Optional[dict[str, Any]] = None,
+        block_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream the result of a query as one NumPy array per block.
+
+        Requires numpy.
+
+        :return: A generator of NumPy arrays.
+        """
+        with self._client.query_np_stream(
+            query, parameters, _stream_settings(settings, block_size)
+        ) as stream:
+            yield from stream
+
+    def stream_arrow(
+        self,
+        query: str,
+        parameters: Optional[Sequence | dict[str, Any]] = None,
+        settings: Optional[dict[str, Any]] = None,
+        block_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream the result of a query as Arrow record batches.
+
+        Requires pyarrow.
+
+        :return: A generator of ``pyarrow.RecordBatch``.
+        """
+        with self._client.query_arrow_stream(
+            query, parameters, _stream_settings(settings, block_size)
+        ) as stream:
+            yield from stream
+
+    def stream_models(
+        self,
+        query: str,
+        model: type[ModelT],
+        parameters: Optional[Sequence | dict[str, Any]] = None,
+        settings: Optional[dict[str, Any]] = None,
+        block_size: Optional[int] = None,
+        trusted: bool = False,
+    ) -> Iterator[ModelT]:
+        """
+        Stream the result of a query as models.
+
+        Columns are matched to the model fields by alias. Each block is
+        validated with the cached TypeAdapter when it is reached, so only
+        one block of models exists at a time.
+
+        :param model: The target model.
+        :param trusted: Build models with ``model_construct`` and skip validation.
+        :return: A generator of models.
+        """
+        adapter = type_adapter(list[model])  # type: ignore[valid-type]
+        with self._client.query_row_block_stream(
+            query, parameters, _stream_settings(settings, block_size)
+        ) as stream:
+            # ? the source of a block stream is the QueryResult holding the column names
+            names = cast(QueryResult, stream.source).column_names
+            for block in stream:
+                rows = [dict(zip(names, row)) for row in block]
+                if trusted:
+                    for row in rows:
+                        yield model.model_construct(**row)
+                else:
+                    yield from adapter.validate_python(rows)
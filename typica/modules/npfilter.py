@@ -0,0 +1,310 @@
+import re
+
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Mapping, Optional, Sequence, cast
+
+import numpy as np
+
+from pydantic import BaseModel
+
+from typica.query import _groups, _operator, validate_identifier
+from typica.schema import FilterGroupSchema, FilterOpsSchema, OrderSchema, PaginationSchema
+from typica.utils.enums import FilterOption, Operator
+
+_COMPARE = {
+    Operator.equal: np.equal,
+    Operator.unequal: np.not_equal,
+    Operator.gte: np.greater_equal,
+    Operator.gt: np.greater,
+    Operator.lte: np.less_equal,
+    Operator.lt: np.less,
+}
+
+
+def _datetime64(value: Any) -> np.datetime64:
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
+def _smallest(key: np.ndarray, count: int) -> np.ndarray:
+    """
+    Return the positions of the ``count`` smallest keys in stable sorted
+    order, partitioning first so only those are fully sorted.
+    """
+    if count >= len(key):
+        return np.argsort(key, kind="stable")
+    kth = np.partition(key, count - 1)[count - 1]
+    below = np.flatnonzero(key < kth)
+    # ? ties on the boundary are taken in load order, as a stable sort would
+    equal = np.flatnonzero(key == kth)[: count - len(below)]
+    chosen = np.concatenate([below, equal])
+    return chosen[np.argsort(key[chosen], kind="stable")]
+
+
+class Column:
+    """
+    One column of a ``ColumnStore``.
+
+    Numbers, booleans and datetimes are stored as typed arrays; strings are
+    dictionary encoded as sorted categories plus integer codes, so equality
+    and ordering compare integers and regexes only run once per distinct
+    value. Anything else is kept as an object array.
+    """
+
+    def __init__(self, values: list[Any]) -> None:
+        self.present = np.fromiter((value is not None for value in values), bool, len(values))
+        sample = [value for value in values if value is not None]
+        types = {type(value) for value in sample}
+        self.categories: Optional[np.ndarray] = None
+        self.data: np.ndarray
+
+        if types <= {bool}:
+            self.kind = "b"
+            self.data = np.array([bool(value) for value in values], dtype=bool)
+        elif types <= {int} and sample:
+            self.kind = "i"
+            self.data = np.array([0 if value is None else value for value in values], dtype=np.int64)
+        elif types <= {int, float}:
+            self.kind = "f"
+            self.data = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        elif types <= {datetime, date}:
+            self.kind = "M"
+            self.data = np.array(
+                [_datetime64(value) if value is not None else np.datetime64("NaT") for value in values],
+                dtype="datetime64[us]",
+            )
+        elif types <= {str}:
+            self.kind = "U"
+            self.categories, self.data = np.unique(
+                np.array(["" if value is None else value for value in values], dtype=str),
+                return_inverse=True,
+            )
+        else:
+            self.kind = "O"
+            self.data = np.empty(len(values), dtype=object)
+            self.data[:] = values
+
+    def _scalar(self, value: Any) -> Any:
+        if self.kind == "M":
+            return _datetime64(value)
+        return value
+
+    def _code(self, value: Any) -> int:
+        # ? -1 matches no row
+        index = int(np.searchsorted(self.categories, value))  # type: ignore[arg-type]
+        if index < len(self.categories) and self.categories[index] == value:  # type: ignore[arg-type]
+            return index
+        return -1
+
+    def _object_mask(self, predicate: Any) -> np.ndarray:
+        def safe(item: Any) -> bool:
+            try:
+                return bool(predicate(item))
+            except TypeError:
+                return False
+
+        return np.fromiter((safe(item) for item in self.data), bool, len(self.data))
+
+    def mask(self, op: Operator, value: Any) -> np.ndarray:
+        """
+        Evaluate one operator against the column.
+
+        Like Mongo, ``ne`` and ``nin`` also match missing values.
+
+        :param op: The operator.
+        :param value: The filter value.
+        :return: A boolean mask of the matching rows.
+        """
+        if op is Operator.exist or op is Operator.not_exist:
+            exists = value is None or bool(value)
+            return self.present.copy() if exists == (op is Operator.exist) else ~self.present
+        if value is None and op in (Operator.equal, Operator.unequal):
+            return ~self.present if op is Operator.equal else self.present.copy()
+
+        if op in (Operator.include, Operator.exclude):
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if self.kind == "U":
+                # ? a lookup table over the categories beats np.isin on the codes
+                table = np.zeros(len(self.categories) + 1, bool)  # type: ignore[arg-type]
+                table[[self._code(item) for item in values if isinstance(item, str)]] = True
+                table[-1] = False
+                matched = table[self.data] & self.present
+            elif self.kind == "O":
+                matched = self._object_mask(lambda item: item in values) & self.present
+            else:
+                matched = np.isin(self.data, [self._scalar(item) for item in values]) & self.present
+            return matched if op is Operator.include else ~matched
+
+        if op is Operator.regex:
+            pattern = re.compile(cast(str, value))
+            if self.kind == "U":
+                hits = np.fromiter(
+                    (pattern.search(item) is not None for item in self.categories),  # type: ignore[union-attr]
+                    bool,
+                    len(self.categories),  # type: ignore[arg-type]
+                )
+                return hits[self.data] & self.present
+            return self._object_mask(lambda item: pattern.search(str(item)) is not None) & self.present
+
+        compare = _COMPARE[op]
+        # ? a value of another type equals no row, so every row is unequal
+        mismatch = np.full(len(self.data), op is Operator.unequal)
+        if self.kind == "U":
+            if not isinstance(value, str):
+                return mismatch
+            if op in (Operator.equal, Operator.unequal):
+                matched = self.data == self._code(value)
+                if op is Operator.unequal:
+                    return ~matched | ~self.present
+            else:
+                # ? codes follow the sorted categories, so ranges compare codes
+                side = "left" if op in (Operator.gte, Operator.lt) else "right"
+                bound = np.searchsorted(self.categories, value, side=side)  # type: ignore[arg-type]
+                if op in (Operator.gte, Operator.gt):
+                    matched = self.data >= bound
+                else:
+                    matched = self.data < bound
+        elif self.kind == "O":
+            matched = self._object_mask(lambda item: compare(item, value))
+        else:
+            try:
+                matched = compare(self.data, self._scalar(value))
+            except (TypeError, ValueError, np.exceptions.DTypePromotionError):
+                return mismatch
+        if op is Operator.unequal:
+            return matched | ~self.present
+        return matched & self.present
+
+    def sort_key(self, descending: bool) -> np.ndarray:
+        """
+        Return an array whose ascending order is the requested order.
+        """
+        if self.kind == "O":
+            _, key = np.unique(self.data.astype(str), return_inverse=True)
+        elif self.kind == "M":
+            key = self.data.view(np.int64)
+        elif self.kind == "b":
+            key = self.data.astype(np.int8)
+        else:
+            key = self.data
+        return -key if descending else key
+
+
+class ColumnStore:
+    """
+    In-memory columnar store evaluating filter schemas as NumPy masks.
+    """
+
+    def __init__(self, columns: Mapping[str, Column], size: int) -> None:
+        self.columns = dict(columns)
+        self.size = size
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any] | BaseModel],
+        fields: Optional[Sequence[str]] = None,
+    ) -> "ColumnStore":
+        """
+        Load records (dicts or models) into columns.
+
+        :param records: The records.
+        :param fields: The fields to load, defaults to every field seen.
+        :return: The store.
+        """
+        rows = [
+            record.model_dump() if isinstance(record, BaseModel) else record
+            for record in records
+        ]
+        if fields is None:
+            fields = list(dict.fromkeys(key for row in rows for key in row))
+        columns = {field: Column([row.get(field) for row in rows]) for field in fields}
+        return cls(columns, len(rows))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def mask(self, item: FilterOpsSchema) -> np.ndarray:
+        """
+        Evaluate one filter. Unknown fields behave as missing values.
+        """
+        op = _operator(item.filter_op)
+        column = self.columns.get(validate_identifier(item.filter_by))
+        if column is None:
+            column = Column([None] * self.size)
+        return column.mask(op, item.filter_value)
+
+    def filter(
+        self, filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None
+    ) -> np.ndarray:
+        """
+        Combine the masks of the filters, grouped by ``FilterOption``.
+
+        must is AND, mustnt matches none, should is OR and shouldnt is NOT(AND).
+
+        :return: A boolean mask of the matching rows.
+        """
+        groups = _groups(filters)
+        result = np.ones(self.size, bool)
+        for option in FilterOption:
+            items = getattr(groups, option.value)
+            if not items:
+                continue
+            masks = [self.mask(item) for item in items]
+            if option is FilterOption.must:
+                result &= np.logical_and.reduce(masks)
+            elif option is FilterOption.mustnt:
+                result &= ~np.logical_or.reduce(masks)
+            elif option is FilterOption.should:
+                result &= np.logical_or.reduce(masks)
+            else:
+                result &= ~np.logical_and.reduce(masks)
+        return result
+
+    def query(
+        self,
+        filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None,
+        order: Optional[OrderSchema] = None,
+        pagination: Optional[PaginationSchema] = None,
+    ) -> np.ndarray:
+        """
+        Filter, sort and paginate the store.
+
+        Missing values sort last; ties keep the load order.
+
+        :return: The row indices of the page.
+        """
+        indices = np.flatnonzero(self.filter(filters))
+        start, stop = 0, len(indices)
+        if pagination is not None and pagination.size:
+            start = ((pagination.page or 1) - 1) * pagination.size
+            stop = start + pagination.size
+
+        if order is not None and order.order_by:
+            column = self.columns.get(validate_identifier(order.order_by))
+            if column is not None:
+                descending = str(order.order_type).lower() in ("-1", "desc", "descending")
+                present = column.present[indices]
+                head, tail = indices[present], indices[~present]
+                key = column.sort_key(descending)[head]
+                indices = np.concatenate([head[_smallest(key, stop)], tail])
+        return indices[start:stop]
+
+    def records(self, indices: np.ndarray) -> list[dict[str, Any]]:
+        """
+        Rebuild the records of the given rows, without their missing values.
+        """
+        rows: list[dict[str, Any]] = [{} for _ in range(len(indices))]
+        for name, column in self.columns.items():
+            present = column.present[indices]
+            if column.kind == "U":
+                values = column.categories[column.data[indices]].tolist()  # type: ignore[index]
+            elif column.kind == "M":
+                values = column.data[indices].astype(datetime).tolist()
+            else:
+                values = column.data[indices].tolist()
+            for row, value, exists in zip(rows, values, present):
+                if exists:
+                    row[name] = value
+        return rows
@@ -0,0 +1,169 @@
+import re
+
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence, TypeVar
+
+import numpy as np
+
+from pydantic import BaseModel
+
+from typica.base import CreationMeta, validate_many
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_AWARE = re.compile(r"([Zz]|[+-]\d{2}:?\d{2})$")
+_COMPACT_OFFSET = re.compile(r"([+-]\d{2})(\d{2})$")
+_NS = np.iinfo(np.int64)
+
+# ? Epoch magnitudes: anything below 1e11 is seconds (until year 5138), below
+# ? 1e14 milliseconds, below 1e17 microseconds, the rest is nanoseconds.
+_UNIT_LIMITS = np.array([1e11, 1e14, 1e17])
+_UNIT_FACTORS = np.array([1_000_000_000, 1_000_000, 1_000, 1], dtype=np.int64)
+
+
+def epoch_to_datetime64(values: Sequence[int | float] | np.ndarray) -> np.ndarray:
+    """
+    Convert epoch numbers of mixed units into ``datetime64[ns]``.
+
+    The unit of every value is detected from its magnitude
+    (seconds, milliseconds, microseconds or nanoseconds).
+
+    :param values: Epoch integers (or floats) in any of the supported units
+    :return: An array of ``datetime64[ns]``
+    :raises ValueError: If a value is outside the ``datetime64[ns]`` range
+    """
+    array = np.asarray(values)
+    units = np.searchsorted(_UNIT_LIMITS, np.abs(array), side="right")
+    factors = _UNIT_FACTORS[units]
+
+    if array.dtype.kind == "f":
+        # ? scaled whole, e.g. ms * 1e6, the float would round away the nanoseconds
+        whole = np.trunc(array)
+        if np.any(np.abs(whole) > _NS.max // factors - 1):
+            raise ValueError("Epoch value is out of the datetime64[ns] range")
+        fraction = np.round((array - whole) * factors).astype(np.int64)
+        return (whole.astype(np.int64) * factors + fraction).view("datetime64[ns]")
+
+    array = array.astype(np.int64, copy=False)
+    if np.any(np.abs(array) > _NS.max // factors):
+        raise ValueError("Epoch value is out of the datetime64[ns] range")
+    return (array * factors).view("datetime64[ns]")
+
+
+def normalize_timestamps(values: Iterable[Any]) -> np.ndarray:
+    """
+    Normalize a column of mixed timestamps into ``datetime64[ns]`` (UTC).
+
+    Accepts ISO strings, epoch integers in s/ms/µs/ns, datetimes,
+    ``datetime64`` values and None (which becomes NaT).
+    Naive strings and datetimes are taken as UTC, aware ones are converted.
+
+    :param values: The column to normalize
+    :return: An array of ``datetime64[ns]``, nanoseconds kept exactly
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return epoch_to_datetime64(values)
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        return values.astype("datetime64[ns]")
+
+    column = values if isinstance(values, (list, tuple)) else list(values)
+    result = np.full(len(column), np.datetime64("NaT"), dtype="datetime64[ns]")
+
+    int_idx: list[int] = []
+    float_idx: list[int] = []
+    naive_idx: list[int] = []
+    other_idx: list[int] = []
+    for idx, value in enumerate(column):
+        if value is None:
+            continue
+        if isinstance(value, int) and not isinstance(value, bool):
+            int_idx.append(idx)
+        elif isinstance(value, float):
+            float_idx.append(idx)
+        elif isinstance(value, str) and not _AWARE.search(value):
+            naive_idx.append(idx)
+        else:
+            other_idx.append(idx)
+
+    for epoch_idx, dtype in ((int_idx, np.int64), (float_idx, np.float64)):
+        if epoch_idx:
+            result[epoch_idx] = epoch_to_datetime64(
+                np.array([column[idx] for idx in epoch_idx], dtype=dtype)
+            )
+    if naive_idx:
+        result[naive_idx] = np.array(
+            [column[idx] for idx in naive_idx], dtype="datetime64[ns]"
+        )
+    for idx in other_idx:
+        result[idx] = _scalar_datetime64(column[idx])
+    return result
+
+
+def _scalar_datetime64(value: Any) -> np.datetime64:
+    if isinstance(value, str):
+        # ? fromisoformat only reads "Z" and "+HHMM" suffixes from Python 3.11
+        if value[-1:] in ("Z", "z"):
+            value = value[:-1] + "+00:00"
+        value = _COMPACT_OFFSET.sub(r"\1:\2", value)
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(value, "us").astype("datetime64[ns]")
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[ns]")
+    raise ValueError(f"Unsupported timestamp value: {value!r}")
+
+
+def to_datetimes(values: np.ndarray) -> list[datetime | None]:
+    """
+    Convert ``datetime64`` values into UTC-aware datetimes.
+
+    Python datetimes hold microseconds, so this is exact down to the
+    microsecond; NaT becomes None.
+
+    :param values: An array of ``datetime64``
+    :return: A list of datetimes
+    """
+    return [
+        value.replace(tzinfo=timezone.utc) if value is not None else None
+        for value in values.astype("datetime64[us]").tolist()
+    ]
+
+
+def fill_created_at(rows: list[dict], field: str = "created_at") -> list[dict]:
+    """
+    Normalize the timestamp column of raw rows in one pass, in place.
+
+    Rows without the field are left untouched, so the model default applies.
+
+    :param rows: Raw dicts about to be validated into a ``CreationMeta`` model
+    :param field: The name of the timestamp field
+    :return: The same rows
+    """
+    indexes = [idx for idx, row in enumerate(rows) if field in row]
+    if not indexes:
+        return rows
+
+    normalized = to_datetimes(normalize_timestamps([rows[idx][field] for idx in indexes]))
+    for idx, value in zip(indexes, normalized):
+        rows[idx][field] = value
+    return rows
+
+
+def validate_creation_batch(
+    rows: list[dict],
+    model: type[ModelT] = CreationMeta,  # type: ignore[assignment]
+    field: str = "created_at",
+    chunk_size: int = 10_000,
+) -> list[ModelT]:
+    """
+    Normalize the timestamps of raw rows and validate them into models.
+
+    :param rows: Raw dicts
+    :param model: A model with a datetime field, ``CreationMeta`` by default
+    :param field: The name of the timestamp field
+    :param chunk_size: The number of rows validated per call into pydantic-core
+    :return: The list of validated models
+    """
+    return validate_many(model, fill_created_at(rows, field), chunk_size)
@@ -1,8 +1,131 @@
-from pymongo import MongoClient
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Iterator, Literal, Mapping, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel, Field
+from pymongo import InsertOne, MongoClient, ReplaceOne
+from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import NetworkTimeout, ExecutionTimeout
+from bson.errors import BSONError
+from pymongo.errors import BulkWriteError, NetworkTimeout, ExecutionTimeout, PyMongoError
 
+from typica.base import type_adapter
 from typica.connection import DBConnectionMeta
+from typica.modules.pool import ClientPool, PoolConfig, connection_registry, release_or_close
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class BulkDocumentError(BaseModel):
+    id: Any = Field(default=None, description="The _id of the failed document")
+    code: Optional[int] = Field(default=None, description="The server error code")
+    message: str = Field(..., description="The error message")
+
+
+class BulkWriteStats(BaseModel):
+    inserted: int = Field(default=0, description="Documents inserted")
+    matched: int = Field(default=0, description="Documents matched by an upsert")
+    modified: int = Field(default=0, description="Documents replaced by an upsert")
+    upserted: int = Field(default=0, description="Documents inserted by an upsert")
+    batches: int = Field(default=0, description="Batches sent to the server")
+    errors: list[BulkDocumentError] = Field(
+        default_factory=list, description="Documents that failed to write"
+    )
+
+    @property
+    def written(self) -> int:
+        return self.inserted + self.modified + self.upserted
+
+
+def dump_documents(models: list[BaseModel]) -> list[dict[str, Any]]:
+    """
+    Serialize a chunk of models into Mongo documents, using their aliases
+    so identifiers such as ``StringIdentifier_`` become ``_id``.
+
+    A chunk of one model type is dumped in a single call.
+
+    :param models: The models to serialize.
+    :return: The documents.
+    """
+    if not models:
+        return []
+    cls = type(models[0])
+    if all(type(model) is cls for model in models):
+        return type_adapter(list[cls]).dump_python(models, by_alias=True)
+    return [model.model_dump(by_alias=True) for model in models]
+
+
+@lru_cache(maxsize=256)
+def projection(model: type[BaseModel]) -> dict[str, int]:
+    """
+    Return the Mongo projection of the fields of a model.
+
+    Fields are projected by alias, so ``StringIdentifier_`` maps to ``_id``;
+    ``_id`` is excluded when the model does not declare it.
+
+    :param model: The target model.
+    :return: The projection document.
+    """
+    fields = {field.alias or name: 1 for name, field in model.model_fields.items()}
+    if "_id" not in fields:
+        fields["_id"] = 0
+    return fields
+
+
+def _write_batch(
+    collection: Collection, docs: list[dict[str, Any]], mode: str
+) -> BulkWriteStats:
+    stats = BulkWriteStats(batches=1)
+    if mode == "upsert":
+        missing = [doc for doc in docs if "_id" not in doc]
+        if missing:
+            stats.errors = [
+                BulkDocumentError(message="upsert needs an _id") for _ in missing
+            ]
+            docs = [doc for doc in docs if "_id" in doc]
+        ops = [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs]
+    else:
+        ops = [InsertOne(doc) for doc in docs]
+    if not ops:
+        return stats
+
+    try:
+        result = collection.bulk_write(ops, ordered=False)
+        stats.inserted = result.inserted_count
+        stats.matched = result.matched_count
+        stats.modified = result.modified_count
+        stats.upserted = result.upserted_count
+    except BulkWriteError as e:
+        details = e.details
+        stats.inserted = details.get("nInserted", 0)
+        stats.matched = details.get("nMatched", 0)
+        stats.modified = details.get("nModified", 0)
+        stats.upserted = details.get("nUpserted", 0)
+        stats.errors += [
+            BulkDocumentError(
+                id=docs[error["index"]].get("_id"),
+                code=error.get("code"),
+                message=error.get("errmsg", ""),
+            )
+            for error in details.get("writeErrors", [])
+        ]
+    except (PyMongoError, BSONError, ValueError, TypeError) as e:
+        # ? the whole batch failed, e.g. a network error, or a document the
+        # ? client cannot encode
+        stats.errors += [
+            BulkDocumentError(id=doc.get("_id"), message=str(e)) for doc in docs
+        ]
+    return stats
+
+
+def _merge(total: BulkWriteStats, stats: BulkWriteStats) -> None:
+    total.inserted += stats.inserted
+    total.matched += stats.matched
+    total.modified += stats.modified
+    total.upserted += stats.upserted
+    total.batches += stats.batches
+    total.errors.extend(stats.errors)
 
 
 class MongoConnector:
@@ -10,15 +133,25 @@ class MongoConnector:
     _meta: DBConnectionMeta
     _client: MongoClient
     _db: Database
+    _pool: ClientPool[MongoClient] | None = None
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        pooled: bool = False,
+        pool_config: PoolConfig | None = None,
+    ) -> None:
         """
         Initialize the Mongo connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: DBConnectionMeta
+        :param pooled: Borrow clients from the shared connection registry
+                       instead of opening a new one on every connect.
+        :param pool_config: Pool settings, implies ``pooled``.
         """
         self._meta = meta
+        self._pool_config = pool_config or (PoolConfig() if pooled else None)
         if not self._meta.uri:
             self._meta.uri = self._meta.uri_string(base="mongodb", with_db=False)
 
@@ -47,13 +180,31 @@ class MongoConnector:
         """
         Establish a connection to the MongoDB server.
 
+        UUIDs are encoded with the standard binary subtype 4, so models such
+        as ``UUIDIdentifier_`` can be written, unless ``uuidRepresentation``
+        is given.
+
         :param kwargs: Additional keyword arguments for MongoClient.
         :raises ValueError: If the connection to the MongoDB server fails.
         :raises Exception: If any other error occurs during the connection.
         """
-
+        # ? the driver default refuses to encode native uuid.UUID values
+        kwargs.setdefault("uuidRepresentation", "standard")
         try:
-            self._client = MongoClient(self._meta.uri, timeoutMS=20000, **kwargs)
+            if self._pool_config:
+                self._pool = connection_registry.pool(
+                    "mongo",
+                    self._meta,
+                    factory=lambda: MongoClient(
+                        self._meta.uri, timeoutMS=20000, **kwargs
+                    ),
+                    closer=MongoClient.close,
+                    config=self._pool_config,
+                    **kwargs,
+                )
+                self._client = self._pool.acquire()
+            else:
+                self._client = MongoClient(self._meta.uri, timeoutMS=20000, **kwargs)
             self._db = self._client[str(self._meta.database)]
         except (NetworkTimeout, ExecutionTimeout):
             raise ValueError("Mongo connection timed out.")
@@ -63,8 +214,113 @@ class MongoConnector:
     def close(self) -> None:
         """
         Close the connection to the MongoDB server.
+        A pooled client is returned to its pool instead.
 
         This method is a no-op if the connection is already closed.
         """
-        if self._client:
-            self._client.close()
+        release_or_close(self._pool, getattr(self, "_client", None), MongoClient.close)
+        self._pool = None
+        self._client = None  # type: ignore[assignment]
+
+    def bulk_write(
+        self,
+        collection: str,
+        models: Iterable[BaseModel],
+        mode: Literal["insert", "upsert"] = "insert",
+        batch_size: int = 1_000,
+        max_in_flight: int = 4,
+    ) -> BulkWriteStats:
+        """
+        Write models to a collection with unordered bulk writes.
+
+        Models are consumed lazily, serialized ``by_alias`` one batch at a
+        time and sent with ``bulk_write(ordered=False)``, with up to
+        ``max_in_flight`` batches in progress at once. Failed documents,
+        including whole batches the client could not encode or send, are
+        reported in the result without stopping the stream.
+
+        :param collection: The collection name.
+        :param models: The models to write, e.g. ``StringIdentifier_`` subclasses.
+        :param mode: ``insert`` or ``upsert`` (replace by ``_id``).
+        :param batch_size: The number of documents per bulk write.
+        :param max_in_flight: The number of batches written in parallel.
+        :return: The aggregated counts and per-document errors.
+        :raises ValueError: If upserting models without an ``_id`` field,
+                            checked on the first batch before any write.
+        """
+        if batch_size <= 0 or max_in_flight <= 0:
+            raise ValueError("batch_size and max_in_flight must be greater than 0")
+        coll = self._db[collection]
+        iterator = iter(models)
+        total = BulkWriteStats()
+        pending: set[Future[BulkWriteStats]] = set()
+
+        chunk = list(islice(iterator, batch_size))
+        if mode == "upsert":
+            for cls in {type(model) for model in chunk}:
+                if not projection(cls)["_id"]:
+                    raise ValueError(
+                        f"upsert replaces by _id, {cls.__name__} has no _id field"
+                    )
+
+        with ThreadPoolExecutor(max_in_flight) as executor:
+            while chunk:
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _merge(total, future.result())
+                pending.add(
+                    executor.submit(_write_batch, coll, dump_documents(chunk), mode)
+                )
+                chunk = list(islice(iterator, batch_size))
+            for future in pending:
+                _merge(total, future.result())
+        return total
+
+    def find_models(
+        self,
+        collection: str,
+        model: type[ModelT],
+        filter: Optional[Mapping[str, Any]] = None,
+        sort: Optional[Sequence[tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0,
+        batch_size: int = 1_000,
+        trusted: bool = False,
+    ) -> Iterator[ModelT]:
+        """
+        Stream the documents of a collection as models.
+
+        Only the fields of the model are fetched. Documents are pulled
+        ``batch_size`` at a time and validated per batch with the cached
+        TypeAdapter, so memory stays bounded by the batch size.
+
+        :param collection: The collection name.
+        :param model: The target model.
+        :param filter: The Mongo filter document.
+        :param sort: The sort keys, as (field, direction) pairs.
+        :param skip: The number of documents to skip.
+        :param limit: The maximum number of documents, 0 for no limit.
+        :param batch_size: The number of documents per round trip and validation.
+        :param trusted: Build models with ``model_construct`` and skip validation,
+                        for data already known to be valid.
+        :return: A generator of models.
+        """
+        cursor = self._db[collection].find(
+            filter or {},
+            projection(model),
+            sort=sort,
+            skip=skip,
+            limit=limit,
+            batch_size=batch_size,
+        )
+        adapter = type_adapter(list[model])  # type: ignore[valid-type]
+        try:
+            while chunk := list(islice(cursor, batch_size)):
+                if trusted:
+                    for doc in chunk:
+                        yield model.model_construct(**doc)
+                else:
+                    yield from adapter.validate_python(chunk)
+        finally:
+            cursor.close()
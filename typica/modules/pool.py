@@ -0,0 +1,411 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+from collections import deque
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+ClientT = TypeVar("ClientT")
+
+
+class PoolConfig(BaseModel):
+    min_size: int = Field(default=0, ge=0, description="Clients kept open when idle")
+    max_size: int = Field(default=10, gt=0, description="Maximum clients open at once")
+    idle_timeout: float = Field(
+        default=300.0, ge=0, description="Seconds before an idle client is closed"
+    )
+    acquire_timeout: float = Field(
+        default=30.0, ge=0, description="Seconds to wait for a free client"
+    )
+    max_lifetime: Optional[float] = Field(
+        default=None, gt=0, description="Seconds before a client is recycled"
+    )
+    pre_ping: bool = Field(
+        default=False, description="Check clients with a round trip when borrowed"
+    )
+
+
+class PoolStats(BaseModel):
+    key: str = Field(..., description="Registry key of the pool")
+    kind: str = Field(..., description="Connector kind, e.g. mongo, redis")
+    size: int = Field(default=0, description="Clients currently open")
+    idle: int = Field(default=0, description="Open clients waiting to be borrowed")
+    in_use: int = Field(default=0, description="Clients currently borrowed")
+    created: int = Field(default=0, description="Clients created since the pool started")
+    reused: int = Field(default=0, description="Borrows served by an idle client")
+    closed: int = Field(default=0, description="Clients closed by eviction or discard")
+    recycled: int = Field(default=0, description="Clients closed by max_lifetime")
+    failed_checks: int = Field(default=0, description="Clients that failed the borrow check")
+    waits: int = Field(default=0, description="Borrows that had to wait for a free client")
+
+
+class ClientPool(Generic[ClientT]):
+    """
+    Thread-safe pool of driver clients with borrow/return semantics.
+
+    Idle clients are evicted lazily, on borrow and return, once they have
+    been idle for longer than ``idle_timeout`` (keeping ``min_size`` open).
+    Clients older than ``max_lifetime`` are recycled, and idle clients are
+    passed to ``check`` before being handed out.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        kind: str,
+        factory: Callable[[], ClientT],
+        closer: Callable[[ClientT], Any],
+        config: PoolConfig,
+        reset: Optional[Callable[[ClientT], Any]] = None,
+        check: Optional[Callable[[ClientT], bool]] = None,
+    ) -> None:
+        """
+        :param key: Registry key of the pool.
+        :param kind: Connector kind, used in the statistics.
+        :param factory: Creates a new client.
+        :param closer: Closes a client.
+        :param config: Pool sizing and eviction settings.
+        :param reset: Called on a client when it is returned, e.g. a rollback.
+        :param check: Health check of an idle client when it is borrowed.
+        """
+        self.key = key
+        self.kind = kind
+        self.config = config
+        self._factory = factory
+        self._closer = closer
+        self._reset = reset
+        self._check = check
+        self._idle: deque[tuple[ClientT, float]] = deque()
+        self._born: dict[int, float] = {}
+        self._size = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+        self._waits = 0
+        self._recycled = 0
+        self._failed_checks = 0
+
+    def acquire(self) -> ClientT:
+        """
+        Borrow a client, creating one if the pool is below ``max_size``.
+
+        :return: The borrowed client.
+        :raises TimeoutError: If no client is free within ``acquire_timeout``.
+        """
+        deadline = time.monotonic() + self.config.acquire_timeout
+        while True:
+            with self._cond:
+                stale = self._evict_locked()
+                waited = False
+                while not self._idle and self._size >= self.config.max_size:
+                    if self._closed:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out waiting for a {self.kind} client."
+                        )
+                    if not waited:
+                        self._waits += 1
+                        waited = True
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise ValueError(f"Pool {self.kind} is closed.")
+
+                client = None
+                if self._idle:
+                    client, _ = self._idle.pop()
+                else:
+                    self._size += 1
+            self._close_all(stale)
+
+            if client is None:
+                return self._create()
+            if self._healthy(client):
+                with self._cond:
+                    self._reused += 1
+                return client
+            self.release(client, discard=True)
+
+    def _create(self) -> ClientT:
+        try:
+            client = self._factory()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created += 1
+            self._born[id(client)] = time.monotonic()
+        return client
+
+    def _expired(self, client: ClientT) -> bool:
+        lifetime = self.config.max_lifetime
+        born = self._born.get(id(client))
+        return bool(lifetime and born and time.monotonic() - born > lifetime)
+
+    def _healthy(self, client: ClientT) -> bool:
+        if self._expired(client):
+            with self._cond:
+                self._recycled += 1
+            return False
+        if self._check is None:
+            return True
+        try:
+            healthy = self._check(client)
+        except Exception:
+            healthy = False
+        if not healthy:
+            with self._cond:
+                self._failed_checks += 1
+        return healthy
+
+    def release(self, client: ClientT, discard: bool = False) -> None:
+        """
+        Return a borrowed client to the pool.
+
+        :param client: The client returned by ``acquire``.
+        :param discard: Close the client instead of keeping it, e.g. after a
+                        connection error.
+        """
+        if not discard and self._expired(client):
+            discard = True
+            with self._cond:
+                self._recycled += 1
+        if not discard and self._reset is not None:
+            try:
+                self._reset(client)
+            except Exception:
+                discard = True
+
+        with self._cond:
+            if discard or self._closed:
+                self._size -= 1
+                self._evicted += 1
+            else:
+                self._idle.append((client, time.monotonic()))
+                client = None  # type: ignore[assignment]
+            stale = self._evict_locked()
+            self._cond.notify()
+
+        if client is not None:
+            stale.append(client)
+        self._close_all(stale)
+
+    def warm(self) -> None:
+        """
+        Open clients until the pool holds ``min_size`` of them.
+        """
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.config.min_size:
+                    return
+                self._size += 1
+            try:
+                client = self._factory()
+            except BaseException:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._created += 1
+                self._born[id(client)] = time.monotonic()
+                self._idle.append((client, time.monotonic()))
+                self._cond.notify()
+
+    def evict_idle(self) -> int:
+        """
+        Close the clients idle for longer than ``idle_timeout``.
+
+        :return: The number of closed clients.
+        """
+        with self._cond:
+            stale = self._evict_locked()
+        self._close_all(stale)
+        return len(stale)
+
+    def close(self) -> None:
+        """
+        Close every idle client; borrowed clients are closed on return.
+        """
+        with self._cond:
+            self._closed = True
+            stale = [client for client, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(stale)
+            self._evicted += len(stale)
+            self._cond.notify_all()
+        self._close_all(stale)
+
+    def stats(self) -> PoolStats:
+        with self._cond:
+            return PoolStats(
+                key=self.key,
+                kind=self.kind,
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._size - len(self._idle),
+                created=self._created,
+                reused=self._reused,
+                closed=self._evicted,
+                waits=self._waits,
+                recycled=self._recycled,
+                failed_checks=self._failed_checks,
+            )
+
+    def _evict_locked(self) -> list[ClientT]:
+        stale: list[ClientT] = []
+        limit = time.monotonic() - self.config.idle_timeout
+        # ? oldest clients sit at the left, borrowed clients come from the right
+        while (
+            self._idle
+            and self._size > self.config.min_size
+            and self._idle[0][1] < limit
+        ):
+            client, _ = self._idle.popleft()
+            self._size -= 1
+            self._evicted += 1
+            stale.append(client)
+        return stale
+
+    def _close_all(self, clients: list[ClientT]) -> None:
+        for client in clients:
+            self._born.pop(id(client), None)
+            try:
+                self._closer(client)
+            except Exception:
+                pass
+
+
+def release_or_close(
+    pool: Optional[ClientPool[ClientT]],
+    client: Optional[ClientT],
+    closer: Callable[[ClientT], Any],
+    discard: bool = False,
+) -> None:
+    """
+    Return a connector's client to its pool, or close it if it is not pooled.
+
+    Connectors forget both afterwards: a pooled client belongs to the pool
+    again, so a second ``close()`` must not release or close it.
+
+    :param pool: The pool the client was borrowed from, None if not pooled.
+    :param client: The client, None if the connector never got one.
+    :param closer: Closes an unpooled client.
+    :param discard: Close a pooled client instead of keeping it.
+    """
+    if client is None:
+        return
+    if pool is not None:
+        pool.release(client, discard=discard)
+    else:
+        closer(client)
+
+
+def meta_key(kind: str, meta: BaseModel, **extra: Any) -> str:
+    """
+    Return a normalized hash of a connection meta.
+
+    Two metas describing the same connection (same fields, regardless of
+    how they were built) get the same key.
+
+    :param kind: The connector kind, e.g. "mongo"
+    :param meta: The connection metadata
+    :param extra: Extra connection options that change the client
+    :return: A hex digest
+    """
+    payload = json.dumps(
+        [kind, meta.model_dump(mode="json"), extra], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ConnectionRegistry:
+    """
+    Process-wide registry of client pools, keyed by the connection meta.
+
+    Pools are dropped (not closed) in forked children, so gunicorn/uvicorn
+    workers never share sockets inherited from the parent process.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[str, ClientPool] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def pool(
+        self,
+        kind: str,
+        meta: BaseModel,
+        factory: Callable[[], ClientT],
+        closer: Callable[[ClientT], Any],
+        config: Optional[PoolConfig] = None,
+        reset: Optional[Callable[[ClientT], Any]] = None,
+        check: Optional[Callable[[ClientT], bool]] = None,
+        **extra: Any,
+    ) -> ClientPool[ClientT]:
+        """
+        Return the pool of the given connection, creating it on first use.
+
+        :param kind: The connector kind, e.g. "mongo"
+        :param meta: The connection metadata
+        :param factory: Creates a new client
+        :param closer: Closes a client
+        :param config: Pool settings, only used when the pool is created
+        :param reset: Called on a client when it is returned
+        :param check: Health check of an idle client when it is borrowed
+        :param extra: Extra connection options that change the client
+        :return: The shared pool
+        """
+        key = meta_key(kind, meta, **extra)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._forget_locked()
+            pool = self._pools.get(key)
+            created = pool is None
+            if pool is None:
+                pool = ClientPool(
+                    key, kind, factory, closer, config or PoolConfig(), reset, check
+                )
+                self._pools[key] = pool
+        if created:
+            pool.warm()
+        return pool
+
+    def stats(self) -> list[PoolStats]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return [pool.stats() for pool in pools]
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.evict_idle() for pool in pools)
+
+    def close_all(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def _forget_locked(self) -> None:
+        self._pools = {}
+        self._pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._forget_locked()
+
+
+connection_registry = ConnectionRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=connection_registry._after_fork)
@@ -0,0 +1,405 @@
+import csv
+import json
+import math
+import hashlib
+
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping
+
+import numpy as np
+
+from typica.metadata import SchemaRawMeta, Schemas
+
+Chunk = list[Mapping[str, Any]]
+
+_TYPE_NAMES = {int: "int", float: "float", str: "str", bool: "bool"}
+_UINT64 = np.uint64
+
+
+def splitmix64(values: np.ndarray) -> np.ndarray:
+    """
+    Hash 64-bit integers with the SplitMix64 finalizer, vectorized.
+
+    Unlike Python's ``hash`` the result is stable across processes.
+
+    :param values: An int64 or uint64 array.
+    :return: A uint64 array of hashes.
+    """
+    with np.errstate(over="ignore"):
+        z = values.astype(_UINT64) + _UINT64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> _UINT64(30))) * _UINT64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> _UINT64(27))) * _UINT64(0x94D049BB133111EB)
+        return z ^ (z >> _UINT64(31))
+
+
+def hash_numbers(values: np.ndarray) -> tuple[np.ndarray, list[int | float]]:
+    """
+    Hash float64 numbers, an integral float like the equal int.
+
+    :param values: A float64 array.
+    :return: A uint64 array of hashes, and the values with integral floats
+             as ints, e.g. ``1.0`` as ``1``.
+    """
+    integral = np.isfinite(values) & (np.trunc(values) == values) & (np.abs(values) < 2.0**63)
+    hashes = splitmix64(values.view(np.int64))
+    hashes[integral] = splitmix64(values[integral].astype(np.int64))
+    numbers = [
+        int(value) if whole else value
+        for value, whole in zip(values.tolist(), integral.tolist())
+    ]
+    return hashes, numbers
+
+
+def hash_strings(values: Iterable[str]) -> np.ndarray:
+    """
+    Hash strings into uint64 with an 8-byte blake2b digest.
+    """
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+            for value in values
+        ),
+        _UINT64,
+    )
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit hashes.
+
+    Uses ``2 ** precision`` one-byte registers (16 KiB at the default 14,
+    about 0.8% standard error); two sketches merge with an element-wise max.
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        bits = 64 - self.precision
+        index = (hashes >> _UINT64(bits)).astype(np.intp)
+        rest = hashes & _UINT64((1 << bits) - 1)
+        # ? frexp gives the bit length of the remaining bits
+        _, length = np.frexp(rest.astype(np.float64))
+        rank = (bits - length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class TopK:
+    """
+    Mergeable Misra-Gries summary of the most frequent values.
+
+    Holds at most ``capacity`` counters; every value seen more than
+    ``n / capacity`` times is kept, with counts underestimated by at most
+    that amount.
+    """
+
+    def __init__(self, capacity: int = 200) -> None:
+        self.capacity = capacity
+        self.counts: Counter[str] = Counter()
+
+    def update(self, counts: Mapping[str, int]) -> None:
+        self.counts.update(counts)
+        if len(self.counts) > self.capacity:
+            ranked = self.counts.most_common()
+            floor = ranked[self.capacity][1]
+            self.counts = Counter(
+                {value: count - floor for value, count in ranked[: self.capacity] if count > floor}
+            )
+
+    def merge(self, other: "TopK") -> None:
+        self.update(other.counts)
+
+    def top(self, k: int) -> list[str]:
+        return [value for value, _ in self.counts.most_common(k)]
+
+
+class Describe:
+    """
+    Count, mean, variance, min and max of a numeric column, merged with
+    Chan's parallel algorithm.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        other = Describe()
+        other.count = len(values)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self.merge(other)
+
+    def merge(self, other: "Describe") -> None:
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> dict[str, float]:
+        if not self.count:
+            return {}
+        return {
+            "mean": self.mean,
+            "std": math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class ColumnProfile:
+    """
+    Mergeable profile of one column: nulls, types, distinct values,
+    frequent values and numeric statistics.
+    """
+
+    def __init__(self, name: str, precision: int = 14, capacity: int = 200) -> None:
+        self.name = name
+        self.rows = 0
+        self.nulls = 0
+        self.types: Counter[str] = Counter()
+        self.distinct = HyperLogLog(precision)
+        self.frequent = TopK(capacity)
+        self.describe = Describe()
+
+    def update(self, values: list[Any]) -> None:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        nulls = array == None  # noqa: E711
+        present = array[~nulls]
+        self.rows += len(array)
+        self.nulls += int(nulls.sum())
+        if not len(present):
+            return
+
+        types = Counter(map(type, present))
+        self.types.update({_TYPE_NAMES.get(tp, tp.__name__): count for tp, count in types.items()})
+
+        numbers = None
+        if types.keys() <= {int, float}:
+            try:
+                numbers = present.astype(np.float64)
+            except (OverflowError, TypeError):
+                numbers = None
+
+        if numbers is not None:
+            try:
+                if types.keys() == {int}:
+                    uniques, counts = np.unique(present.astype(np.int64), return_counts=True)
+                    hashes, keys = splitmix64(uniques), uniques.tolist()
+                else:
+                    # ? integral floats count as the equal int, in any chunk
+                    uniques, counts = np.unique(numbers, return_counts=True)
+                    hashes, keys = hash_numbers(uniques)
+            except OverflowError:
+                numbers = None
+            else:
+                self.distinct.add_hashes(hashes)
+                self.describe.update(numbers)
+                self.frequent.update(dict(zip(map(str, keys), counts.tolist())))
+                return
+
+        if types.keys() == {str}:
+            counter = Counter(present.tolist())
+        else:
+            counter = Counter(value if isinstance(value, str) else str(value) for value in present)
+        self.distinct.add_hashes(hash_strings(counter))
+        self.frequent.update(counter)
+
+    def merge(self, other: "ColumnProfile") -> None:
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.types.update(other.types)
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        self.describe.merge(other.describe)
+
+    def field_type(self) -> str:
+        names = set(self.types)
+        if names == {"int", "float"}:
+            return "float"
+        return "|".join(sorted(names)) or "null"
+
+    def schema(self, top: int = 10) -> SchemaRawMeta:
+        """
+        Return the ``SchemaRawMeta`` of the column.
+
+        ``describe_field`` holds a JSON object with the row count, the
+        estimated distinct count and, for numbers, mean/std/min/max.
+        """
+        describe = {
+            "count": self.rows - self.nulls,
+            "distinct": self.distinct.count(),
+            **self.describe.summary(),
+        }
+        return SchemaRawMeta.model_validate(
+            {
+                "field_name": self.name,
+                "field_type": self.field_type(),
+                "none_percentage": round(self.nulls / self.rows * 100, 4) if self.rows else 0.0,
+                "unique_value": self.frequent.top(top),
+                "describe_field": json.dumps(describe),
+            }
+        )
+
+
+class TableProfile:
+    """
+    Mergeable profile of every column of a table.
+    """
+
+    def __init__(self, precision: int = 14, capacity: int = 200) -> None:
+        self.precision = precision
+        self.capacity = capacity
+        self.rows = 0
+        self.columns: dict[str, ColumnProfile] = {}
+
+    def _column(self, name: str) -> ColumnProfile:
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = ColumnProfile(name, self.precision, self.capacity)
+            # ? rows seen before the column first appeared were missing it
+            column.rows = column.nulls = self.rows
+        return column
+
+    def update(self, chunk: Chunk) -> None:
+        names = dict.fromkeys(self.columns)
+        if chunk:
+            names.update(dict.fromkeys(chunk[0]))
+            names.update(dict.fromkeys(sorted(set().union(*chunk) - names.keys())))
+        for name in names:
+            self._column(name).update([row.get(name) for row in chunk])
+        self.rows += len(chunk)
+
+    def merge(self, other: "TableProfile") -> None:
+        for name in other.columns:
+            self._column(name)
+        for name, column in self.columns.items():
+            if name in other.columns:
+                column.merge(other.columns[name])
+            else:
+                column.rows += other.rows
+                column.nulls += other.rows
+        self.rows += other.rows
+
+    def schemas(self, top: int = 10) -> Schemas:
+        return Schemas([column.schema(top) for column in self.columns.values()])
+
+
+def _profile_chunk(chunk: Chunk, precision: int, capacity: int) -> TableProfile:
+    profile = TableProfile(precision, capacity)
+    profile.update(chunk)
+    return profile
+
+
+def iter_chunks(rows: Iterable[Mapping[str, Any]], chunk_size: int = 100_000) -> Iterator[Chunk]:
+    """
+    Group an iterable of dicts into chunks.
+    """
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def read_cursor(cursor: Any, chunk_size: int = 100_000) -> Iterator[Chunk]:
+    """
+    Read a DB-API cursor (psycopg, sqlite3, ...) in chunks with ``fetchmany``.
+    """
+    names = [column[0] for column in cursor.description]
+    while rows := cursor.fetchmany(chunk_size):
+        yield [dict(zip(names, row)) for row in rows]
+
+
+def read_csv(path: str, chunk_size: int = 100_000, **kwargs: Any) -> Iterator[Chunk]:
+    """
+    Read a CSV file with a header row in chunks. Empty cells are None.
+
+    :param kwargs: Additional keyword arguments for ``csv.DictReader``.
+    """
+    with open(path, newline="") as file:
+        rows = (
+            {key: value if value != "" else None for key, value in row.items()}
+            for row in csv.DictReader(file, **kwargs)
+        )
+        yield from iter_chunks(rows, chunk_size)
+
+
+def read_jsonl(path: str, chunk_size: int = 100_000) -> Iterator[Chunk]:
+    """
+    Read a JSON Lines file in chunks.
+    """
+    with open(path, "rb") as file:
+        yield from iter_chunks((json.loads(line) for line in file if line.strip()), chunk_size)
+
+
+def profile(
+    chunks: Iterable[Chunk],
+    workers: int = 0,
+    precision: int = 14,
+    capacity: int = 200,
+    top: int = 10,
+) -> Schemas:
+    """
+    Profile a table streamed in chunks into a ``Schemas`` of ``SchemaRawMeta``.
+
+    Memory is bounded by the chunk size and the sketches, whatever the
+    number of rows. With ``workers`` the chunks are profiled in a process
+    pool, at most two per worker in flight, and the partial profiles are
+    merged.
+
+    :param chunks: The chunks, e.g. from ``read_cursor``, ``read_csv``,
+                   ``read_jsonl`` or ``iter_chunks``.
+    :param workers: The number of worker processes, 0 to profile in process.
+    :param precision: The HyperLogLog precision.
+    :param capacity: The counters kept for the frequent values.
+    :param top: The frequent values reported in ``unique_value``.
+    :return: One ``SchemaRawMeta`` per column.
+    """
+    result = TableProfile(precision, capacity)
+    if not workers:
+        for chunk in chunks:
+            result.update(chunk)
+        return result.schemas(top)
+
+    pending: set[Future[TableProfile]] = set()
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in chunks:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result.merge(future.result())
+            pending.add(executor.submit(_profile_chunk, chunk, precision, capacity))
+        for future in pending:
+            result.merge(future.result())
+    return result.schemas(top)
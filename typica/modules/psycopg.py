@@ -1,6 +1,8 @@
 import psycopg2
 
-from psycopg2.extensions import connection, cursor
+from functools import partial
+
+from psycopg2.extensions import connection, cursor, TRANSACTION_STATUS_IDLE
 from psycopg2.errors import (
     IdleSessionTimeout,
     IdleInTransactionSessionTimeout,
@@ -8,6 +10,24 @@ from psycopg2.errors import (
 )
 
 from typica.connection import DBConnectionMeta
+from typica.modules.pool import ClientPool, PoolConfig, connection_registry, release_or_close
+
+
+def check_connection(conn: connection, pre_ping: bool = False) -> bool:
+    """
+    Health check of a pooled connection before it is borrowed.
+
+    :param conn: The idle connection.
+    :param pre_ping: Also run ``SELECT 1`` on the server.
+    :return: True if the connection can be handed out.
+    """
+    if conn.closed or conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+        return False
+    if pre_ping:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+    return True
 
 
 class PostgreConnector:
@@ -15,15 +35,25 @@ class PostgreConnector:
     _meta: DBConnectionMeta
     _conn: connection
     _cursor: cursor
+    _pool: ClientPool[connection] | None = None
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        pooled: bool = False,
+        pool_config: PoolConfig | None = None,
+    ) -> None:
         """
         Initialize the Postgre connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: DBConnectionMeta
+        :param pooled: Borrow connections from the shared connection registry
+                       instead of opening a new one on every connect.
+        :param pool_config: Pool settings, implies ``pooled``.
         """
         self._meta = meta
+        self._pool_config = pool_config or (PoolConfig() if pooled else None)
 
     def __enter__(self) -> "PostgreConnector":
         """
@@ -48,7 +78,7 @@ class PostgreConnector:
         :raises Exception: If any other error occurs during the connection.
         """
         try:
-            self._conn = psycopg2.connect(
+            factory = lambda: psycopg2.connect(  # noqa: E731
                 dbname=self._meta.database,
                 user=self._meta.username,
                 password=self._meta.password,
@@ -56,6 +86,22 @@ class PostgreConnector:
                 port=self._meta.port,
                 **kwargs
             )
+            if self._pool_config:
+                self._pool = connection_registry.pool(
+                    "postgresql",
+                    self._meta,
+                    factory=factory,
+                    closer=connection.close,
+                    config=self._pool_config,
+                    reset=connection.rollback,
+                    check=partial(
+                        check_connection, pre_ping=self._pool_config.pre_ping
+                    ),
+                    **kwargs,
+                )
+                self._conn = self._pool.acquire()
+            else:
+                self._conn = factory()
             self._cursor = self._conn.cursor()
         except ConnectionFailure:
             raise ValueError("PostgreSQL connection failed.")
@@ -64,13 +110,27 @@ class PostgreConnector:
         except Exception as e:
             raise e
 
+    @property
+    def cursor(self) -> cursor:
+        """
+        The cursor opened on the current connection.
+        """
+        return self._cursor
+
     def close(self) -> None:
         """
         Close the connection to the PostgreSQL server.
+        A pooled connection is rolled back and returned to its pool instead.
 
         This method is a no-op if the connection is already closed.
         """
-        if self._cursor:
-            self._cursor.close()
-        if self._conn:
-            self._conn.close()
+        cur = getattr(self, "_cursor", None)
+        conn = getattr(self, "_conn", None)
+        if cur is not None:
+            cur.close()
+        # ? a connection closed by the server is dropped rather than pooled
+        discard = conn is not None and bool(conn.closed)
+        release_or_close(self._pool, conn, connection.close, discard=discard)
+        self._pool = None
+        self._cursor = None  # type: ignore[assignment]
+        self._conn = None  # type: ignore[assignment]
@@ -1,7 +1,127 @@
+import os
+import math
+import threading
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
 from sqlalchemy import Engine, URL, Connection, create_engine, text, CursorResult
 from sqlalchemy.exc import TimeoutError
+from sqlalchemy.sql.elements import TextClause
 
 from typica.connection import DBConnectionMeta
+from typica.modules.pool import PoolConfig, meta_key
+
+
+class EngineConfig(BaseModel):
+    pool_size: int = Field(default=5, ge=0, description="Connections kept in the pool")
+    max_overflow: int = Field(
+        default=10, ge=-1, description="Connections allowed above pool_size"
+    )
+    pool_recycle: int = Field(
+        default=-1, description="Seconds before a connection is recycled, -1 to disable"
+    )
+    pool_pre_ping: bool = Field(
+        default=False, description="Test connections with a round trip when borrowed"
+    )
+    pool_timeout: float = Field(
+        default=30.0, ge=0, description="Seconds to wait for a free connection"
+    )
+    query_cache_size: int = Field(
+        default=500, ge=0, description="Size of the compiled statement cache"
+    )
+
+
+def engine_config_from_pool(config: PoolConfig) -> EngineConfig:
+    """
+    Map the settings of a registry ``PoolConfig`` onto the engine pool.
+
+    ``max_size`` is a hard limit, so the engine gets no overflow;
+    ``min_size`` and ``idle_timeout`` have no engine equivalent.
+    """
+    return EngineConfig(
+        pool_size=config.max_size,
+        max_overflow=0,
+        pool_recycle=math.ceil(config.max_lifetime) if config.max_lifetime else -1,
+        pool_pre_ping=config.pre_ping,
+        pool_timeout=config.acquire_timeout,
+    )
+
+
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(meta: DBConnectionMeta, config: Optional[EngineConfig] = None) -> Engine:
+    """
+    Return the engine of the given connection, creating it on first use.
+
+    Engines are cached per connection meta and config, so their connection
+    pool and compiled statement cache survive across connectors.
+
+    :param meta: The metadata of the database connection.
+    :param config: Pool and cache settings of the engine.
+    :return: The shared engine.
+    """
+    config = config or EngineConfig()
+    key = meta_key("postgresql+sqlalchemy", meta, **config.model_dump())
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(
+                URL.create(
+                    drivername="postgresql",
+                    username=meta.username,
+                    password=meta.password,
+                    host=meta.host,
+                    port=int(meta.port),  # type: ignore
+                    database=meta.database,
+                ),
+                **config.model_dump(),
+            )
+            _engines[key] = engine
+        return engine
+
+
+def dispose_engines() -> None:
+    """
+    Close the pooled connections of every cached engine and forget them.
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _dispose_after_fork() -> None:
+    global _engines_lock
+    _engines_lock = threading.Lock()
+    # ? keep the parent's sockets open, the child only drops its references
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_after_fork)
+
+
+@lru_cache(maxsize=1024)
+def cached_text(sql: str) -> TextClause:
+    """
+    Return a cached ``text()`` construct for the given SQL.
+
+    Bind parameters (``:name``) are parsed once per distinct statement.
+
+    :param sql: The SQL statement.
+    :return: The shared TextClause.
+    """
+    return text(sql)
 
 
 class PostgreConnector:
@@ -10,14 +130,30 @@ class PostgreConnector:
     _engine: Engine
     _conn: Connection
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        pooled: bool = False,
+        pool_config: Optional[PoolConfig] = None,
+        engine_config: Optional[EngineConfig] = None,
+    ) -> None:
         """
         Initialize the Postgre connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: DBConnectionMeta
+        :param pooled: Accepted like the other connectors; connections always
+                       come from the pool of the shared engine.
+        :param pool_config: Pool settings, mapped onto the engine by
+                            ``engine_config_from_pool``.
+        :param engine_config: Pool and cache settings of the shared engine.
         """
+        if pool_config is not None:
+            if engine_config is not None:
+                raise ValueError("Pass either engine_config or pool_config, not both")
+            engine_config = engine_config_from_pool(pool_config)
         self._meta = meta
+        self._engine_config = engine_config
 
     def __enter__(self) -> Connection:
         """
@@ -38,9 +174,18 @@ class PostgreConnector:
         """
         self.close()
 
-    def execute_text(self, sql: str) -> CursorResult:
+    def execute_text(
+        self, sql: str, params: Optional[dict[str, Any] | list[dict[str, Any]]] = None
+    ) -> CursorResult:
+        """
+        Execute a SQL statement with bound parameters.
+
+        :param sql: The SQL statement, with ``:name`` placeholders.
+        :param params: The parameters, or a list of them for executemany.
+        :return: The cursor result.
+        """
         try:
-            res = self._conn.execute(text(sql))
+            res = self._conn.execute(cached_text(sql), params)
             return res
         except Exception as e:
             raise e
@@ -48,6 +193,7 @@ class PostgreConnector:
     def connect(self) -> Connection:
         """
         Establish a connection to the PostgreSQL server.
+        The connection is borrowed from the pool of the shared engine.
 
         :return: The connection object.
         :rtype: Connection
@@ -55,16 +201,7 @@ class PostgreConnector:
         :raises Exception: If any other error occurs during the connection.
         """
         try:
-            self._engine = create_engine(
-                URL.create(
-                    drivername="postgresql",
-                    username=self._meta.username,
-                    password=self._meta.password,
-                    host=self._meta.host,
-                    port=int(self._meta.port),  # type: ignore
-                    database=self._meta.database,
-                )
-            )
+            self._engine = get_engine(self._meta, self._engine_config)
             self._conn = self._engine.connect()
 
             return self._conn
@@ -76,6 +213,7 @@ class PostgreConnector:
     def close(self) -> None:
         """
         Close the connection to the PostgreSQL server.
+        The underlying DBAPI connection goes back to the engine pool.
 
         This method is a no-op if the connection is already closed.
         """
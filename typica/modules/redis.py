@@ -1,23 +1,78 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, TypeVar, cast
+
 from redis import Redis
 from redis.asyncio import Redis as AsyncRedis
 from redis.exceptions import TimeoutError
 
 from typica.connection import RedisConnectionMeta
+from typica.modules.pool import ClientPool, PoolConfig, connection_registry, release_or_close
+
+T = TypeVar("T")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    :param items: Any iterable, consumed lazily.
+    :param size: The maximum size of a batch.
+    :return: An iterator of batches.
+    """
+    if size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def registered_script(scripts: dict[str, tuple[Any, Any]], client: Any, source: str) -> Any:
+    """
+    Return a Lua script registered on a client, sync or async.
+
+    Scripts are registered once per client and kept in ``scripts``; a
+    connector that reconnects gets them registered on its new client.
+
+    :param scripts: The scripts registered so far, by source.
+    :param client: The Redis client.
+    :param source: The Lua source.
+    :return: The registered script.
+    """
+    entry = scripts.get(source)
+    if entry is None or entry[0] is not client:
+        entry = scripts[source] = (client, client.register_script(source))
+    return entry[1]
 
 
 class RedisConnector:
 
     _meta: RedisConnectionMeta
     _client: Redis
-
-    def __init__(self, meta: RedisConnectionMeta) -> None:
+    _pool: ClientPool[Redis] | None = None
+
+    def __init__(
+        self,
+        meta: RedisConnectionMeta,
+        pooled: bool = False,
+        pool_config: PoolConfig | None = None,
+        chunk_size: int = 5_000,
+        transaction: bool = False,
+    ) -> None:
         """
         Initialize the Redis connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: RedisConnectionMeta
+        :param pooled: Borrow clients from the shared connection registry
+                       instead of opening a new one on every connect.
+        :param pool_config: Pool settings, implies ``pooled``.
+        :param chunk_size: Keys sent per round trip by the bulk helpers.
+        :param transaction: Wrap every bulk chunk in MULTI/EXEC.
         """
         self._meta = meta
+        self._pool_config = pool_config or (PoolConfig() if pooled else None)
+        self.chunk_size = chunk_size
+        self.transaction = transaction
 
     def __enter__(self):
         """
@@ -52,6 +107,100 @@ class RedisConnector:
         """
         self.close()
 
+    @property
+    def client(self) -> Redis:
+        """
+        The connected Redis client.
+        """
+        if getattr(self, "_client", None) is None:
+            raise ValueError("Redis not connected.")
+        return self._client
+
+    def mget(self, keys: Iterable[Any]) -> list[Any]:
+        """
+        Get the values of many keys, ``chunk_size`` keys per round trip.
+
+        :param keys: The keys, any iterable.
+        :return: The values in the order of the keys, None for missing keys.
+        """
+        values: list[Any] = []
+        for chunk in batched(keys, self.chunk_size):
+            values.extend(cast(list[Any], self.client.mget(chunk)))
+        return values
+
+    def mset(self, mapping: Mapping[Any, Any], ex: int | None = None) -> int:
+        """
+        Set many keys, ``chunk_size`` keys per round trip.
+
+        :param mapping: The keys and their values.
+        :param ex: Expiry of every key in seconds.
+        :return: The number of keys set.
+        """
+        total = 0
+        for chunk in batched(mapping.items(), self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            if ex is None:
+                pipe.mset(dict(chunk))
+            else:
+                for key, value in chunk:
+                    pipe.set(key, value, ex=ex)
+            pipe.execute()
+            total += len(chunk)
+        return total
+
+    def hset_many(
+        self, items: Mapping[Any, Mapping[Any, Any]], ex: int | None = None
+    ) -> int:
+        """
+        Write many hashes, ``chunk_size`` hashes per round trip.
+
+        Hashes without fields are skipped, HSET needs at least one.
+
+        :param items: The hash keys and their field mappings.
+        :param ex: Expiry of every hash in seconds.
+        :return: The number of hashes written.
+        """
+        total = 0
+        for chunk in batched(((key, fields) for key, fields in items.items() if fields), self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            for key, fields in chunk:
+                pipe.hset(key, mapping=dict(fields))
+                if ex is not None:
+                    pipe.expire(key, ex)
+            pipe.execute()
+            total += len(chunk)
+        return total
+
+    def expire_many(self, keys: Iterable[Any], seconds: int) -> int:
+        """
+        Set the expiry of many keys, ``chunk_size`` keys per round trip.
+
+        :param keys: The keys, any iterable.
+        :param seconds: The expiry in seconds.
+        :return: The number of keys whose expiry was set.
+        """
+        total = 0
+        for chunk in batched(keys, self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            for key in chunk:
+                pipe.expire(key, seconds)
+            total += sum(pipe.execute())
+        return total
+
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        """
+        Delete many keys, ``chunk_size`` keys per round trip.
+
+        :param keys: The keys, any iterable.
+        :return: The number of deleted keys.
+        """
+        total = 0
+        for chunk in batched(keys, self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            pipe.delete(*chunk)
+            total += sum(pipe.execute())
+        return total
+
     def connect(self, other_database: int | None = None) -> None:
         """
         Establish a connection to the Redis server.
@@ -62,14 +211,26 @@ class RedisConnector:
         :raises ValueError: If the connection to the Redis server fails.
         """
         try:
-
-            self._client = Redis(
+            db = other_database if other_database else self._meta.database
+            factory = lambda: Redis(  # noqa: E731
                 host=str(self._meta.host),
                 port=int(self._meta.port),  # type: ignore
                 username=self._meta.username,
                 password=self._meta.password,
-                db=other_database if other_database else self._meta.database,
+                db=db,
             )
+            if self._pool_config:
+                self._pool = connection_registry.pool(
+                    "redis",
+                    self._meta,
+                    factory=factory,
+                    closer=Redis.close,
+                    config=self._pool_config,
+                    db=db,
+                )
+                self._client = self._pool.acquire()
+            else:
+                self._client = factory()
 
         except TimeoutError:
             raise ValueError("Redis connection timed out.")
@@ -79,11 +240,13 @@ class RedisConnector:
     def close(self) -> None:
         """
         Close the connection to the Redis server.
+        A pooled client is returned to its pool instead.
 
         This method is a no-op if the connection is already closed.
         """
-        if self._client:
-            self._client.close()
+        release_or_close(self._pool, getattr(self, "_client", None), Redis.close)
+        self._pool = None
+        self._client = None  # type: ignore[assignment]
 
 
 class AsyncRedisConnector:
@@ -91,21 +254,30 @@ class AsyncRedisConnector:
     _meta: RedisConnectionMeta
     _client: AsyncRedis
 
-    def __init__(self, meta: RedisConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: RedisConnectionMeta,
+        chunk_size: int = 5_000,
+        transaction: bool = False,
+    ) -> None:
         """
         Initialize the Redis connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: RedisConnectionMeta
+        :param chunk_size: Keys sent per round trip by the bulk helpers.
+        :param transaction: Wrap every bulk chunk in MULTI/EXEC.
         """
         self._meta = meta
+        self.chunk_size = chunk_size
+        self.transaction = transaction
 
-    async def __enter__(self):
+    async def __aenter__(self):
         """
         Connect to the Redis server and return the connection object.
 
         :return: The connection object.
-        :rtype: RedisConnector
+        :rtype: AsyncRedisConnector
         :raises ValueError: If the connection to the Redis server fails.
         """
         await self.connect()
@@ -125,7 +297,7 @@ class AsyncRedisConnector:
             raise ValueError("Redis not connected.")
         return True
 
-    async def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Close the connection to the Redis server.
 
@@ -133,6 +305,100 @@ class AsyncRedisConnector:
         """
         await self.close()
 
+    @property
+    def client(self) -> AsyncRedis:
+        """
+        The connected Redis client.
+        """
+        if getattr(self, "_client", None) is None:
+            raise ValueError("Redis not connected.")
+        return self._client
+
+    async def mget(self, keys: Iterable[Any]) -> list[Any]:
+        """
+        Get the values of many keys, ``chunk_size`` keys per round trip.
+
+        :param keys: The keys, any iterable.
+        :return: The values in the order of the keys, None for missing keys.
+        """
+        values: list[Any] = []
+        for chunk in batched(keys, self.chunk_size):
+            values.extend(await self.client.mget(chunk))
+        return values
+
+    async def mset(self, mapping: Mapping[Any, Any], ex: int | None = None) -> int:
+        """
+        Set many keys, ``chunk_size`` keys per round trip.
+
+        :param mapping: The keys and their values.
+        :param ex: Expiry of every key in seconds.
+        :return: The number of keys set.
+        """
+        total = 0
+        for chunk in batched(mapping.items(), self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            if ex is None:
+                pipe.mset(dict(chunk))
+            else:
+                for key, value in chunk:
+                    pipe.set(key, value, ex=ex)
+            await pipe.execute()
+            total += len(chunk)
+        return total
+
+    async def hset_many(
+        self, items: Mapping[Any, Mapping[Any, Any]], ex: int | None = None
+    ) -> int:
+        """
+        Write many hashes, ``chunk_size`` hashes per round trip.
+
+        Hashes without fields are skipped, HSET needs at least one.
+
+        :param items: The hash keys and their field mappings.
+        :param ex: Expiry of every hash in seconds.
+        :return: The number of hashes written.
+        """
+        total = 0
+        for chunk in batched(((key, fields) for key, fields in items.items() if fields), self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            for key, fields in chunk:
+                pipe.hset(key, mapping=dict(fields))
+                if ex is not None:
+                    pipe.expire(key, ex)
+            await pipe.execute()
+            total += len(chunk)
+        return total
+
+    async def expire_many(self, keys: Iterable[Any], seconds: int) -> int:
+        """
+        Set the expiry of many keys, ``chunk_size`` keys per round trip.
+
+        :param keys: The keys, any iterable.
+        :param seconds: The expiry in seconds.
+        :return: The number of keys whose expiry was set.
+        """
+        total = 0
+        for chunk in batched(keys, self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            for key in chunk:
+                pipe.expire(key, seconds)
+            total += sum(await pipe.execute())
+        return total
+
+    async def delete_many(self, keys: Iterable[Any]) -> int:
+        """
+        Delete many keys, ``chunk_size`` keys per round trip.
+
+        :param keys: The keys, any iterable.
+        :return: The number of deleted keys.
+        """
+        total = 0
+        for chunk in batched(keys, self.chunk_size):
+            pipe = self.client.pipeline(transaction=self.transaction)
+            pipe.delete(*chunk)
+            total += sum(await pipe.execute())
+        return total
+
     async def connect(self, other_database: int | None = None) -> None:
         """
         Establish a connection to the Redis server.
@@ -0,0 +1,338 @@
+import math
+import time
+import random
+import threading
+
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from pydantic import BaseModel, Field
+
+from typica.base import type_adapter
+from typica.modules.redis import RedisConnector, registered_script
+
+T = TypeVar("T")
+
+# ? take the lock only if free, drawing a token from the fence hash; the fence
+# ? lives at least as long as the lease, and with the entry it guards
+_ACQUIRE = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return false
+end
+local token = redis.call('HINCRBY', KEYS[2], 'n', 1)
+if redis.call('PTTL', KEYS[2]) < tonumber(ARGV[1]) then
+    redis.call('PEXPIRE', KEYS[2], ARGV[1])
+end
+redis.call('SET', KEYS[1], token, 'PX', ARGV[1])
+return token
+"""
+
+# ? release only if the lock still holds our token
+_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# ? write only if no newer fencing token already wrote the entry
+_WRITE = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'f') or '0')
+if current > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'v', ARGV[2], 'd', ARGV[3], 'e', ARGV[4], 'f', ARGV[1])
+redis.call('PEXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+
+class SingleFlight:
+    """
+    In-process request coalescing: concurrent calls with the same key run
+    the function once, and every caller gets its result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, "_Call"] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` unless a call with the same key is already in flight.
+
+        :param key: The coalescing key.
+        :param fn: The function to run.
+        :return: The result of the single call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RedisLock:
+    """
+    Redis lock with a lease and a fencing token.
+
+    Every acquisition gets a token from a monotonic counter, so writes made
+    by a holder whose lease expired can be rejected. The counter is the
+    ``n`` field of the ``fence`` hash, kept for at least the lease and only
+    incremented when the lock is taken.
+    """
+
+    def __init__(
+        self,
+        connector: RedisConnector,
+        name: str,
+        lease: float = 10.0,
+        scripts: Optional[dict[str, tuple[Any, Any]]] = None,
+        fence: Optional[str] = None,
+    ) -> None:
+        """
+        :param connector: A connected Redis connector.
+        :param name: The lock name.
+        :param lease: Seconds before the lock expires if it is not released.
+        :param scripts: Registered Lua scripts to reuse, e.g. those of a ``StampedeGuard``.
+        :param fence: The hash holding the counter, e.g. the guarded entry,
+                      defaults to ``{name}:fence``.
+        """
+        self.connector = connector
+        self.name = name
+        self.lease = lease
+        self.fence = fence or f"{name}:fence"
+        self.token: Optional[int] = None
+        self._scripts = {} if scripts is None else scripts
+
+    def acquire(self) -> bool:
+        """
+        Try to take the lock without blocking.
+
+        :return: True if the lock was taken, ``token`` then holds its fencing token.
+        """
+        script = registered_script(self._scripts, self.connector.client, _ACQUIRE)
+        token = script(keys=[self.name, self.fence], args=[int(self.lease * 1000)])
+        if token is None:
+            return False
+        self.token = int(token)
+        return True
+
+    def release(self) -> bool:
+        """
+        Release the lock if it is still ours.
+        """
+        if self.token is None:
+            return False
+        script = registered_script(self._scripts, self.connector.client, _RELEASE)
+        released = bool(script(keys=[self.name], args=[self.token]))
+        self.token = None
+        return released
+
+    def __enter__(self) -> "RedisLock":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+
+class StampedeStats(BaseModel):
+    hits: int = Field(default=0, description="Fresh values served from Redis")
+    early_refreshes: int = Field(default=0, description="Recomputations started before expiry")
+    computes: int = Field(default=0, description="Calls of the compute function")
+    waits: int = Field(default=0, description="Callers that waited for another worker")
+    stale_served: int = Field(default=0, description="Stale values served during a refresh")
+    coalesced: int = Field(default=0, description="Calls coalesced in this process")
+
+
+def should_refresh(delta: float, expiry: float, beta: float = 1.0, now: Optional[float] = None) -> bool:
+    """
+    Probabilistic early expiration (XFetch).
+
+    The closer the entry is to its expiry, and the longer it took to
+    compute, the more likely a caller refreshes it ahead of time.
+
+    :param delta: Seconds the value took to compute.
+    :param expiry: Unix time when the value expires.
+    :param beta: Eagerness, above 1 refreshes earlier.
+    :param now: The current unix time.
+    """
+    now = time.time() if now is None else now
+    return now - delta * beta * math.log(random.random() or 1e-12) >= expiry
+
+
+class StampedeGuard:
+    """
+    Cache-aside reads protected against stampedes on hot keys.
+
+    - Callers of one process are coalesced with ``SingleFlight``.
+    - Across processes one worker recomputes under a ``RedisLock``, the
+      others wait for the fresh value (or get the stale one during an
+      early refresh) instead of recomputing.
+    - Entries are refreshed before their TTL runs out with XFetch.
+    """
+
+    def __init__(
+        self,
+        connector: RedisConnector,
+        namespace: str = "typica:sf",
+        ttl: int = 60,
+        lease: float = 10.0,
+        beta: float = 1.0,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.02,
+    ) -> None:
+        """
+        :param connector: A connected Redis connector.
+        :param namespace: Prefix of every key.
+        :param ttl: Time to live of the values in seconds.
+        :param lease: Lease of the recompute lock in seconds.
+        :param beta: XFetch eagerness, 0 disables early refresh.
+        :param wait_timeout: Seconds a waiter waits before computing itself.
+        :param poll_interval: Seconds between two polls of a waiter.
+        """
+        self.connector = connector
+        self.namespace = namespace
+        self.ttl = ttl
+        self.lease = lease
+        self.beta = beta
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.flight = SingleFlight()
+        self._scripts: dict[str, tuple[Any, Any]] = {}
+        self._stats = StampedeStats()
+        self._lock = threading.Lock()
+
+    def stats(self) -> StampedeStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
+
+    def get_or_compute(
+        self, key: str, fn: Callable[[], Any], model: Any, ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Return the cached value of a key, computing it at most once across workers.
+
+        :param key: The cache key.
+        :param fn: Computes the value on a miss.
+        :param model: The type of the value, used to serialize it.
+        :param ttl: Time to live in seconds, defaults to the guard ``ttl``.
+        """
+        entry = self._read(key, model)
+        if entry is not None and not self._should_refresh(entry):
+            self._count("hits")
+            return entry[0]
+
+        if key in self.flight:
+            self._count("coalesced")
+        return self.flight.do(key, lambda: self._refresh(key, fn, model, ttl, entry))
+
+    def _should_refresh(self, entry: tuple[Any, float, float]) -> bool:
+        _, delta, expiry = entry
+        if time.time() >= expiry:
+            return True
+        if self.beta and should_refresh(delta, expiry, self.beta):
+            self._count("early_refreshes")
+            return True
+        return False
+
+    def _read(self, key: str, model: Any) -> Optional[tuple[Any, float, float]]:
+        value, delta, expiry = cast(
+            list[Optional[bytes]],
+            self.connector.client.hmget(f"{self.namespace}:{key}", ["v", "d", "e"]),
+        )
+        if value is None or delta is None or expiry is None:
+            return None
+        return type_adapter(model).validate_json(value), float(delta), float(expiry)
+
+    def _refresh(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        model: Any,
+        ttl: Optional[int],
+        stale: Optional[tuple[Any, float, float]],
+    ) -> Any:
+        # ? the counter lives in the entry, so it expires with the tokens it wrote
+        lock = RedisLock(
+            self.connector,
+            f"{self.namespace}:lock:{key}",
+            self.lease,
+            self._scripts,
+            fence=f"{self.namespace}:{key}",
+        )
+        if lock.acquire():
+            with lock:
+                return self._compute(key, fn, model, ttl, lock.token)
+
+        # ? someone else is recomputing: serve the stale value if we have one
+        if stale is not None and time.time() < stale[2]:
+            self._count("stale_served")
+            return stale[0]
+
+        self._count("waits")
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            entry = self._read(key, model)
+            if entry is not None and time.time() < entry[2]:
+                return entry[0]
+            if lock.acquire():
+                with lock:
+                    return self._compute(key, fn, model, ttl, lock.token)
+        return self._compute(key, fn, model, ttl, None)
+
+    def _compute(
+        self, key: str, fn: Callable[[], Any], model: Any, ttl: Optional[int], token: Optional[int]
+    ) -> Any:
+        start = time.time()
+        value = fn()
+        self._count("computes")
+        delta = time.time() - start
+        ttl = ttl or self.ttl
+        if token is not None:
+            script = registered_script(self._scripts, self.connector.client, _WRITE)
+            script(
+                keys=[f"{self.namespace}:{key}"],
+                args=[
+                    token,
+                    type_adapter(model).dump_json(value),
+                    delta,
+                    time.time() + ttl,
+                    int(ttl * 1000),
+                ],
+            )
+        return value
@@ -0,0 +1,637 @@
+import re
+import hmac
+import json
+import uuid
+import base64
+import hashlib
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Literal, NamedTuple, Optional, Sequence
+
+from .schema import (
+    CursorPaginationSchema,
+    FilterGroupSchema,
+    FilterOpsSchema,
+    OrderSchema,
+    PaginationSchema,
+)
+from .utils.enums import FilterOption, Operator
+
+Dialect = Literal["psycopg", "sqlalchemy", "clickhouse"]
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+_SQL_COMPARISON = {
+    Operator.equal: "=",
+    Operator.unequal: "<>",
+    Operator.gte: ">=",
+    Operator.gt: ">",
+    Operator.lte: "<=",
+    Operator.lt: "<",
+}
+
+_MONGO_OPERATOR = {
+    Operator.unequal: "$ne",
+    Operator.regex: "$regex",
+    Operator.gte: "$gte",
+    Operator.gt: "$gt",
+    Operator.lte: "$lte",
+    Operator.lt: "$lt",
+    Operator.include: "$in",
+    Operator.exclude: "$nin",
+}
+
+
+class MongoQuery(NamedTuple):
+    filter: dict[str, Any]
+    sort: Optional[list[tuple[str, int]]]
+    skip: int
+    limit: int
+
+
+class SQLQuery(NamedTuple):
+    where: str
+    params: dict[str, Any]
+    order_by: str
+    limit: str
+
+    def statement(self, select: str) -> str:
+        """
+        Append the compiled clauses to a SELECT statement.
+
+        :param select: The statement, e.g. ``SELECT * FROM events``.
+        :return: The full statement.
+        """
+        clauses = [select]
+        if self.where:
+            clauses.append(f"WHERE {self.where}")
+        if self.order_by:
+            clauses.append(self.order_by)
+        if self.limit:
+            clauses.append(self.limit)
+        return " ".join(clauses)
+
+
+class _Param(NamedTuple):
+    position: int
+
+
+# ? a filter shape: (option, field, operator, flag); the flag carries the part
+# ? of the value that changes the plan, e.g. ``exist`` true/false, a None value
+# ? or an empty ``in``/``nin`` list
+_Shape = tuple[tuple[str, str, Operator, Optional[bool]], ...]
+
+
+def validate_identifier(name: Optional[str]) -> str:
+    """
+    Check that a field name is a plain (dotted) identifier, so it can be
+    placed in a query without escaping.
+
+    :param name: The field name.
+    :return: The field name.
+    :raises ValueError: If the name is not a valid identifier.
+    """
+    if not name or not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid field name: {name!r}")
+    return name
+
+
+def _operator(filter_op: Optional[str]) -> Operator:
+    try:
+        return Operator(filter_op or Operator.equal.value)
+    except ValueError:
+        raise ValueError(f"Unsupported filter operation: {filter_op!r}")
+
+
+def _flag(op: Operator, value: Any) -> Optional[bool]:
+    if op is Operator.exist:
+        return value is None or bool(value)
+    if op is Operator.not_exist:
+        return not (value is None or bool(value))
+    if op in (Operator.equal, Operator.unequal) and value is None:
+        return True
+    if op in (Operator.include, Operator.exclude) and isinstance(value, (list, tuple, set)) and not value:
+        return True
+    return None
+
+
+def _groups(
+    filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None,
+) -> FilterGroupSchema:
+    if filters is None:
+        return FilterGroupSchema()
+    if isinstance(filters, FilterGroupSchema):
+        return filters
+    return FilterGroupSchema(must=list(filters))
+
+
+def _shape(groups: FilterGroupSchema) -> tuple[_Shape, list[Any]]:
+    shape = []
+    values = []
+    for option in FilterOption:
+        for item in getattr(groups, option.value):
+            op = _operator(item.filter_op)
+            flag = _flag(op, item.filter_value)
+            if op is Operator.not_exist:
+                op = Operator.exist
+            shape.append((option.value, validate_identifier(item.filter_by), op, flag))
+            if flag is None:
+                value = item.filter_value
+                if op in (Operator.include, Operator.exclude):
+                    value = list(value) if isinstance(value, (list, tuple, set)) else [value]
+                values.append(value)
+    return tuple(shape), values
+
+
+def _combine(option: str, clauses: list, and_: Any, or_: Any, nor: Any) -> Any:
+    if option == FilterOption.must.value:
+        return and_(clauses)
+    if option == FilterOption.should.value:
+        return or_(clauses)
+    if option == FilterOption.mustnt.value:
+        return nor(clauses)
+    return nor([and_(clauses)])
+
+
+# ? Mongo
+
+
+def _mongo_clause(field: str, op: Operator, flag: Optional[bool], param: Optional[_Param]) -> dict:
+    if op is Operator.exist:
+        return {field: {"$exists": flag}}
+    if op is Operator.equal:
+        return {field: None if flag else {"$eq": param}}
+    if op is Operator.unequal and flag:
+        return {field: {"$ne": None}}
+    if flag:
+        return {field: {_MONGO_OPERATOR[op]: []}}
+    return {field: {_MONGO_OPERATOR[op]: param}}
+
+
+def _mongo_and(clauses: list) -> dict:
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+@lru_cache(maxsize=1024)
+def _mongo_plan(shape: _Shape) -> dict:
+    grouped: dict[str, list] = {}
+    index = 0
+    for option, field, op, flag in shape:
+        param = None
+        if flag is None:
+            param = _Param(index)
+            index += 1
+        grouped.setdefault(option, []).append(_mongo_clause(field, op, flag, param))
+
+    parts = [
+        _combine(
+            option,
+            clauses,
+            _mongo_and,
+            lambda items: items[0] if len(items) == 1 else {"$or": items},
+            lambda items: {"$nor": items},
+        )
+        for option, clauses in grouped.items()
+    ]
+    return {} if not parts else _mongo_and(parts)
+
+
+def _bind(template: Any, values: list[Any]) -> Any:
+    if isinstance(template, _Param):
+        return values[template.position]
+    if isinstance(template, dict):
+        return {key: _bind(item, values) for key, item in template.items()}
+    if isinstance(template, list):
+        return [_bind(item, values) for item in template]
+    return template
+
+
+def _direction(order: Optional[OrderSchema]) -> Optional[tuple[str, bool]]:
+    if order is None or not order.order_by:
+        return None
+    descending = str(order.order_type).lower() in ("-1", "desc", "descending")
+    return validate_identifier(order.order_by), descending
+
+
+def _skip_limit(pagination: Optional[PaginationSchema]) -> tuple[int, int]:
+    if pagination is None or not pagination.size:
+        return 0, 0
+    return ((pagination.page or 1) - 1) * pagination.size, pagination.size
+
+
+def compile_mongo(
+    filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None,
+    order: Optional[OrderSchema] = None,
+    pagination: Optional[PaginationSchema] = None,
+) -> MongoQuery:
+    """
+    Compile filters, order and pagination into a Mongo query.
+
+    A plain list of filters is treated as ``must``. The filter document is
+    built from a plan cached per filter shape, so repeated queries only
+    bind their values.
+
+    :param filters: The filters, grouped by ``FilterOption``.
+    :param order: The sort order.
+    :param pagination: The page and size, pushed down as skip and limit.
+    :return: The filter, sort, skip and limit for ``find``.
+    """
+    shape, values = _shape(_groups(filters))
+    direction = _direction(order)
+    skip, limit = _skip_limit(pagination)
+    return MongoQuery(
+        filter=_bind(_mongo_plan(shape), values),
+        sort=[(direction[0], -1 if direction[1] else 1)] if direction else None,
+        skip=skip,
+        limit=limit,
+    )
+
+
+# ? SQL
+
+
+def _quote(field: str, dialect: Dialect) -> str:
+    quote = "`" if dialect == "clickhouse" else '"'
+    return ".".join(f"{quote}{part}{quote}" for part in field.split("."))
+
+
+def _placeholder(index: int, dialect: Dialect, prefix: str = "p") -> str:
+    return f":{prefix}{index}" if dialect == "sqlalchemy" else f"%({prefix}{index})s"
+
+
+def _sql_clause(
+    column: str, op: Operator, flag: Optional[bool], param: str, dialect: Dialect
+) -> str:
+    if op is Operator.exist:
+        return f"{column} IS NOT NULL" if flag else f"{column} IS NULL"
+    if flag and op is Operator.equal:
+        return f"{column} IS NULL"
+    if flag and op is Operator.unequal:
+        return f"{column} IS NOT NULL"
+    # ? an empty list matches no row for ``in`` and every row for ``nin``
+    if flag and op is Operator.include:
+        return "FALSE"
+    if flag and op is Operator.exclude:
+        return "TRUE"
+    if op in _SQL_COMPARISON:
+        return f"{column} {_SQL_COMPARISON[op]} {param}"
+    if op is Operator.regex:
+        return f"match({column}, {param})" if dialect == "clickhouse" else f"{column} ~ {param}"
+    if dialect == "clickhouse":
+        return f"{column} {'IN' if op is Operator.include else 'NOT IN'} {param}"
+    return f"{column} = ANY({param})" if op is Operator.include else f"{column} <> ALL({param})"
+
+
+@lru_cache(maxsize=1024)
+def _sql_plan(shape: _Shape, dialect: Dialect) -> str:
+    grouped: dict[str, list[str]] = {}
+    index = 0
+    for option, field, op, flag in shape:
+        param = ""
+        if flag is None:
+            param = _placeholder(index, dialect)
+            index += 1
+        clause = _sql_clause(_quote(field, dialect), op, flag, param, dialect)
+        grouped.setdefault(option, []).append(clause)
+
+    parts = [
+        _combine(
+            option,
+            clauses,
+            lambda items: " AND ".join(items),
+            lambda items: f"({' OR '.join(items)})",
+            # ? rows where a clause is NULL do not match it, so they are kept
+            lambda items: f"NOT COALESCE(({' OR '.join(items)}), FALSE)",
+        )
+        for option, clauses in grouped.items()
+    ]
+    return " AND ".join(f"({part})" if len(parts) > 1 else part for part in parts)
+
+
+def compile_sql(
+    filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None,
+    order: Optional[OrderSchema] = None,
+    pagination: Optional[PaginationSchema] = None,
+    dialect: Dialect = "psycopg",
+) -> SQLQuery:
+    """
+    Compile filters, order and pagination into parameterized SQL clauses.
+
+    Values are always bound as parameters: ``%(p0)s`` for psycopg and
+    clickhouse-connect, ``:p0`` for SQLAlchemy ``text()``. Field names are
+    validated and quoted. The WHERE clause is cached per filter shape.
+
+    :param filters: The filters, grouped by ``FilterOption``.
+    :param order: The sort order.
+    :param pagination: The page and size, pushed down as LIMIT and OFFSET.
+    :param dialect: ``psycopg``, ``sqlalchemy`` or ``clickhouse``.
+    :return: The WHERE, ORDER BY and LIMIT clauses and their parameters.
+    """
+    shape, values = _shape(_groups(filters))
+    if dialect == "clickhouse":
+        values = [tuple(value) if isinstance(value, list) else value for value in values]
+
+    direction = _direction(order)
+    order_by = ""
+    if direction:
+        order_by = f"ORDER BY {_quote(direction[0], dialect)} {'DESC' if direction[1] else 'ASC'}"
+
+    skip, limit = _skip_limit(pagination)
+    limit_clause = ""
+    if limit:
+        limit_clause = f"LIMIT {limit}" + (f" OFFSET {skip}" if skip else "")
+
+    return SQLQuery(
+        where=_sql_plan(shape, dialect),
+        params={f"p{index}": value for index, value in enumerate(values)},
+        order_by=order_by,
+        limit=limit_clause,
+    )
+
+
+# ? counts
+
+
+def compile_count_sql(
+    table: str,
+    filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None,
+    dialect: Dialect = "psycopg",
+) -> tuple[str, dict[str, Any]]:
+    """
+    Compile the exact count of the rows matching the filters.
+
+    :param table: The table name, optionally schema qualified.
+    :param filters: The filters, compiled as in ``compile_sql``.
+    :param dialect: ``psycopg``, ``sqlalchemy`` or ``clickhouse``.
+    :return: The statement and its parameters.
+    """
+    query = compile_sql(filters, dialect=dialect)
+    select = f"SELECT count(*) FROM {_quote(validate_identifier(table), dialect)}"
+    return query.statement(select), query.params
+
+
+def compile_estimated_count_sql(
+    table: str, dialect: Dialect = "psycopg"
+) -> tuple[str, dict[str, Any]]:
+    """
+    Compile a cheap estimate of the number of rows of a table.
+
+    Postgres reads the planner statistics (``pg_class.reltuples``, kept up
+    to date by ANALYZE and autovacuum); ClickHouse sums the rows of the
+    active parts in ``system.parts``. Neither scans the table, and both
+    ignore filters.
+
+    :param table: The table name, optionally schema qualified.
+    :param dialect: ``psycopg``, ``sqlalchemy`` or ``clickhouse``.
+    :return: The statement and its parameters.
+    """
+    table = validate_identifier(table)
+    if dialect == "clickhouse":
+        database, _, name = table.rpartition(".")
+        sql = (
+            "SELECT sum(rows) FROM system.parts WHERE active"
+            f" AND database = {'%(t1)s' if database else 'currentDatabase()'}"
+            " AND table = %(t0)s"
+        )
+        return sql, {"t0": name, **({"t1": database} if database else {})}
+    param = _placeholder(0, dialect, "t")
+    sql = f"SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = to_regclass({param})"
+    return sql, {"t0": table}
+
+
+# ? keyset pagination
+
+
+class Cursor(NamedTuple):
+    order_by: str
+    key: Any
+    id: Any
+    direction: Literal["next", "prev"]
+
+
+class KeysetPage(NamedTuple):
+    items: list[Any]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+    has_more: bool
+
+
+def _encode_value(value: Any) -> Any:
+    # ? keep the types that backends compare natively, Mongo would not match
+    # ? a datetime or a UUID against its string form
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$date" in value:
+            return date.fromisoformat(value["$date"])
+        if "$uuid" in value:
+            return uuid.UUID(value["$uuid"])
+    return value
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _signature(payload: bytes, secret: bytes | str) -> bytes:
+    key = secret.encode() if isinstance(secret, str) else secret
+    return hmac.new(key, payload, hashlib.sha256).digest()[:16]
+
+
+def encode_cursor(cursor: Cursor, secret: bytes | str) -> str:
+    """
+    Encode a cursor into an opaque, signed token.
+
+    :param cursor: The order field, the last seen key and id, and the direction.
+    :param secret: The HMAC key.
+    :return: The URL-safe token.
+    """
+    payload = json.dumps(
+        [cursor.order_by, _encode_value(cursor.key), _encode_value(cursor.id), cursor.direction],
+        separators=(",", ":"),
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_signature(payload, secret))}"
+
+
+def decode_cursor(token: str, secret: bytes | str) -> Cursor:
+    """
+    Decode and verify a cursor token.
+
+    :param token: The token from ``encode_cursor``.
+    :param secret: The HMAC key.
+    :return: The cursor.
+    :raises ValueError: If the token is malformed or its signature is invalid.
+    """
+    try:
+        payload_part, signature_part = token.split(".")
+        payload = _b64decode(payload_part)
+        valid = hmac.compare_digest(_b64decode(signature_part), _signature(payload, secret))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not valid:
+        raise ValueError("Invalid cursor")
+    order_by, key, id_, direction = json.loads(payload)
+    return Cursor(order_by, _decode_value(key), _decode_value(id_), direction)
+
+
+def _keyset(
+    pagination: CursorPaginationSchema, order: Optional[OrderSchema], id_field: str, secret: bytes | str
+) -> tuple[str, bool, Optional[Cursor]]:
+    id_field = validate_identifier(id_field)
+    field, descending = _direction(order) or (id_field, False)
+    cursor = decode_cursor(pagination.cursor, secret) if pagination.cursor else None
+    if cursor is not None and cursor.order_by != field:
+        raise ValueError("Cursor does not match the requested order")
+    # ? a previous page is read backwards from the cursor, then reversed
+    backwards = descending != (cursor is not None and cursor.direction == "prev")
+    return field, backwards, cursor
+
+
+def compile_keyset_sql(
+    pagination: CursorPaginationSchema,
+    secret: bytes | str,
+    order: Optional[OrderSchema] = None,
+    filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None,
+    id_field: str = "id",
+    dialect: Dialect = "psycopg",
+) -> SQLQuery:
+    """
+    Compile a keyset page into parameterized SQL clauses.
+
+    Rows after the cursor are selected with a row comparison on the order
+    field and the id, so every page is an index range scan instead of an
+    OFFSET scan. One extra row is fetched to detect a following page; pass
+    the rows to ``keyset_page``.
+
+    :param pagination: The cursor and page size.
+    :param secret: The HMAC key of the cursors.
+    :param order: The sort order, defaults to the id.
+    :param filters: The filters, compiled as in ``compile_sql``.
+    :param id_field: The unique tie-breaker field.
+    :param dialect: ``psycopg``, ``sqlalchemy`` or ``clickhouse``.
+    :return: The WHERE, ORDER BY and LIMIT clauses and their parameters.
+    """
+    field, backwards, cursor = _keyset(pagination, order, id_field, secret)
+    query = compile_sql(filters, dialect=dialect)
+    column, id_column = _quote(field, dialect), _quote(id_field, dialect)
+    where, params = query.where, dict(query.params)
+
+    if cursor is not None:
+        keyset = (
+            f"({column}, {id_column}) {'<' if backwards else '>'} "
+            f"({_placeholder(0, dialect, 'k')}, {_placeholder(1, dialect, 'k')})"
+        )
+        where = f"({where}) AND {keyset}" if where else keyset
+        params.update(k0=cursor.key, k1=cursor.id)
+
+    direction = "DESC" if backwards else "ASC"
+    if field == id_field:
+        order_by = f"ORDER BY {id_column} {direction}"
+    else:
+        order_by = f"ORDER BY {column} {direction}, {id_column} {direction}"
+    return SQLQuery(where, params, order_by, f"LIMIT {pagination.size + 1}")  # type: ignore[operator]
+
+
+def compile_keyset_mongo(
+    pagination: CursorPaginationSchema,
+    secret: bytes | str,
+    order: Optional[OrderSchema] = None,
+    filters: FilterGroupSchema | Sequence[FilterOpsSchema] | None = None,
+    id_field: str = "_id",
+) -> MongoQuery:
+    """
+    Compile a keyset page into a Mongo query.
+
+    Same contract as ``compile_keyset_sql``.
+
+    :return: The filter, sort and limit for ``find``.
+    """
+    field, backwards, cursor = _keyset(pagination, order, id_field, secret)
+    query = compile_mongo(filters)
+    where = query.filter
+    if cursor is not None:
+        op = "$lt" if backwards else "$gt"
+        if field == id_field:
+            keyset = {id_field: {op: cursor.id}}
+        else:
+            keyset = {
+                "$or": [
+                    {field: {op: cursor.key}},
+                    {field: cursor.key, id_field: {op: cursor.id}},
+                ]
+            }
+        where = {"$and": [where, keyset]} if where else keyset
+
+    direction = -1 if backwards else 1
+    sort = [(field, direction)] if field == id_field else [(field, direction), (id_field, direction)]
+    return MongoQuery(where, sort, 0, pagination.size + 1)  # type: ignore[operator]
+
+
+def _get(row: Any, field: str) -> Any:
+    try:
+        return row[field]
+    except (KeyError, TypeError, IndexError):
+        return getattr(row, field)
+
+
+def keyset_page(
+    rows: Sequence[Any],
+    pagination: CursorPaginationSchema,
+    secret: bytes | str,
+    order: Optional[OrderSchema] = None,
+    id_field: str = "id",
+    getter: Callable[[Any, str], Any] = _get,
+) -> KeysetPage:
+    """
+    Turn the rows fetched with a compiled keyset query into a page.
+
+    :param rows: The rows, as fetched (``size + 1`` at most).
+    :param pagination: The cursor and page size used for the query.
+    :param secret: The HMAC key of the cursors.
+    :param order: The sort order used for the query.
+    :param id_field: The unique tie-breaker field.
+    :param getter: Reads a field of a row, by default by key, then by attribute.
+    :return: The items in order and the cursors of the adjacent pages.
+    """
+    field, _, cursor = _keyset(pagination, order, id_field, secret)
+    size = pagination.size or 0
+    has_more = len(rows) > size
+    items = list(rows[:size])
+    prev = cursor is not None and cursor.direction == "prev"
+    if prev:
+        items.reverse()
+
+    def token(row: Any, direction: Literal["next", "prev"]) -> str:
+        return encode_cursor(
+            Cursor(field, getter(row, field), getter(row, id_field), direction), secret
+        )
+
+    next_cursor = prev_cursor = None
+    if items and (prev or has_more):
+        next_cursor = token(items[-1], "next")
+    if items and (has_more if prev else cursor is not None):
+        prev_cursor = token(items[0], "prev")
+    return KeysetPage(items, next_cursor, prev_cursor, has_more)
+
+
+def plan_cache_clear() -> None:
+    """
+    Drop every cached query plan.
+    """
+    _mongo_plan.cache_clear()
+    _sql_plan.cache_clear()
@@ -1,7 +1,11 @@
+import threading
+
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field, create_model
 
+from .utils.enums import CountStrategy
+
 
 class BaseResponseMeta(BaseModel):
     code: int
@@ -12,13 +16,106 @@ class PaginationResponseMeta(BaseResponseMeta):
     page: Optional[int] = Field(1, gt=0)
     size: Optional[int] = Field(10, ge=0)
     total: Optional[int] = Field(10, ge=0)
+    count_strategy: Optional[str] = Field(
+        CountStrategy.exact.value, description="How precise the total is"
+    )
+    has_more: Optional[bool] = Field(None, description="Whether another page exists")
+
+
+class CursorPaginationResponseMeta(BaseResponseMeta):
+    size: Optional[int] = Field(10, ge=0)
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page")
+    prev_cursor: Optional[str] = Field(None, description="Cursor of the previous page")
+
+
+class ResponseRegistryStats(BaseModel):
+    built: int = Field(0, description="Number of envelope models created")
+    reused: int = Field(0, description="Number of lookups served from the registry")
+    size: int = Field(0, description="Number of models currently interned")
+
+
+class ResponseRegistry:
+    """
+    Process-wide store of the envelope models generated by ``ServiceResponse``.
+
+    Models are interned by route name, template kind, message and data model,
+    so building the responses of the same route twice returns the same classes.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._models: dict[tuple, type[BaseModel]] = {}
+        self._lock = threading.Lock()
+        self._built = 0
+        self._reused = 0
+
+    def model(
+        self, route_name: str, kind: str, message: str, **fields: Any
+    ) -> type[BaseModel]:
+        """
+        Return the envelope model for the given template, creating it once.
+
+        :param route_name: The name of model for response
+        :param kind: The template kind, e.g. "success", "not_found", "unauthorized"
+        :param message: The default value of the message field
+        :param fields: Extra field definitions passed to ``create_model``
+        :return: The interned response model
+        """
+        key = (route_name, kind, message, tuple(fields.items()))
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+
+        if self.enabled and key is not None:
+            with self._lock:
+                cached = self._models.get(key)
+                if cached is not None:
+                    self._reused += 1
+                    return cached
+
+        model = create_model(route_name, message=(str, message), **fields)
+        with self._lock:
+            self._built += 1
+            if self.enabled and key is not None:
+                model = self._models.setdefault(key, model)
+        return model
+
+    def stats(self) -> ResponseRegistryStats:
+        """
+        Report how many models were built versus reused.
+
+        :return: The current registry counters
+        """
+        with self._lock:
+            return ResponseRegistryStats(
+                built=self._built, reused=self._reused, size=len(self._models)
+            )
+
+    def clear(self) -> None:
+        """
+        Drop every interned model and reset the counters.
+        """
+        with self._lock:
+            self._models.clear()
+            self._built = 0
+            self._reused = 0
+
+
+response_registry = ResponseRegistry()
 
 
 class ServiceResponse:
 
-    def __init__(self, model: Any, auth: bool = False) -> None:
+    def __init__(
+        self,
+        model: Any,
+        auth: bool = False,
+        registry: ResponseRegistry | None = None,
+    ) -> None:
         self.model = model
         self.auth = auth
+        self.registry = registry or response_registry
 
     def basic(self, route_name: str) -> dict:
         """
@@ -33,13 +130,12 @@ class ServiceResponse:
         """
         return {
             400: {
-                "model": create_model(route_name, message=(str, "Bad Request")),
+                "model": self.registry.model(route_name, "bad_request", "Bad Request"),
                 "description": "Occurs when the request you make does not match or is invalid",
             },
             500: {
-                "model": create_model(
-                    route_name,
-                    message=(str, "Internal Server Error"),
+                "model": self.registry.model(
+                    route_name, "error", "Internal Server Error"
                 ),
                 "description": "Occurs when there is an engine or lib error in the engine",
             },
@@ -70,15 +166,18 @@ class ServiceResponse:
         """
         response: dict = {
             200: {
-                "model": create_model(
+                "model": self.registry.model(
                     route_name,
-                    message=(str, "Success"),
+                    "success",
+                    "Success",
                     data=(model if model else self.model, ...),
                 ),
                 "description": "Success get data",
             },
             404: {
-                "model": create_model(route_name, message=(str, f"{obj} not found")),
+                "model": self.registry.model(
+                    route_name, "not_found", f"{obj} not found"
+                ),
             },
             **self.basic(route_name),
             **kwargs,
@@ -90,7 +189,9 @@ class ServiceResponse:
 
         if auth or self.auth:
             response[401] = {
-                "model": create_model(route_name, message=(str, "Unauthorized"))
+                "model": self.registry.model(
+                    route_name, "unauthorized", "Unauthorized"
+                )
             }
 
         return response
@@ -121,17 +222,80 @@ class ServiceResponse:
         """
         response: dict = {
             200: {
-                "model": create_model(
+                "model": self.registry.model(
                     route_name,
-                    message=(str, f"Success get all {obj}"),
+                    "pagination",
+                    f"Success get all {obj}",
                     data=(model if model else self.model, ...),
                     page=(int, 1),
                     size=(int, 10),
-                    total=(int, 10),
+                    total=(Optional[int], 10),
+                    count_strategy=(str, CountStrategy.exact.value),
+                    has_more=(Optional[bool], None),
                 ),
             },
             404: {
-                "model": create_model(route_name, message=(str, f"{obj} not found")),
+                "model": self.registry.model(
+                    route_name, "not_found", f"{obj} not found"
+                ),
+            },
+            **self.basic(route_name),
+            **kwargs,
+        }
+
+        if exclude_codes:
+            for code in exclude_codes:
+                del response[code]
+
+        if auth or self.auth:
+            response[401] = {
+                "model": self.registry.model(
+                    route_name, "unauthorized", "Unauthorized"
+                )
+            }
+
+        return response
+
+    def cursor_pagination(
+        self,
+        route_name: str,
+        model: Any = None,
+        obj: str = "Data",
+        auth: bool = False,
+        exclude_codes: list = [],
+        **kwargs,
+    ) -> dict:
+        """
+        Generate a keyset pagination response, which is a dictionary of common response codes and models.
+
+        Contains:
+        - 200 OK
+        - 404 Not Found
+        - 401 Unauthorized (optional)
+
+        :param route_name: The name of model for response
+        :param model: The model to use for the response
+        :param obj: The object to be gotten
+        :param auth: Whether or not the route requires authentication
+        :param exclude_codes: A list of codes to exclude from the response
+        :return: A dictionary of common response codes and models
+        """
+        response: dict = {
+            200: {
+                "model": self.registry.model(
+                    route_name,
+                    "cursor_pagination",
+                    f"Success get all {obj}",
+                    data=(model if model else self.model, ...),
+                    size=(int, 10),
+                    next_cursor=(Optional[str], None),
+                    prev_cursor=(Optional[str], None),
+                ),
+            },
+            404: {
+                "model": self.registry.model(
+                    route_name, "not_found", f"{obj} not found"
+                ),
             },
             **self.basic(route_name),
             **kwargs,
@@ -143,7 +307,9 @@ class ServiceResponse:
 
         if auth or self.auth:
             response[401] = {
-                "model": create_model(route_name, message=(str, "Unauthorized"))
+                "model": self.registry.model(
+                    route_name, "unauthorized", "Unauthorized"
+                )
             }
 
         return response
@@ -173,9 +339,10 @@ class ServiceResponse:
         """
         response: dict = {
             201: {
-                "model": create_model(
+                "model": self.registry.model(
                     route_name,
-                    message=(str, f"{obj} created successfully"),
+                    "creation",
+                    f"{obj} created successfully",
                     data=(model if model else self.model, ...),
                 ),
             },
@@ -189,7 +356,9 @@ class ServiceResponse:
 
         if auth or self.auth:
             response[401] = {
-                "model": create_model(route_name, message=(str, "Unauthorized"))
+                "model": self.registry.model(
+                    route_name, "unauthorized", "Unauthorized"
+                )
             }
 
         return response
@@ -219,9 +388,10 @@ class ServiceResponse:
         """
         response: dict = {
             200: {
-                "model": create_model(
+                "model": self.registry.model(
                     route_name,
-                    message=(str, f"{obj} updated successfully"),
+                    "update",
+                    f"{obj} updated successfully",
                     data=(model if model else self.model, ...),
                 ),
             },
@@ -235,7 +405,9 @@ class ServiceResponse:
 
         if auth or self.auth:
             response[401] = {
-                "model": create_model(route_name, message=(str, "Unauthorized"))
+                "model": self.registry.model(
+                    route_name, "unauthorized", "Unauthorized"
+                )
             }
 
         return response
@@ -267,9 +439,10 @@ class ServiceResponse:
         """
         response: dict = {
             200: {
-                "model": create_model(
+                "model": self.registry.model(
                     route_name,
-                    message=(str, f"{obj} delete successfully"),
+                    "delete",
+                    f"{obj} delete successfully",
                     data=(model if model else self.model, ...),
                 ),
             },
@@ -283,7 +456,9 @@ class ServiceResponse:
 
         if auth or self.auth:
             response[401] = {
-                "model": create_model(route_name, message=(str, "Unauthorized"))
+                "model": self.registry.model(
+                    route_name, "unauthorized", "Unauthorized"
+                )
             }
 
         return response
@@ -25,3 +25,17 @@ class FilterSchema(FilterValueSchema):
 
 class FilterOpsSchema(FilterSchema):
     filter_op: Optional[str] = Field(None, description="Filter operation")
+
+
+class FilterGroupSchema(BaseModel):
+    must: list[FilterOpsSchema] = Field(default=[], description="Filters that must all match")
+    mustnt: list[FilterOpsSchema] = Field(default=[], description="Filters that must not match")
+    should: list[FilterOpsSchema] = Field(default=[], description="Filters of which one must match")
+    shouldnt: list[FilterOpsSchema] = Field(
+        default=[], description="Filters that must not all match"
+    )
+
+
+class CursorPaginationSchema(BaseModel):
+    cursor: Optional[str] = Field(None, description="Opaque cursor of the page to fetch")
+    size: Optional[int] = Field(10, gt=0, description="Page size")
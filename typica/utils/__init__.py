@@ -1,2 +1,34 @@
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
 from .enums import *
-from .config import ProjectConfig
+
+if TYPE_CHECKING:
+    from . import config
+    from .config import ProjectConfig
+
+__all__ = [
+    "Enum",
+    "EnumV2",
+    "Operator",
+    "FilterOption",
+    "CountStrategy",
+    "LocationLevel",
+    "MedallionTypes",
+    "ProjectConfig",
+    "config",
+    "enums",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # ? pydantic_settings is only imported when the config is used
+    if name in ("ProjectConfig", "config"):
+        config = importlib.import_module(".config", __name__)
+        return config if name == "config" else config.ProjectConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
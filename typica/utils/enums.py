@@ -54,7 +54,7 @@ class Operator(EnumV2):
     include = ("in", "values that must exist")
     exclude = ("nin", "values that don't exist")
     exist = ("exist", "value is exist")
-    not_exist = ("exist", "value is exist")
+    not_exist = ("nexist", "value isn't exist")
 
 
 class FilterOption(EnumV2):
@@ -64,6 +64,13 @@ class FilterOption(EnumV2):
     shouldnt = ("shouldnt", "List of filter shouldn't exact")
 
 
+class CountStrategy(EnumV2):
+    exact = ("exact", "Exact count of the matching rows")
+    estimated = ("estimated", "Planner or storage estimate of the table size")
+    cached = ("cached", "Exact count reused for a while per filter")
+    has_more = ("has_more", "No total, only whether another page exists")
+
+
 class LocationLevel(EnumV2):
     CONTINENT = ("continent", "Continent level data")
     COUNTRY = ("country", "Country level data")
@@ -0,0 +1,29 @@
+import json
+import hashlib
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def normalize(value: Any) -> Any:
+    """
+    Turn pydantic models, nested in lists, tuples or dicts, into plain JSON values.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): normalize(item) for key, item in value.items()}
+    return value
+
+
+def key_digest(value: Any) -> str:
+    """
+    Return a digest of a value, equal for equal values, e.g. of a filter list.
+
+    Models are keyed by their values, see ``normalize``.
+    """
+    payload = json.dumps(normalize(value), sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
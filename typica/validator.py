@@ -0,0 +1,164 @@
+import re
+import hashlib
+import keyword
+import threading
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Iterable, Optional, Union
+from uuid import UUID
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter, create_model
+
+from .base import validate_many
+from .metadata import SchemaMeta, Schemas
+from .utils.lru import LRUCache
+
+# ? Python, SQL and ClickHouse type names, compared in lower case
+_TYPES: dict[str, Any] = {
+    **dict.fromkeys(["str", "string", "text", "varchar", "char", "fixedstring", "enum8", "enum16"], str),
+    **dict.fromkeys(
+        ["int", "integer", "bigint", "smallint", "int8", "int16", "int32", "int64",
+         "uint8", "uint16", "uint32", "uint64", "serial", "bigserial"],
+        int,
+    ),
+    **dict.fromkeys(["float", "double", "real", "float32", "float64", "double precision"], float),
+    **dict.fromkeys(["decimal", "numeric"], Decimal),
+    **dict.fromkeys(["bool", "boolean"], bool),
+    **dict.fromkeys(["datetime", "timestamp", "timestamptz", "datetime64"], datetime),
+    **dict.fromkeys(["date", "date32"], date),
+    "time": time,
+    "uuid": UUID,
+    **dict.fromkeys(["dict", "json", "jsonb", "object"], dict[str, Any]),
+    **dict.fromkeys(["list", "array"], list[Any]),
+}
+
+_WRAPPER = re.compile(r"^(nullable|lowcardinality)\((.*)\)$")
+_PARAMS = re.compile(r"\(.*\)$")
+
+_FIELDS = {"field_name", "field_type", "field_alias", "field_required", "field_hide"}
+
+
+def field_type(name: Optional[str]) -> Any:
+    """
+    Map a ``field_type`` to a Python type.
+
+    Wrappers such as ``Nullable(...)`` and parameters such as
+    ``varchar(255)`` are ignored, ``a|b`` becomes a union and unknown
+    names accept any value.
+
+    :param name: The type name.
+    :return: The Python type.
+    """
+    if not name:
+        return Any
+    types = []
+    for part in name.split("|"):
+        part = part.strip().lower()
+        while match := _WRAPPER.match(part):
+            part = match.group(2)
+        types.append(_TYPES.get(_PARAMS.sub("", part).strip(), Any))
+    if Any in types:
+        return Any
+    return types[0] if len(types) == 1 else Union[tuple(types)]
+
+
+def schema_fingerprint(schemas: Schemas) -> str:
+    """
+    Return a digest of the parts of a schema that shape its model.
+
+    Profiling statistics of ``SchemaRawMeta`` are not part of it.
+    """
+    payload = "\x1e".join(
+        SchemaMeta.model_validate(meta, from_attributes=True).model_dump_json(include=_FIELDS)
+        for meta in schemas
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _field(index: int, meta: SchemaMeta) -> tuple[str, tuple[Any, Any]]:
+    name = meta.field_name
+    attribute = name
+    if not name.isidentifier() or keyword.iskeyword(name) or name.startswith("_"):
+        attribute = f"field_{index}"
+
+    tp = field_type(meta.field_type)
+    kwargs: dict[str, Any] = {"exclude": bool(meta.field_hide)}
+    if meta.field_alias:
+        kwargs["alias"] = meta.field_alias
+    if attribute != name:
+        kwargs["validation_alias"] = (
+            AliasChoices(name, meta.field_alias) if meta.field_alias else name
+        )
+        kwargs["serialization_alias"] = meta.field_alias or name
+
+    if meta.field_required:
+        return attribute, (tp, Field(..., **kwargs))
+    return attribute, (Optional[tp], Field(None, **kwargs))
+
+
+def _row_model(name: str, fields: dict[str, Any]) -> type[BaseModel]:
+    """
+    Build the model of a compiled schema from its field definitions.
+    """
+    return create_model(name, __config__=ConfigDict(populate_by_name=True, extra="ignore"), **fields)
+
+
+class SchemaCompiler:
+    """
+    Compile ``Schemas`` into pydantic models, cached by fingerprint.
+
+    - ``field_name`` is the field, read from rows by name or alias.
+    - ``field_alias`` is the pydantic alias, used when dumping by alias.
+    - ``field_required`` makes the field required, otherwise it defaults to None.
+    - ``field_hide`` excludes the field from serialization.
+
+    Each entry keeps the model with its ``list[model]`` TypeAdapter, so an
+    evicted model is not held alive by the process-wide ``type_adapter`` cache.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.models: LRUCache[tuple[type[BaseModel], TypeAdapter]] = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def _compiled(self, schemas: Schemas, name: str) -> tuple[type[BaseModel], TypeAdapter]:
+        key = (schema_fingerprint(schemas), name)
+        entry = self.models.get(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            entry = self.models.get(key)
+            if entry is None:
+                model = _row_model(name, dict(_field(index, meta) for index, meta in enumerate(schemas)))
+                entry = (model, TypeAdapter(list[model]))  # type: ignore[valid-type]
+                self.models.set(key, entry)
+            return entry
+
+    def compile(self, schemas: Schemas, name: str = "Row") -> type[BaseModel]:
+        """
+        Return the model of a schema, building it on first use.
+
+        :param schemas: The schema.
+        :param name: The name of the model class.
+        :return: The model, shared by every equal schema.
+        """
+        return self._compiled(schemas, name)[0]
+
+    def validate(
+        self, schemas: Schemas, rows: Iterable[Any], chunk_size: int = 10_000
+    ) -> list[BaseModel]:
+        """
+        Validate rows against a schema, in chunks through the cached TypeAdapter.
+        """
+        model, adapter = self._compiled(schemas, "Row")
+        return validate_many(model, rows, chunk_size, adapter)
+
+    def dump(self, schemas: Schemas, rows: list[BaseModel]) -> list[dict[str, Any]]:
+        """
+        Serialize validated rows by alias, without the hidden fields.
+        """
+        _, adapter = self._compiled(schemas, "Row")
+        return adapter.dump_python(rows, by_alias=True)
+
+
+schema_compiler = SchemaCompiler()